@@ -0,0 +1,127 @@
+# encoding: utf-8
+
+"""
+Deterministic generator of synthetic documents for the benchmarks. The same
+arguments always produce the same content, so timings taken on different
+revisions compare like with like.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import random
+import struct
+import zlib
+
+from io import BytesIO
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.shared import Inches, Pt
+
+
+PARAGRAPH_STYLES = (
+    None, None, None, 'Heading 1', 'Heading 2', 'List Bullet', 'Quote'
+)
+WORDS = (
+    'invoice', 'number', 'party', 'agreement', 'shall', 'the', 'of', 'and',
+    'payment', 'term', 'clause', 'notice', 'provided', 'that', 'within',
+    'days', 'supplier', 'customer', 'liability', 'schedule',
+)
+
+
+def make_document(paragraphs=100, runs_per_paragraph=4, tables=1,
+                  table_rows=10, table_cols=4, images=1, styles=0, seed=0):
+    """
+    Return a new |Document| having *paragraphs* paragraphs of
+    *runs_per_paragraph* runs each, in a mix of paragraph styles and with
+    some bold and italic runs. *styles* custom paragraph styles are added
+    to the built-in ones, in chains of up to five each based on the one
+    before, and take their turn in the mix. *tables* tables of *table_rows*
+    by *table_cols* cells, each having its first two header cells merged,
+    and *images* pictures are spread evenly through the body.
+    """
+    rand = random.Random(seed)
+    document = Document()
+    paragraph_styles = PARAGRAPH_STYLES + _add_styles(document, styles)
+    table_every = paragraphs // tables + 1 if tables else None
+    image_every = paragraphs // images + 1 if images else None
+    png = png_blob(64, 48)
+
+    for idx in range(paragraphs):
+        paragraph = document.add_paragraph(
+            style=paragraph_styles[idx % len(paragraph_styles)]
+        )
+        for run_idx in range(runs_per_paragraph):
+            run = paragraph.add_run(_sentence(rand) + ' ')
+            run.bold = run_idx % 3 == 1 or None
+            run.italic = run_idx % 5 == 2 or None
+        if table_every and idx % table_every == table_every - 1:
+            _add_table(document, rand, table_rows, table_cols)
+        if image_every and idx % image_every == image_every - 1:
+            document.add_picture(BytesIO(png), width=Inches(1))
+    return document
+
+
+def make_docx_blob(styles=0, **kwargs):
+    """
+    Return the bytes of a ``.docx`` package produced by
+    :func:`make_document` called with *styles* custom paragraph styles and
+    *kwargs*.
+    """
+    stream = BytesIO()
+    make_document(styles=styles, **kwargs).save(stream)
+    return stream.getvalue()
+
+
+def png_blob(width, height):
+    """
+    Return the bytes of a *width* x *height* pixel grayscale PNG image.
+    """
+    def chunk(tag, data):
+        return (
+            struct.pack('>L', len(data)) + tag + data +
+            struct.pack('>L', zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    rows = b''.join(
+        b'\x00' + bytes(bytearray((x * y) % 256 for x in range(width)))
+        for y in range(height)
+    )
+    return (
+        b'\x89PNG\r\n\x1a\n' +
+        chunk(b'IHDR', struct.pack('>2L5B', width, height, 8, 0, 0, 0, 0)) +
+        chunk(b'IDAT', zlib.compress(rows)) +
+        chunk(b'IEND', b'')
+    )
+
+
+def _add_styles(document, count):
+    """
+    Return a tuple of the names of *count* paragraph styles added to
+    *document*, in chains of up to five each based on the one before it.
+    """
+    names = []
+    normal = base = document.styles['Normal']
+    for idx in range(count):
+        style = document.styles.add_style(
+            'Bench Style %d' % idx, WD_STYLE_TYPE.PARAGRAPH
+        )
+        style.base_style = base if idx % 5 else normal
+        style.font.size = Pt(9 + idx % 5)
+        style.font.bold = idx % 2 == 1 or None
+        names.append(style.name)
+        base = style
+    return tuple(names)
+
+
+def _add_table(document, rand, rows, cols):
+    table = document.add_table(rows, cols)
+    for row in table.rows:
+        for cell in row.cells:
+            cell.text = _sentence(rand, 3)
+    if cols > 1:
+        table.cell(0, 0).merge(table.cell(0, 1))
+
+
+def _sentence(rand, count=6):
+    return ' '.join(rand.choice(WORDS) for _ in range(count))
@@ -0,0 +1,291 @@
+# encoding: utf-8
+
+"""
+Benchmark suite timing the main document operations on generated documents
+of increasing size and reporting the best time and peak memory of each, so
+the scaling of each operation can be followed across revisions.
+
+Run from the repository root with ``python -m benchmarks.suite``; use
+``--help`` for the options, such as ``--sizes 100 1000 10000`` to set the
+paragraph counts and ``--json results.json`` to save the results.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import json
+import shutil
+import tempfile
+import timeit
+import tracemalloc
+
+from io import BytesIO
+
+from docx import Document, Template, compose, split
+from docx.enum.text import WD_COLOR_INDEX
+
+from .generator import make_docx_blob, png_blob
+
+
+def _open(blob):
+    return Document(BytesIO(blob))
+
+
+def _first_paragraph(blob, lazy):
+    with Document(BytesIO(blob), lazy=lazy) as document:
+        return document.paragraphs[0].text
+
+
+def _parsed(blob):
+    document = _open(blob)
+    document.parse()
+    return document
+
+
+def _add_pictures(document, png):
+    for _ in range(10):
+        document.add_picture(BytesIO(png))
+
+
+def _round_trip(document, compress_level=None):
+    stream = BytesIO()
+    document.save(stream, compress_level)
+    return Document(stream)
+
+
+def _round_trip_dir(document):
+    path = tempfile.mkdtemp()
+    try:
+        document.save(path)
+        return Document(path)
+    finally:
+        shutil.rmtree(path)
+
+
+def _cells(document):
+    for table in document.tables:
+        rows, cols = len(table.rows), len(table.columns)
+        for row_idx in range(rows):
+            for col_idx in range(cols):
+                table.cell(row_idx, col_idx)
+
+
+def _report_items(blob):
+    styles = (None, 'Heading 2', 'List Bullet')
+    return [
+        (paragraph.text, styles[idx % len(styles)])
+        for idx, paragraph in enumerate(_open(blob).paragraphs)
+    ]
+
+
+def _add_paragraph_each(items):
+    document = Document()
+    for text, style in items:
+        document.add_paragraph(text, style)
+
+
+def _styled(blob):
+    document = _open(blob)
+    paragraphs = document.paragraphs
+    runs = [run for paragraph in paragraphs for run in paragraph.runs]
+    return document.styles, paragraphs, runs
+
+
+def _set_paragraph_styles(styled):
+    names = ('Normal', 'Heading 1', 'Heading 2', 'List Bullet', 'Title')
+    for idx, paragraph in enumerate(styled[1]):
+        paragraph.style = names[idx % len(names)]
+
+
+def _set_run_styles(styled):
+    names = ('Emphasis', 'Strong', 'Subtle Reference')
+    for idx, run in enumerate(styled[2]):
+        run.style = names[idx % len(names)]
+
+
+def _look_up_styles(styled):
+    styles = styled[0]
+    for idx in range(len(styled[1])):
+        'Heading %d' % (idx % 9 + 1) in styles
+
+
+def _log_text(blob):
+    # tab- and newline-laden text as long as the package, like a log excerpt
+    line = (
+        '2016-05-04 12:00:01,123\tINFO\tworker-7\trequest handled in 12 ms,'
+        ' status=200 path=/api/v1/items?page=3\n'
+    )
+    return line * (len(blob) // len(line) + 1)
+
+
+def _set_run_text(text):
+    Document().add_paragraph().add_run().text = text
+
+
+def _letter_template(blob):
+    document = _open(blob)
+    document.paragraphs[0].insert_paragraph_before('Dear {{ name }},')
+    document.add_paragraph('Amount due: {{ amount }}')
+    stream = BytesIO()
+    document.save(stream)
+    template_blob = stream.getvalue()
+    return template_blob, Template(BytesIO(template_blob))
+
+
+_LETTER_CONTEXT = {'name': 'Ann Smith', 'amount': '1,024.00'}
+
+
+def _open_replace_save(letter_template):
+    document = Document(BytesIO(letter_template[0]))
+    for name, value in _LETTER_CONTEXT.items():
+        document.replace('{{ %s }}' % name, value, regex=False)
+    document.save(BytesIO())
+
+
+def _traverse(document):
+    proxies = []
+    for paragraph in document.paragraphs:
+        proxies.append(paragraph)
+        proxies.append(paragraph.paragraph_format)
+        for run in paragraph.runs:
+            proxies.append(run)
+            proxies.append(run.font)
+    for table in document.tables:
+        for row in table.rows:
+            proxies.append(row)
+            proxies.extend(row.cells)
+    return proxies
+
+
+#: Each benchmark is a (name, setup, run) triple. *setup* takes the package
+#: bytes of a generated document and returns the state passed to *run*,
+#: which is the timed part.
+BENCHMARKS = (
+    ('Package.open', lambda blob: blob, _open),
+    ('first paragraph', lambda blob: blob,
+     lambda blob: _first_paragraph(blob, lazy=False)),
+    ('first paragraph lazy', lambda blob: blob,
+     lambda blob: _first_paragraph(blob, lazy=True)),
+    ('Document.save', _open, lambda document: document.save(BytesIO())),
+    ('round trip zip', _open, _round_trip),
+    ('round trip stored', _open,
+     lambda document: _round_trip(document, compress_level=0)),
+    ('round trip dir', _open, _round_trip_dir),
+    ('Document.clone', _open, lambda document: document.clone()),
+    ('compose x10', lambda blob: [blob] * 10, compose),
+    ('split', lambda blob: blob, lambda blob: list(split(BytesIO(blob)))),
+    ('Paragraph.text', _open,
+     lambda document: [p.text for p in document.paragraphs]),
+    ('Document.iter_text', _open,
+     lambda document: list(document.iter_text())),
+    ('traverse proxies', _open, _traverse),
+    ('Table.cell', _open, _cells),
+    ('add_table x10', _open,
+     lambda document: [document.add_table(2, 2) for _ in range(10)]),
+    ('add_picture x10', _open,
+     lambda document: _add_pictures(document, png_blob(64, 48))),
+    ('add_paragraph each', _report_items, _add_paragraph_each),
+    ('add_paragraphs', _report_items,
+     lambda items: Document().add_paragraphs(items)),
+    ('add_paragraph(log)', _log_text,
+     lambda text: Document().add_paragraph(text)),
+    ('run.text = log', _log_text, _set_run_text),
+    ('add_paragraph(flat log)',
+     lambda blob: _log_text(blob).replace('\t', ' ').replace('\n', ' '),
+     lambda text: Document().add_paragraph(text)),
+    ('paragraph.style = name', _styled, _set_paragraph_styles),
+    ('run.style = name', _styled, _set_run_styles),
+    ('name in styles', _styled, _look_up_styles),
+    ('Document.parse', _open, lambda document: document.parse()),
+    ('highlight', _parsed,
+     lambda document: document.highlight(
+         [(0, 40), (200, 260)], WD_COLOR_INDEX.YELLOW
+     )),
+    ('letter open/replace/save', _letter_template, _open_replace_save),
+    ('letter Template.render', _letter_template,
+     lambda letter_template: letter_template[1].render(_LETTER_CONTEXT)),
+)
+
+
+def document_kwargs(size):
+    """
+    Return the generator arguments for a document of *size* paragraphs,
+    scaling its tables, images and custom styles with it.
+    """
+    return dict(
+        paragraphs=size, runs_per_paragraph=4, tables=max(1, size // 100),
+        table_rows=10, table_cols=4, images=max(1, size // 500),
+        styles=max(1, size // 100), seed=size,
+    )
+
+
+def measure(setup, run, blob, repeat):
+    """
+    Return the best of *repeat* timings of *run*, each on fresh state from
+    *setup*, and the peak memory in bytes allocated by one more call.
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup(blob)
+        times.append(timeit.timeit(lambda: run(state), number=1))
+    state = setup(blob)
+    tracemalloc.start()
+    try:
+        run(state)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return min(times), peak
+
+
+def run_suite(sizes, repeat=3, names=None):
+    """
+    Generate a result dict for each benchmark, optionally limited to those
+    in *names*, at each document size in *sizes*.
+    """
+    for size in sizes:
+        blob = make_docx_blob(**document_kwargs(size))
+        for name, setup, run in BENCHMARKS:
+            if names and name not in names:
+                continue
+            seconds, peak = measure(setup, run, blob, repeat)
+            yield {
+                'benchmark': name, 'size': size, 'seconds': seconds,
+                'peak_bytes': peak, 'package_bytes': len(blob),
+            }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[100, 1000],
+        help='document sizes in paragraphs (default: 100 1000)'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='timings taken of each benchmark, the best reported'
+    )
+    parser.add_argument(
+        '--bench', action='append', metavar='NAME',
+        help='run only the named benchmark; may be repeated'
+    )
+    parser.add_argument(
+        '--json', metavar='PATH', help='also write the results to PATH'
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    print('%-26s %8s %10s %12s' % ('benchmark', 'size', 'seconds', 'peak MiB'))
+    for result in run_suite(args.sizes, args.repeat, args.bench):
+        results.append(result)
+        print('%-26s %8d %10.4f %12.2f' % (
+            result['benchmark'], result['size'], result['seconds'],
+            result['peak_bytes'] / 1048576.0
+        ))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -99,6 +99,12 @@ rst_epilog = """
 
 .. |docx| replace:: ``python-docx``
 
+.. |EffectiveFont| replace:: :class:`.EffectiveFont`
+
+.. |EffectiveFormatResolver| replace:: :class:`.EffectiveFormatResolver`
+
+.. |EffectiveParagraphFormat| replace:: :class:`.EffectiveParagraphFormat`
+
 .. |Emu| replace:: :class:`.Emu`
 
 .. |False| replace:: :class:`False`
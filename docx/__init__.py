@@ -1,10 +1,48 @@
 # encoding: utf-8
 
-from docx.api import Document  # noqa
+import importlib
+import sys
+
+from docx.api import Document, read_core_properties  # noqa
 
 __version__ = '0.8.9.1'
 
 
+# the names of _lazy_names are imported on first access so that importing
+# docx does not also import the modules they are built on, such as
+# multiprocessing; module __getattr__() needs Python 3.7, earlier Pythons
+# import them all here
+
+_lazy_names = {
+    'Template': 'docx.template',
+    'compose': 'docx.composer',
+    'extract_many': 'docx.batch',
+    'split': 'docx.splitter',
+}
+if sys.version_info >= (3, 5):
+    _lazy_names['open_async'] = 'docx.aio'
+
+
+def __getattr__(name):
+    if name not in _lazy_names:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name)
+        )
+    value = getattr(importlib.import_module(_lazy_names[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
+
+
+if sys.version_info < (3, 7):
+    for _name in _lazy_names:
+        __getattr__(_name)
+    del _name
+
+
 # register custom Part classes with opc package reader
 
 from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
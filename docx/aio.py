@@ -0,0 +1,134 @@
+# encoding: utf-8
+
+"""
+Opening and saving documents from asyncio code. The blocking work, reading
+and parsing a package on open and serializing and compressing it on save,
+runs on an executor so the event loop stays responsive. Requires Python 3.5
+or later.
+"""
+
+import asyncio
+import inspect
+
+from .api import Document
+from .opc.tracing import get_tracer, using
+
+
+async def open_async(docx=None, executor=None, semaphore=None, tracer=None):
+    """
+    Return a |Document| loaded from *docx* without blocking the event loop.
+    *docx* is anything :func:`docx.Document` accepts or an asynchronous
+    file-like object whose ``read()`` is a coroutine, such as an aiohttp
+    request body or an aiofiles file, which is read to the end first. The
+    package is loaded on *executor*, the default executor of the loop when
+    |None|. When an :class:`asyncio.Semaphore` is given as *semaphore*, it
+    is held while the package is loaded, bounding how many documents are
+    loaded at once.
+
+    The timing of opening the package is reported to *tracer*, or when
+    |None|, to the tracer installed for the calling thread. Coroutines
+    sharing the thread of the loop also share its tracer, so pass one to
+    each call to time documents opened concurrently apart.
+    """
+    tracer = get_tracer() if tracer is None else tracer
+    if asyncio.iscoroutinefunction(getattr(docx, 'read', None)):
+        docx = await docx.read()
+    return await _run(executor, semaphore, tracer, Document, docx)
+
+
+async def save_async(document, dest, compress_level=None,
+                     stored_content_types=None, executor=None,
+                     semaphore=None, tracer=None):
+    """
+    Save *document* to *dest* without blocking the event loop. *dest* is
+    a path or file-like object, to which the document is saved on
+    *executor*, or an asynchronous sink: an object whose ``write()`` is
+    a coroutine, such as an aiohttp response or an aiofiles file, or whose
+    ``drain()`` is, such as an :class:`asyncio.StreamWriter`. The package is
+    then serialized and compressed a part at a time on *executor*, each
+    chunk written to the sink on the loop as it is ready. *compress_level*
+    and *stored_content_types* behave as for :meth:`Document.save`.
+    *semaphore* is held while the document is saved and *tracer* receives
+    its timing, as for :func:`open_async`.
+    """
+    tracer = get_tracer() if tracer is None else tracer
+    if not _is_async_sink(dest):
+        await _run(
+            executor, semaphore, tracer, document.save, dest,
+            compress_level, stored_content_types
+        )
+        return
+    if semaphore is None:
+        await _write_chunks(
+            document, dest, compress_level, stored_content_types, executor,
+            tracer
+        )
+        return
+    async with semaphore:
+        await _write_chunks(
+            document, dest, compress_level, stored_content_types, executor,
+            tracer
+        )
+
+
+def _is_async_sink(dest):
+    """
+    |True| if *dest* is written to with coroutines.
+    """
+    return (
+        asyncio.iscoroutinefunction(getattr(dest, 'write', None)) or
+        asyncio.iscoroutinefunction(getattr(dest, 'drain', None))
+    )
+
+
+def _call_traced(tracer, func, *args):
+    """
+    Return the result of calling *func* with *args*, *tracer* installed for
+    the executor thread it runs on.
+    """
+    with using(tracer):
+        return func(*args)
+
+
+async def _run(executor, semaphore, tracer, func, *args):
+    """
+    Return the result of calling *func* with *args* on *executor*, holding
+    *semaphore* while it runs if it is not |None| and reporting its timing
+    to *tracer*.
+    """
+    loop = asyncio.get_event_loop()
+    if semaphore is None:
+        return await loop.run_in_executor(
+            executor, _call_traced, tracer, func, *args
+        )
+    async with semaphore:
+        return await loop.run_in_executor(
+            executor, _call_traced, tracer, func, *args
+        )
+
+
+async def _write_chunks(document, sink, compress_level, stored_content_types,
+                        executor, tracer):
+    """
+    Write the package of *document* to the asynchronous *sink*, producing
+    each chunk on *executor* with its timing reported to *tracer*.
+    """
+    loop = asyncio.get_event_loop()
+    chunks = await loop.run_in_executor(
+        executor, document.iter_save_chunks, compress_level,
+        stored_content_types
+    )
+    drain = getattr(sink, 'drain', None)
+    while True:
+        chunk = await loop.run_in_executor(
+            executor, _call_traced, tracer, next, chunks, None
+        )
+        if chunk is None:
+            break
+        if not chunk:
+            continue
+        written = sink.write(chunk)
+        if inspect.isawaitable(written):
+            await written
+        elif drain is not None:
+            await drain()
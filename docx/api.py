@@ -10,25 +10,70 @@ from __future__ import absolute_import, division, print_function
 
 import os
 
-from docx.opc.constants import CONTENT_TYPE as CT
+from docx.compat import is_string
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.coreprops import CoreProperties
+from docx.opc.pkgreader import PackageReader
+from docx.opc.tracing import using
+from docx.oxml import parse_xml
 from docx.package import Package
 
 
-def Document(docx=None):
+def Document(docx=None, lazy=False, load=None, tracer=None):
     """
     Return a |Document| object loaded from *docx*, where *docx* can be
-    either a path to a ``.docx`` file (a string) or a file-like object. If
-    *docx* is missing or ``None``, the built-in default document "template"
-    is loaded.
+    either a path to a ``.docx`` file (a string), a file-like object or
+    a buffer holding the package, such as bytes, a memoryview or an mmap,
+    which is read in place without being copied. If *docx* is missing or
+    ``None``, the built-in default document "template" is loaded.
+
+    When *lazy* is |True|, only the relationships between the parts of the
+    package are read on opening; each part, such as an image or a header,
+    is read and parsed when first needed. *docx* is kept open for that
+    until the document is closed or saved, so use the document in a
+    ``with`` block or call :meth:`.Document.close` when done::
+
+        with Document('manual.docx', lazy=True) as document:
+            first = document.paragraphs[0].text
+
+    *load* selects the parts loaded, by the name of a profile such as
+    ``'no-media'``, ``'text'`` or ``'metadata'``, or a |LoadProfile|; see
+    :data:`docx.opc.profile.LOAD_PROFILES`. The parts a profile skips are
+    passed through unparsed when the document is saved, read from *docx*,
+    which is kept open for them as for *lazy*.
+
+    When *tracer* is a |Tracer|, such as a |TimingCollector|, it receives
+    the timing of each phase of opening this package, and only this
+    package, in place of the tracer installed for the thread.
     """
     docx = _default_docx_path() if docx is None else docx
-    document_part = Package.open(docx).main_document_part
+    with using(tracer):
+        package = Package.open(docx, lazy, load)
+    document_part = package.main_document_part
     if document_part.content_type != CT.WML_DOCUMENT_MAIN:
+        package.close()
         tmpl = "file '%s' is not a Word file, content type is '%s'"
-        raise ValueError(tmpl % (docx, document_part.content_type))
+        source = docx if is_string(docx) else type(docx).__name__
+        raise ValueError(tmpl % (source, document_part.content_type))
     return document_part.document
 
 
+def read_core_properties(docx):
+    """
+    Return a |CoreProperties| object holding the core properties, such as
+    the title and author, of the package *docx*, a path, file-like object or
+    buffer as accepted by :func:`Document`. Only the package relationships
+    and the core properties part are read, so this is much faster than
+    opening the document. Changes made to the properties are not saved.
+    Returns |None| when the package has no core properties part.
+    """
+    blobs = PackageReader.package_part_blobs(docx, (RT.CORE_PROPERTIES,))
+    blob = blobs.get(RT.CORE_PROPERTIES)
+    if blob is None:
+        return None
+    return CoreProperties(parse_xml(blob))
+
+
 def _default_docx_path():
     """
     Return the path to the built-in default .docx package.
@@ -0,0 +1,241 @@
+# encoding: utf-8
+
+"""
+Drivers that render or read many documents on a pool of worker processes.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import time
+import traceback
+
+from collections import deque
+from multiprocessing import Pool
+
+from .compat import BytesIO, is_string
+from .document import Document
+from .opc.constants import RELATIONSHIP_TYPE as RT
+from .opc.coreprops import CoreProperties
+from .opc.pkgreader import PackageReader
+from .oxml import parse_xml
+from .template import Template
+
+
+#: Names of the |CoreProperties| values reported by :func:`extract_many`.
+CORE_PROPERTY_NAMES = (
+    'author', 'category', 'comments', 'content_status', 'created',
+    'identifier', 'keywords', 'language', 'last_modified_by',
+    'last_printed', 'modified', 'revision', 'subject', 'title', 'version',
+)
+
+#: Names of the fields :func:`extract_many` can extract.
+EXTRACT_FIELDS = ('text', 'tables', 'core_properties')
+
+
+class BatchResult(object):
+    """
+    Outcome of one item of a batch job. `index` is the position of the item
+    in the input and `item` identifies it, such as the path it was read
+    from or written to. `value` is the result when the item succeeded and
+    `error` the formatted traceback when it raised, |None| otherwise.
+    `seconds` is the time the worker spent on the item.
+    """
+
+    __slots__ = ('index', 'item', 'value', 'error', 'seconds')
+
+    def __init__(self, index, item, value, error, seconds):
+        self.index = index
+        self.item = item
+        self.value = value
+        self.error = error
+        self.seconds = seconds
+
+    @property
+    def ok(self):
+        """
+        |True| if the item completed without raising an exception.
+        """
+        return self.error is None
+
+
+def extract_many(paths, workers=None, chunksize=8,
+                 fields=('text', 'core_properties')):
+    """
+    Generate a |BatchResult| for each ``.docx`` file in *paths*, in order,
+    as soon as it and those before it are read. Files are read on *workers*
+    processes, the CPU count when |None|, each worker being sent
+    *chunksize* paths at a time. The `value` of a result is a dict having
+    an item for each name in *fields*, any of :attr:`EXTRACT_FIELDS`:
+
+    ``'text'``
+        the text of each paragraph, as from :meth:`Document.iter_text`
+    ``'tables'``
+        each table in the body as a list of rows, each a list of the text
+        of its cells; a cell merged across columns appears once in its row,
+        while a cell merged down rows appears in each of them, its text in
+        the first and ``''`` in the rest
+    ``'core_properties'``
+        a dict of the core properties, each |None| when the package has no
+        core properties part
+
+    Only the parts these fields come from are read and parsed, not the
+    whole package, and the values are plain Python objects.
+    """
+    fields = tuple(fields)
+    for field in fields:
+        if field not in EXTRACT_FIELDS:
+            raise ValueError('unknown extract field %r' % (field,))
+    return _iter_results(
+        _extract, paths, lambda path: path, workers, chunksize,
+        _init_extract_worker, (fields,)
+    )
+
+
+def render_many(template, jobs, workers=None, chunksize=1):
+    """
+    Generate a |BatchResult| for each ``(dest, context)`` pair in *jobs*, in
+    order, as soon as it and those before it are rendered from *template*,
+    a path, file-like object or bytes of a ``.docx`` file having
+    ``{{placeholders}}`` as described for |Template|. The template bytes are
+    sent to each of the *workers* processes once, where the template is
+    compiled a single time. A rendered package is saved to the path *dest*,
+    which is then the result `value`, or when *dest* is |None|, its bytes
+    are the `value`.
+    """
+    return _iter_results(
+        _render, jobs, lambda job: job[0], workers, chunksize,
+        _init_render_worker, (_read_blob(template),)
+    )
+
+
+def _extract(path):
+    """
+    Return a dict of the fields extracted by this worker process from the
+    document at *path*.
+    """
+    fields = _worker_fields
+    reltypes = [RT.CORE_PROPERTIES] if 'core_properties' in fields else []
+    if 'text' in fields or 'tables' in fields:
+        reltypes.append(RT.OFFICE_DOCUMENT)
+    blobs = PackageReader.package_part_blobs(path, reltypes)
+
+    value = {}
+    if RT.OFFICE_DOCUMENT in reltypes:
+        document = Document(parse_xml(blobs[RT.OFFICE_DOCUMENT]), None)
+        if 'text' in fields:
+            value['text'] = list(document.iter_text())
+        if 'tables' in fields:
+            value['tables'] = [
+                _table_rows(tbl) for tbl in document.element.body.tbl_lst
+            ]
+    if 'core_properties' in fields:
+        core_blob = blobs.get(RT.CORE_PROPERTIES)
+        core_properties = (
+            None if core_blob is None
+            else CoreProperties(parse_xml(core_blob))
+        )
+        value['core_properties'] = dict(
+            (name, getattr(core_properties, name, None))
+            for name in CORE_PROPERTY_NAMES
+        )
+    return value
+
+
+def _init_extract_worker(fields):
+    """
+    Set the fields extracted by the jobs of this worker process.
+    """
+    global _worker_fields
+    _worker_fields = fields
+
+
+def _init_render_worker(template_blob):
+    """
+    Compile the template rendered by the jobs of this worker process.
+    """
+    global _worker_template
+    _worker_template = Template(BytesIO(template_blob))
+
+
+def _iter_results(func, items, item_id, workers, chunksize,
+                  initializer=None, initargs=()):
+    """
+    Generate a |BatchResult| for each item in *items*, in order, from
+    calling *func* with it on a pool of *workers* processes. The `item` of
+    each result is ``item_id(item)``, recorded as the item is handed to the
+    pool, so only items and values cross between processes.
+    """
+    item_ids = deque()
+
+    def iter_calls():
+        for item in items:
+            item_ids.append(item_id(item))
+            yield func, item
+
+    pool = Pool(workers, initializer, initargs)
+    try:
+        calls = pool.imap(_timed_call, iter_calls(), chunksize)
+        for index, (value, error, seconds) in enumerate(calls):
+            yield BatchResult(
+                index, item_ids.popleft(), value, error, seconds
+            )
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _read_blob(docx):
+    """
+    Return the bytes of *docx*, a path, a file-like object or bytes.
+    """
+    if is_string(docx):
+        with open(docx, 'rb') as f:
+            return f.read()
+    if isinstance(docx, bytes):
+        return docx
+    return docx.read()
+
+
+def _render(job):
+    """
+    Render the context of *job* from the template of this worker process.
+    """
+    dest, context = job
+    if dest is None:
+        return _worker_template.render(context)
+    _worker_template.save(dest, context)
+    return dest
+
+
+def _table_rows(tbl):
+    """
+    Return the text of the cells of the `w:tbl` element *tbl* as a list of
+    rows, each a list of cell text having an item for each `w:tc` element
+    of the row. The `w:tc` element continuing a vertically merged cell has
+    no text of its own, so it contributes ``''``.
+    """
+    return [
+        ['\n'.join(p.text for p in tc.p_lst) for tc in tr.tc_lst]
+        for tr in tbl.tr_lst
+    ]
+
+
+def _timed_call(func_and_item):
+    """
+    Return a ``(value, error, seconds)`` tuple from calling *func* with
+    *item*, *error* being the formatted traceback when it raises.
+    """
+    func, item = func_and_item
+    start = time.time()
+    try:
+        value, error = func(item), None
+    except Exception:
+        value, error = None, traceback.format_exc()
+    return value, error, time.time() - start
+
+
+_worker_fields = None
+_worker_template = None
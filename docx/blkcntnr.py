@@ -8,9 +8,14 @@ ones like structured document tags.
 
 from __future__ import absolute_import, print_function
 
+from .compat import is_string
+from .enum.style import WD_STYLE_TYPE
+from .oxml.ns import qn
 from .oxml.table import CT_Tbl
+from .oxml.text.paragraph import CT_P
 from .shared import Parented
 from .text.paragraph import Paragraph
+from .text.search import iter_matches, replace
 
 
 class BlockItemContainer(Parented):
@@ -20,6 +25,9 @@ class BlockItemContainer(Parented):
     Provides the shared functionality to add a block item like a paragraph or
     table.
     """
+
+    __slots__ = ('_element',)
+
     def __init__(self, element, parent):
         super(BlockItemContainer, self).__init__(parent)
         self._element = element
@@ -38,6 +46,37 @@ class BlockItemContainer(Parented):
             paragraph.style = style
         return paragraph
 
+    def add_paragraphs(self, paragraphs):
+        """
+        Return a list of paragraphs newly added to the end of the content in
+        this container, one for each item in the iterable *paragraphs*. An
+        item is either the text of the paragraph or a (text, style) pair,
+        where *text* and *style* are as for :meth:`add_paragraph`. Each
+        distinct style name is resolved only once and the new paragraphs are
+        inserted together in a single operation, making this much faster
+        than calling :meth:`add_paragraph` for each one when adding many
+        paragraphs.
+        """
+        style_ids = {}
+
+        def style_id_of(style):
+            if style is not None and not is_string(style):
+                return self.part.get_style_id(style, WD_STYLE_TYPE.PARAGRAPH)
+            if style not in style_ids:
+                style_ids[style] = (
+                    None if style is None else
+                    self.part.get_style_id(style, WD_STYLE_TYPE.PARAGRAPH)
+                )
+            return style_ids[style]
+
+        p_lst = []
+        for item in paragraphs:
+            text, style = (item, None) if is_string(item) else item
+            p_lst.append(CT_P.new_p(text, style_id_of(style)))
+
+        self._insert_p_lst(p_lst)
+        return [Paragraph(p, self) for p in p_lst]
+
     def add_table(self, rows, cols, width):
         """
         Return a table of *width* having *rows* rows and *cols* columns,
@@ -49,6 +88,16 @@ class BlockItemContainer(Parented):
         self._element._insert_tbl(tbl)
         return Table(tbl, self)
 
+    def iter_text(self):
+        """
+        Generate the text of each paragraph in this container in document
+        order, descending into the cells of its tables, row by row. Each
+        item is the same as the `text` of the corresponding |Paragraph|, but
+        no proxy objects are created, which makes this the fast way to
+        extract the text of a large document.
+        """
+        return _iter_paragraph_text(self._element)
+
     @property
     def paragraphs(self):
         """
@@ -57,6 +106,33 @@ class BlockItemContainer(Parented):
         """
         return [Paragraph(p, self) for p in self._element.p_lst]
 
+    def replace(self, pattern, repl, regex=True):
+        """
+        Replace each match of *pattern* in the text of the paragraphs in
+        this container, including those in table cells, with *repl*. Return
+        the number of replacements made. A match can span several runs; the
+        replacement takes on the formatting of the first of them and only
+        the runs a match touches are rewritten. *pattern* is a regular
+        expression, either a string or compiled, unless *regex* is |False|,
+        in which case it and *repl* are used literally. Otherwise *repl* can
+        contain backreferences like ``\\1`` or be a function, as for
+        :func:`re.sub`.
+        """
+        return replace(self._iter_paragraph_items(), pattern, repl, regex)
+
+    def search(self, pattern, regex=True):
+        """
+        Return a list of |TextMatch| objects, one for each match of
+        *pattern* in the text of the paragraphs in this container, in
+        document order and including those in table cells. A match can span
+        several runs; each match provides the run-level spans it is drawn
+        from. *pattern* is as for :meth:`replace`. Empty matches, such as
+        those of ``'x*'`` between the characters of a paragraph, are skipped.
+        """
+        return list(
+            iter_matches(self._iter_paragraph_items(), pattern, regex)
+        )
+
     @property
     def tables(self):
         """
@@ -66,9 +142,58 @@ class BlockItemContainer(Parented):
         from .table import Table
         return [Table(tbl, self) for tbl in self._element.tbl_lst]
 
+    def _iter_paragraph_items(self):
+        """
+        Generate a ``(p, parent)`` pair for each ``<w:p>`` element in this
+        container in document order, descending into table cells, where
+        *parent* is the proxy for the container of *p*.
+        """
+        from .table import _Cell, Table
+        tbl_tag, tr_tag, tc_tag = qn('w:tbl'), qn('w:tr'), qn('w:tc')
+        for child in self._element.iterchildren(qn('w:p'), tbl_tag):
+            if child.tag != tbl_tag:
+                yield child, self
+                continue
+            table = Table(child, self)
+            for tr in child.iterchildren(tr_tag):
+                for tc in tr.iterchildren(tc_tag):
+                    for item in _Cell(tc, table)._iter_paragraph_items():
+                        yield item
+
+    def _insert_p_lst(self, p_lst):
+        """
+        Insert the ``<w:p>`` elements in *p_lst* in sequence where
+        a paragraph added to this container belongs. Only the first is
+        placed by a schema-aware insert, locating any successor such as the
+        sentinel ``<w:sectPr>`` once; the rest are spliced in after it in
+        one step.
+        """
+        if not p_lst:
+            return
+        element = self._element
+        first_p = element._insert_p(p_lst[0])
+        idx = element.index(first_p) + 1
+        element[idx:idx] = p_lst[1:]
+
     def _add_paragraph(self):
         """
         Return a paragraph newly added to the end of the content in this
         container.
         """
         return Paragraph(self._element.add_p(), self)
+
+
+def _iter_paragraph_text(block_parent):
+    """
+    Generate the text of each ``<w:p>`` element in *block_parent*, including
+    those in the cells of ``<w:tbl>`` children, in document order.
+    """
+    p_tag, tbl_tag = qn('w:p'), qn('w:tbl')
+    for child in block_parent.iterchildren(p_tag, tbl_tag):
+        if child.tag == p_tag:
+            yield child.text
+            continue
+        for tr in child.iterchildren(qn('w:tr')):
+            for tc in tr.iterchildren(qn('w:tc')):
+                for text in _iter_paragraph_text(tc):
+                    yield text
@@ -0,0 +1,644 @@
+# encoding: utf-8
+
+"""
+|Composer| object and :func:`compose`, appending the body content of many
+documents to one, carrying along the styles, numbering definitions, images
+and other parts the content references.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import copy
+import re
+
+from lxml import etree
+
+from .api import Document
+from .document import Document as DocumentObject
+from .opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from .opc.packuri import PackURI
+from .opc.part import Part, XmlPart
+from .oxml.ns import nsmap, qn
+from .parts.image import ImagePart
+from .shared import lazyproperty
+
+
+#: Tags of the elements whose ``w:val`` is the id of a style.
+_STYLE_REF_TAGS = frozenset(qn(tag) for tag in (
+    'w:basedOn', 'w:link', 'w:next', 'w:numStyleLink', 'w:pStyle',
+    'w:rStyle', 'w:styleLink', 'w:tblStyle',
+))
+
+#: Tags of the elements referring to a note or comment of the document by
+#: id, which are not carried over.
+_NOTE_REF_TAGS = frozenset(qn(tag) for tag in (
+    'w:commentRangeEnd', 'w:commentRangeStart', 'w:commentReference',
+    'w:endnoteReference', 'w:footnoteReference',
+))
+
+#: Content types of the header and footer parts, whose references are
+#: remapped when copied.
+_HDRFTR_CONTENT_TYPES = frozenset((CT.WML_FOOTER, CT.WML_HEADER))
+
+_refs = etree.XPath(
+    './/w:basedOn | .//w:link | .//w:next | .//w:numStyleLink | '
+    './/w:pStyle | .//w:rStyle | .//w:styleLink | .//w:tblStyle | '
+    './/w:numPr/w:numId | .//wp:docPr | .//w:bookmarkStart | '
+    './/w:bookmarkEnd | .//w:commentRangeEnd | .//w:commentRangeStart | '
+    './/w:commentReference | .//w:endnoteReference | '
+    './/w:footnoteReference',
+    namespaces=nsmap
+)
+_rel_attrs = etree.XPath(
+    'descendant-or-self::*/@*[namespace-uri()=$ns]', namespaces=nsmap
+)
+_docPr_ids = etree.XPath('//wp:docPr/@id', namespaces=nsmap)
+_bookmark_ids = etree.XPath('//w:bookmarkStart/@w:id', namespaces=nsmap)
+
+_PARTNAME = re.compile(r'^(.*?)(\d*)(\.[^./]*)?$')
+
+_DOCPR = qn('wp:docPr')
+_NUM_ID = qn('w:numId')
+_SECTPR = qn('w:sectPr')
+_VAL = qn('w:val')
+_W_ID = qn('w:id')
+
+
+def compose(documents, into=None):
+    """
+    Return *into*, a |Document|, after appending to its body the body
+    content of each document in *documents*, in order. Each item of
+    *documents* is a |Document| or anything :func:`docx.Document` accepts,
+    such as a path, which is then opened only while its content is
+    appended, so *documents* can be a generator producing thousands of
+    them. When *into* is |None|, the first of *documents* receives the
+    content of the rest. See |Composer| for how the content is merged.
+    """
+    documents = iter(documents)
+    if into is None:
+        try:
+            into = next(documents)
+        except StopIteration:
+            raise ValueError('no documents to compose')
+        if not isinstance(into, DocumentObject):
+            into = Document(into)
+    composer = Composer(into)
+    for document in documents:
+        composer.append(document)
+    return into
+
+
+class Composer(object):
+    """
+    Appends the body content of other documents to *document*, in time
+    linear in the size of the content appended.
+
+    The styles, numbering, images and relationships of *document* are
+    indexed once, so the references in the appended content are remapped
+    with dictionary lookups rather than by searching the XML. A style is
+    matched by style id, then by name, the style of *document* winning as
+    when pasting in Word; a style it lacks is copied in along with the
+    styles it is based on. Abstract numbering definitions and images are
+    deduplicated by their content, so a list definition or picture shared
+    by many appended documents is stored once; a list of an appended
+    document still restarts where it did in that document. The drawing
+    ids and bookmark ids of the appended content are renumbered to stay
+    unique. Headers, footers and other parts referenced from the content
+    are copied with new partnames.
+
+    The section properties ending the body of an appended document are
+    dropped, so its content takes on the page setup of *document*.
+    Footnotes, endnotes and comments are not carried over, the references
+    to them in the appended content being removed. *document*
+    should not be changed by other means while a composer is in use.
+    """
+    def __init__(self, document):
+        super(Composer, self).__init__()
+        part = document.part
+        self._part = part
+        self._package = part.package
+        body = document.element.body
+        self._body = body
+        self._sectPr = body.sectPr
+        self._next_docPr_id = _max_int(_docPr_ids(body)) + 1
+        self._next_bookmark_id = _max_int(_bookmark_ids(body)) + 1
+
+        rels = part.rels
+        self._rIds = dict(
+            (_rel_key(rel), rId) for rId, rel in rels.items()
+        )
+        self._rId_count = len(rels)
+
+        self._partnames = set(p.partname for p in self._package.iter_parts())
+        self._partname_idxs = {}
+        self._deferred_copies = []
+
+        styles_part = part._styles_part
+        self._styles = styles_part.element
+        self._style_index = styles_part.style_index
+        self._style_ids = set()
+        self._style_ids_by_name = {}
+        for style in self._styles.style_lst:
+            self._index_style(style)
+
+    def append(self, document):
+        """
+        Append the body content of *document*, a |Document| or anything
+        :func:`docx.Document` accepts, such as a path. A |Document| is left
+        unchanged; any other *document* is opened for the duration of the
+        call, only the parts its content references being read.
+        """
+        if isinstance(document, DocumentObject):
+            body = document.element.body
+            self.append_elements(
+                document.part, [copy.deepcopy(elm) for elm in _content(body)]
+            )
+            return
+        with Document(document, lazy=True) as document:
+            body = document.element.body
+            self.append_elements(document.part, list(_content(body)))
+            self._load_deferred_copies()
+
+    def append_elements(self, source_part, elements):
+        """
+        Append *elements*, block-level elements such as `w:p` and `w:tbl`
+        from the document part *source_part*, to the body after remapping
+        the styles, numbering, relationships and ids they reference. The
+        elements are moved, not copied, into the body. A `w:sectPr` element
+        among them replaces the section properties closing the body.
+        """
+        source = _Source(source_part, self._next_bookmark_id)
+        body, sectPr = self._body, self._sectPr
+        for element in elements:
+            self._import(element, source, True)
+            if element.tag == _SECTPR:
+                if sectPr is None:
+                    body.append(element)
+                else:
+                    body.replace(sectPr, element)
+                self._sectPr = sectPr = element
+            elif sectPr is None:
+                body.append(element)
+            else:
+                sectPr.addprevious(element)
+
+    def copy_related_part(self, source_part, reltype):
+        """
+        Relate the document part by *reltype* to a copy of the part that
+        *source_part*, the document part of another document, is related
+        to by *reltype*, such as its settings or theme part, along with the
+        parts it relates to. Does nothing when *source_part* has no such
+        relationship.
+        """
+        try:
+            part = source_part.part_related_by(reltype)
+        except KeyError:
+            return
+        source = _Source(source_part, self._next_bookmark_id)
+        self._add_rel(reltype, self._import_part(part, source), False)
+
+    @lazyproperty
+    def _numbering(self):
+        """
+        |_Numbering| for the numbering part of the document, created when
+        first needed.
+        """
+        return _Numbering(self._part.numbering_part.element)
+
+    def _add_rel(self, reltype, target, is_external):
+        """
+        Return the rId of the relationship of *reltype* from the document
+        part to *target*, added if not already present.
+        """
+        key = (reltype, target, is_external)
+        rId = self._rIds.get(key)
+        if rId is not None:
+            return rId
+        rels = self._part.rels
+        while True:
+            self._rId_count += 1
+            rId = 'rId%d' % self._rId_count
+            if rId not in rels:
+                break
+        rels.add_relationship(reltype, target, rId, is_external)
+        self._rIds[key] = rId
+        return rId
+
+    def _copy_part(self, part):
+        """
+        Return a copy of *part*, of the source package, belonging to the
+        package under a partname not yet used in it. A header or footer
+        loaded as a plain |Part| is parsed into an |XmlPart| so the
+        references in its content can be remapped. A copy
+        whose content is still to be read from the source package file is
+        remembered for :meth:`_load_deferred_copies`.
+        """
+        if (
+            type(part) is Part and
+            part.content_type in _HDRFTR_CONTENT_TYPES
+        ):
+            part_copy = XmlPart.load(
+                part.partname, part.content_type, part.blob, self._package
+            )
+        else:
+            part_copy = part._copy(self._package)
+        part_copy.partname = self._new_partname(part.partname)
+        if '_read_blob' in part_copy.__dict__:
+            self._deferred_copies.append(part_copy)
+        return part_copy
+
+    def _import(self, element, source, map_rels):
+        """
+        Remap the style, numbering, drawing and bookmark ids referenced
+        within *element*, from *source*, to those of the document, removing
+        the references to notes and comments, which are not carried over.
+        When
+        *map_rels* is |True|, the relationships referenced by rId are also
+        added to the document part and their rIds remapped.
+        """
+        for ref in _refs(element):
+            tag = ref.tag
+            if tag in _STYLE_REF_TAGS:
+                style_id = ref.get(_VAL)
+                if style_id is not None:
+                    ref.set(_VAL, self._map_style(style_id, source))
+            elif tag == _NUM_ID:
+                num_id = ref.get(_VAL)
+                if num_id is not None and num_id.isdigit():
+                    ref.set(_VAL, str(self._map_num(int(num_id), source)))
+            elif tag == _DOCPR:
+                ref.set('id', str(self._next_docPr_id))
+                self._next_docPr_id += 1
+            elif tag in _NOTE_REF_TAGS:
+                ref.getparent().remove(ref)
+            else:
+                bookmark_id = ref.get(_W_ID)
+                if bookmark_id is not None and bookmark_id.isdigit():
+                    new_id = int(bookmark_id) + source.bookmark_offset
+                    ref.set(_W_ID, str(new_id))
+                    self._next_bookmark_id = max(
+                        self._next_bookmark_id, new_id + 1
+                    )
+        if not map_rels:
+            return
+        for attr in _rel_attrs(element, ns=nsmap['r']):
+            rId = self._map_rId(str(attr), source)
+            attr.getparent().set(attr.attrname, rId)
+
+    def _import_part(self, part, source):
+        """
+        Return the part of the package standing for *part*, of the source
+        package: a matching image part already in the package, or a copy of
+        *part* with a partname not yet used and copies of the parts it
+        relates to.
+        """
+        part_copy = source.parts.get(part)
+        if part_copy is not None:
+            return part_copy
+        if isinstance(part, ImagePart):
+            part_copy = self._images.get(part.sha1)
+            if part_copy is None:
+                part_copy = self._copy_part(part)
+                self._package.image_parts.append(part_copy)
+                self._images[part.sha1] = part_copy
+            source.parts[part] = part_copy
+            return part_copy
+        part_copy = self._copy_part(part)
+        source.parts[part] = part_copy
+        for rId, rel in part.rels.items():
+            target = (
+                rel.target_ref if rel.is_external
+                else self._import_part(rel.target_part, source)
+            )
+            part_copy.load_rel(rel.reltype, target, rId, rel.is_external)
+        if isinstance(part_copy, XmlPart):
+            self._import(part_copy.element, source, False)
+        return part_copy
+
+    @lazyproperty
+    def _images(self):
+        """
+        Dict mapping the SHA1 hash of each image in the package to its image
+        part.
+        """
+        return dict(
+            (image_part.sha1, image_part)
+            for image_part in self._package.image_parts
+        )
+
+    def _index_style(self, style):
+        """
+        Add the `w:style` element *style* to the style id and name indexes.
+        """
+        self._style_ids.add(style.styleId)
+        name = style.name_val
+        if name is not None:
+            self._style_ids_by_name.setdefault(name, style.styleId)
+
+    def _load_deferred_copies(self):
+        """
+        Load the content of each part copied while still to be read from
+        its source package file, before that file is closed.
+        """
+        deferred_copies, self._deferred_copies = self._deferred_copies, []
+        for part_copy in deferred_copies:
+            part_copy._load_content()
+
+    def _map_num(self, num_id, source):
+        """
+        Return the numId in the document of the numbering instance of
+        *source* having *num_id*, adding it and its abstract numbering
+        definition when first referenced. Zero, meaning no numbering, and
+        a *num_id* not defined in *source*, map to zero.
+        """
+        num_ids = source.num_ids
+        if num_id in num_ids:
+            return num_ids[num_id]
+        num = source.nums.get(num_id)
+        if num_id == 0 or num is None:
+            num_ids[num_id] = 0
+            return 0
+        numbering = self._numbering
+        new_num = copy.deepcopy(num)
+        new_num.numId = num_ids[num_id] = numbering.next_num_id()
+        abstract_id, restart = self._map_abstract(
+            num.abstractNumId.val, source
+        )
+        new_num.abstractNumId.val = abstract_id
+        if restart and not new_num.lvlOverride_lst:
+            abstract = source.abstracts[num.abstractNumId.val]
+            for lvl in abstract.iterchildren(qn('w:lvl')):
+                start = lvl.find(qn('w:start'))
+                new_num.add_lvlOverride(
+                    int(lvl.get(qn('w:ilvl')))
+                ).add_startOverride(
+                    0 if start is None else int(start.get(_VAL))
+                )
+        numbering.add_num(new_num)
+        return new_num.numId
+
+    def _map_abstract(self, abstract_id, source):
+        """
+        Return an ``(abstract_id, restart)`` pair for the abstract numbering
+        definition of *source* having *abstract_id*. *restart* is |True| the
+        first time a definition the document already has is referenced from
+        *source*, as its lists then need to restart their numbering.
+        """
+        abstract_ids = source.abstract_ids
+        if abstract_id in abstract_ids:
+            return abstract_ids[abstract_id], False
+        abstract = source.abstracts.get(abstract_id)
+        if abstract is None:
+            abstract_ids[abstract_id] = abstract_id
+            return abstract_id, False
+        numbering = self._numbering
+        key = _abstract_key(abstract)
+        new_id = numbering.abstract_id_for(key)
+        if new_id is not None:
+            abstract_ids[abstract_id] = new_id
+            return new_id, True
+        new_abstract = copy.deepcopy(abstract)
+        new_id = abstract_ids[abstract_id] = numbering.add_abstract(
+            new_abstract, key
+        )
+        self._import(new_abstract, source, False)
+        return new_id, False
+
+    def _map_rId(self, rId, source):
+        """
+        Return the rId in the document part of the relationship having *rId*
+        in the document part of *source*, adding it and copying its target
+        part when first referenced.
+        """
+        rIds = source.rIds
+        if rId in rIds:
+            return rIds[rId]
+        rel = source.part.rels.get(rId)
+        if rel is None:
+            new_rId = rId
+        elif rel.is_external:
+            new_rId = self._add_rel(rel.reltype, rel.target_ref, True)
+        else:
+            target = self._import_part(rel.target_part, source)
+            new_rId = self._add_rel(rel.reltype, target, False)
+        rIds[rId] = new_rId
+        return new_rId
+
+    def _map_style(self, style_id, source):
+        """
+        Return the id of the style in the document standing for the style
+        of *source* having *style_id*, copying that style in when the
+        document has no style of that id or name.
+        """
+        style_ids = source.style_ids
+        if style_id in style_ids:
+            return style_ids[style_id]
+        style = (
+            None if style_id in self._style_ids
+            else source.styles.get(style_id)
+        )
+        if style is None:
+            style_ids[style_id] = style_id
+            return style_id
+        name = style.name_val
+        if name in self._style_ids_by_name:
+            new_id = style_ids[style_id] = self._style_ids_by_name[name]
+            return new_id
+        style_ids[style_id] = style_id
+        style = copy.deepcopy(style)
+        self._import(style, source, False)
+        self._styles.append(style)
+        self._index_style(style)
+        self._style_index.add(style)
+        return style_id
+
+    def _new_partname(self, partname):
+        """
+        Return *partname* when not used in the package, otherwise the
+        partname like it having the lowest index not yet used.
+        """
+        if partname not in self._partnames:
+            self._partnames.add(partname)
+            return partname
+        prefix, _, ext = _PARTNAME.match(partname).groups()
+        ext = ext or ''
+        idx = self._partname_idxs.get((prefix, ext), 1)
+        while True:
+            new_partname = PackURI('%s%d%s' % (prefix, idx, ext))
+            idx += 1
+            if new_partname not in self._partnames:
+                break
+        self._partname_idxs[(prefix, ext)] = idx
+        self._partnames.add(new_partname)
+        return new_partname
+
+
+class _Numbering(object):
+    """
+    Indexes of the `w:numbering` element of the document being composed,
+    keeping track of the ids in use and where new definitions go.
+    """
+    def __init__(self, numbering):
+        super(_Numbering, self).__init__()
+        self._numbering = numbering
+        abstracts = numbering.findall(qn('w:abstractNum'))
+        self._abstract_ids = dict(
+            (_abstract_key(abstract), int(abstract.get(qn('w:abstractNumId'))))
+            for abstract in abstracts
+        )
+        self._next_abstract_id = _max_int(
+            abstract.get(qn('w:abstractNumId')) for abstract in abstracts
+        ) + 1
+        nums = numbering.num_lst
+        self._next_num_id = _max_int(str(num.numId) for num in nums) + 1
+        self._first_num = nums[0] if nums else None
+        self._end = numbering.find(qn('w:numIdMacAtCleanup'))
+
+    def abstract_id_for(self, key):
+        """
+        Return the id of the abstract numbering definition having *key*, or
+        |None| if there is none.
+        """
+        return self._abstract_ids.get(key)
+
+    def add_abstract(self, abstract, key):
+        """
+        Return the id given to the `w:abstractNum` element *abstract* after
+        inserting it ahead of the numbering instances.
+        """
+        abstract_id = self._next_abstract_id
+        self._next_abstract_id += 1
+        abstract.set(qn('w:abstractNumId'), str(abstract_id))
+        self._insert(abstract, self._first_num)
+        self._abstract_ids.setdefault(key, abstract_id)
+        return abstract_id
+
+    def add_num(self, num):
+        """
+        Insert the `w:num` element *num* after the existing ones.
+        """
+        self._insert(num, None)
+        if self._first_num is None:
+            self._first_num = num
+
+    def next_num_id(self):
+        """
+        Return a numId not yet used, reserving it.
+        """
+        num_id = self._next_num_id
+        self._next_num_id += 1
+        return num_id
+
+    def _insert(self, element, successor):
+        successor = self._end if successor is None else successor
+        if successor is None:
+            self._numbering.append(element)
+        else:
+            successor.addprevious(element)
+
+
+class _Source(object):
+    """
+    Indexes of the document part *part* whose content is being appended and
+    the mappings from its ids to those of the document being composed.
+    """
+    def __init__(self, part, bookmark_offset):
+        super(_Source, self).__init__()
+        self.part = part
+        self.bookmark_offset = bookmark_offset
+        self.style_ids = {}
+        self.num_ids = {}
+        self.abstract_ids = {}
+        self.rIds = {}
+        self.parts = {}
+
+    @lazyproperty
+    def abstracts(self):
+        """
+        Dict mapping the id of each abstract numbering definition of the
+        source to its `w:abstractNum` element.
+        """
+        numbering = self._numbering
+        if numbering is None:
+            return {}
+        return dict(
+            (int(abstract.get(qn('w:abstractNumId'))), abstract)
+            for abstract in numbering.findall(qn('w:abstractNum'))
+        )
+
+    @lazyproperty
+    def nums(self):
+        """
+        Dict mapping the numId of each numbering instance of the source to
+        its `w:num` element.
+        """
+        numbering = self._numbering
+        if numbering is None:
+            return {}
+        return dict((num.numId, num) for num in numbering.num_lst)
+
+    @lazyproperty
+    def styles(self):
+        """
+        Dict mapping the id of each style of the source to its `w:style`
+        element.
+        """
+        try:
+            styles_part = self.part.part_related_by(RT.STYLES)
+        except KeyError:
+            return {}
+        return dict(
+            (style.styleId, style) for style in styles_part.element.style_lst
+        )
+
+    @property
+    def _numbering(self):
+        try:
+            return self.part.part_related_by(RT.NUMBERING).element
+        except KeyError:
+            return None
+
+
+def _abstract_key(abstract):
+    """
+    Return the XML of the `w:abstractNum` element *abstract* without its id
+    and its `w:nsid` and `w:tmpl` identifiers, equal for two definitions
+    producing the same lists.
+    """
+    abstract = copy.deepcopy(abstract)
+    abstract.attrib.pop(qn('w:abstractNumId'), None)
+    for tag in ('w:nsid', 'w:tmpl'):
+        child = abstract.find(qn(tag))
+        if child is not None:
+            abstract.remove(child)
+    return etree.tostring(abstract)
+
+
+def _content(body):
+    """
+    Generate the block-level elements of the `w:body` element *body*,
+    leaving out its closing `w:sectPr`.
+    """
+    sectPr = body.sectPr
+    for element in body:
+        if element is not sectPr:
+            yield element
+
+
+def _max_int(values):
+    """
+    Return the largest of the integer strings in *values*, zero when there
+    is none.
+    """
+    return max([int(value) for value in values if value.isdigit()] or [0])
+
+
+def _rel_key(rel):
+    """
+    Return the ``(reltype, target, is_external)`` key of *rel*.
+    """
+    if rel.is_external:
+        return (rel.reltype, rel.target_ref, True)
+    return (rel.reltype, rel.target_part, False)
@@ -19,6 +19,7 @@ from .enum.text import WD_BREAK
 from .section import Section, Sections
 from .shared import ElementProxy, Emu
 from .oxml.table import CT_Tbl
+from .opc.tracing import using
 from .oxml.text.paragraph import CT_P
 from .table import _Cell, Table
 from .text.paragraph import Paragraph
@@ -49,6 +50,12 @@ class Document(ElementProxy):
         self._fulltext = None
         self._fulltext_without_sc = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def add_heading(self, text='', level=1):
         """
         Return a heading paragraph newly added to the end of the document,
@@ -83,6 +90,16 @@ class Document(ElementProxy):
         """
         return self._body.add_paragraph(text, style)
 
+    def add_paragraphs(self, paragraphs):
+        """
+        Return a list of paragraphs newly added to the end of the document,
+        one for each item in *paragraphs*, an iterable of paragraph text or
+        (text, style) pairs. Much faster than repeated calls to
+        :meth:`add_paragraph` when building a large document. See
+        :meth:`.BlockItemContainer.add_paragraphs`.
+        """
+        return self._body.add_paragraphs(paragraphs)
+
     def add_picture(self, image_path_or_stream, width=None, height=None):
         """
         Return a new picture shape added in its own paragraph at the end of
@@ -180,6 +197,22 @@ class Document(ElementProxy):
         """
         return self._mapping_without_sc
 
+    def clone(self):
+        """
+        Return a new |Document| that is an independent, editable copy of
+        this one, made in memory. Much faster than saving the document and
+        opening it again, so suited to producing many documents from one.
+        """
+        return self._part.package.clone().main_document_part.document
+
+    def close(self):
+        """
+        Close the package file kept open by a document opened with
+        ``Document(docx, lazy=True)``, as done on leaving a ``with`` block
+        using the document. Parts of the document not loaded by then can no
+        longer be loaded. Does nothing for a document opened otherwise.
+        """
+        self._part.package.close()
 
     @property
     def core_properties(self):
@@ -199,6 +232,29 @@ class Document(ElementProxy):
         """
         return self._part.inline_shapes
 
+    def iter_save_chunks(self, compress_level=None,
+                         stored_content_types=None):
+        """
+        Return an iterator of byte strings that, concatenated, are the
+        contents of this document saved as a .docx file. A chunk is produced
+        as each part of the package is serialized, so a response can begin
+        streaming immediately and memory use is bounded by the largest
+        part rather than the whole file. *compress_level* and
+        *stored_content_types* behave as for :meth:`save`.
+        """
+        return self._part.iter_save_chunks(
+            compress_level, stored_content_types
+        )
+
+    def iter_text(self):
+        """
+        Generate the text of each paragraph in the body of this document, in
+        document order, including the paragraphs in table cells. Much faster
+        than reading `Paragraph.text` from each paragraph since no proxy
+        objects are created.
+        """
+        return self._body.iter_text()
+
     @property
     def paragraphs(self):
         """
@@ -215,12 +271,68 @@ class Document(ElementProxy):
         """
         return self._part
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, compress_level=None,
+             stored_content_types=None, max_workers=None, tracer=None):
         """
         Save this document to *path_or_stream*, which can be either a path to
-        a filesystem location (a string) or a file-like object.
+        a filesystem location (a string) or a file-like object. The stream
+        need not be seekable; when it is not, such as a pipe or socket, the
+        package is written sequentially. When the path is that of an
+        existing directory, the package is written expanded into it without
+        compression, the fastest form to save and open again, as between the
+        steps of a pipeline.
+
+        *compress_level* is the zlib compression level, from 1 (fastest) to 9
+        (best), defaulting to the zlib default; at 0, parts are stored
+        without compression. Parts having a content type in
+        *stored_content_types*, such as
+        :data:`docx.opc.pkgwriter.PRECOMPRESSED_CONTENT_TYPES`, are stored
+        without compression. When *max_workers* is an int, parts are
+        serialized and compressed concurrently on that many threads, which
+        makes use of multiple cores on large documents. When *tracer* is
+        a |Tracer|, it receives the timing of each phase of this save in
+        place of the tracer installed for the thread.
+        """
+        with using(tracer):
+            self._part.save(
+                path_or_stream, compress_level, stored_content_types,
+                max_workers
+            )
+
+    def save_async(self, path_or_stream, compress_level=None,
+                   stored_content_types=None, executor=None,
+                   semaphore=None, tracer=None):
+        """
+        Return a coroutine saving this document to *path_or_stream* without
+        blocking the event loop, which can also be an asynchronous sink such
+        as an aiohttp response. Serialization and compression run on
+        *executor*, the default executor of the loop when |None|. See
+        :func:`docx.aio.save_async` for the details. Requires Python 3.5 or
+        later.
+        """
+        # imported here, docx.aio uses syntax only Python 3.5+ can compile
+        from .aio import save_async
+        return save_async(
+            self, path_or_stream, compress_level, stored_content_types,
+            executor, semaphore, tracer
+        )
+
+    def replace(self, pattern, repl, regex=True):
         """
-        self._part.save(path_or_stream)
+        Replace each match of *pattern* in the text of the paragraphs in the
+        body of this document with *repl*, returning the number of
+        replacements made. See :meth:`.BlockItemContainer.replace`.
+        """
+        return self._body.replace(pattern, repl, regex)
+
+    def search(self, pattern, regex=True):
+        """
+        Return a list of |TextMatch| objects, one for each match of
+        *pattern* in the text of the paragraphs in the body of this
+        document, including those in table cells. See
+        :meth:`.BlockItemContainer.search`.
+        """
+        return self._body.search(pattern, regex)
 
     @property
     def sections(self):
@@ -509,6 +621,9 @@ class _Body(BlockItemContainer):
     Proxy for ``<w:body>`` element in this document, having primarily a
     container role.
     """
+
+    __slots__ = ('_body',)
+
     def __init__(self, body_elm, parent):
         super(_Body, self).__init__(body_elm, parent)
         self._body = body_elm
@@ -7,14 +7,19 @@ writing presentations to and from a .pptx file.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import functools
+
 from .constants import RELATIONSHIP_TYPE as RT
 from .packuri import PACKAGE_URI
-from .part import PartFactory
+from .part import Part, PartFactory
 from .parts.coreprops import CorePropertiesPart
 from .pkgreader import PackageReader
 from .pkgwriter import PackageWriter
+from .profile import LoadProfile
 from .rel import Relationships
 from .shared import lazyproperty
+from .stats import PackageStats, PartStats
+from .tracing import span
 
 
 class OpcPackage(object):
@@ -25,6 +30,9 @@ class OpcPackage(object):
     """
     def __init__(self):
         super(OpcPackage, self).__init__()
+        self._compressed_sizes = {}
+        self._sizes = {}
+        self._pkg_reader = None
 
     def after_unmarshal(self):
         """
@@ -35,6 +43,46 @@ class OpcPackage(object):
         # subclass
         pass
 
+    def clone(self):
+        """
+        Return a new package of the same class, independent of this one,
+        holding a copy of each part and relationship. XML parts get their
+        own copy of their XML tree, while binary parts such as images share
+        their blob, which is immutable, with this package. Much faster than
+        saving the package and opening it again. The parts of a lazily
+        opened package are all loaded first.
+        """
+        self._load_parts()
+        package = type(self)()
+        package._compressed_sizes = dict(self._compressed_sizes)
+        package._sizes = dict(self._sizes)
+        copies = dict(
+            (part, part._copy(package)) for part in self.iter_parts()
+        )
+        for source, source_copy in [(self, package)] + list(copies.items()):
+            for rel in source.rels.values():
+                target = (
+                    rel.target_ref if rel.is_external
+                    else copies[rel.target_part]
+                )
+                source_copy.load_rel(
+                    rel.reltype, target, rel.rId, rel.is_external
+                )
+        for part in copies.values():
+            part.after_unmarshal()
+        package.after_unmarshal()
+        return package
+
+    def close(self):
+        """
+        Close the package file kept open by a package opened with
+        ``lazy=True``. Parts not loaded by then can no longer be loaded.
+        Does nothing for a package opened otherwise.
+        """
+        if self._pkg_reader is not None:
+            self._pkg_reader.close()
+            self._pkg_reader = None
+
     @property
     def core_properties(self):
         """
@@ -43,13 +91,28 @@ class OpcPackage(object):
         """
         return self._core_properties_part.core_properties
 
+    def iter_save_chunks(self, compress_level=None,
+                         stored_content_types=None):
+        """
+        Return an iterator of byte strings that together form this package
+        as it would be saved by :meth:`save`. Each chunk is produced as the
+        next part is serialized, so the package can be streamed, e.g. in an
+        HTTP response, without being assembled in memory first.
+        """
+        self._load_parts()
+        for part in self.parts:
+            part.before_marshal()
+        return PackageWriter.iter_write(
+            self.rels, self.parts, compress_level, stored_content_types
+        )
+
     def iter_rels(self):
         """
         Generate exactly one reference to each relationship in the package by
         performing a depth-first traversal of the rels graph.
         """
         def walk_rels(source, visited=None):
-            visited = [] if visited is None else visited
+            visited = set() if visited is None else visited
             for rel in source.rels.values():
                 yield rel
                 if rel.is_external:
@@ -57,7 +120,7 @@ class OpcPackage(object):
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 new_source = part
                 for rel in walk_rels(new_source, visited):
                     yield rel
@@ -70,20 +133,20 @@ class OpcPackage(object):
         Generate exactly one reference to each of the parts in the package by
         performing a depth-first traversal of the rels graph.
         """
-        def walk_parts(source, visited=list()):
+        def walk_parts(source, visited):
             for rel in source.rels.values():
                 if rel.is_external:
                     continue
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 yield part
                 new_source = part
                 for part in walk_parts(new_source, visited):
                     yield part
 
-        for part in walk_parts(self):
+        for part in walk_parts(self, set()):
             yield part
 
     def load_rel(self, reltype, target, rId, is_external=False):
@@ -108,14 +171,30 @@ class OpcPackage(object):
         return self.part_related_by(RT.OFFICE_DOCUMENT)
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, lazy=False, load=None):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
-        """
-        pkg_reader = PackageReader.from_file(pkg_file)
-        package = cls()
-        Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        *pkg_file*. When *lazy* is |True|, only the relationship graph is
+        read up front; each part is read and parsed when its content is
+        first needed, from *pkg_file* kept open until :meth:`close` is
+        called or the package is saved. *load* is a |LoadProfile|, or the
+        name of one such as ``'no-media'``, selecting parts to skip; those
+        are never parsed and are read from *pkg_file*, likewise kept open,
+        only when needed.
+        """
+        profile = LoadProfile.from_load(load)
+        defer = lazy or profile.skips_parts
+        with span('open'):
+            with span('read_package'):
+                pkg_reader = PackageReader.from_file(pkg_file, defer)
+            package = cls()
+            package._compressed_sizes = pkg_reader.compressed_sizes
+            package._sizes = pkg_reader.sizes
+            if defer:
+                package._pkg_reader = pkg_reader
+            Unmarshaller.unmarshal(
+                pkg_reader, package, PartFactory, profile, lazy
+            )
         return package
 
     def part_related_by(self, reltype):
@@ -150,14 +229,75 @@ class OpcPackage(object):
         """
         return Relationships(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, compress_level=None, stored_content_types=None,
+             max_workers=None):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        a file (a string) or a file-like object, or the path of a directory
+        to write the package into expanded. *compress_level*,
+        *stored_content_types* and *max_workers* tune compression as
+        described for :meth:`PackageWriter.write`.
+        """
+        with span('save'):
+            self._load_parts()
+            for part in self.parts:
+                part.before_marshal()
+            PackageWriter.write(
+                pkg_file, self.rels, self.parts, compress_level,
+                stored_content_types, max_workers
+            )
+
+    def stats(self, serialize=False):
+        """
+        Return a |PackageStats| object reporting, for each part, its
+        compressed and uncompressed size, the number of elements in and the
+        approximate memory taken by its XML tree and its number of
+        relationships, along with the sizes of the caches kept by the
+        package and its parts. Useful to find what makes a large document
+        large. No part is loaded for it, and the size of an XML part is the
+        size recorded in the package file it was read from unless
+        *serialize* is |True|; see |PartStats|.
+        """
+        compressed_sizes, sizes = self._compressed_sizes, self._sizes
+        parts = []
+        for part in self.iter_parts():
+            membername = part.partname.membername
+            parts.append(PartStats.from_part(
+                part, compressed_sizes.get(membername),
+                sizes.get(membername), serialize
+            ))
+        return PackageStats(parts, self._cache_sizes())
+
+    def stream_for(self, partname):
         """
-        for part in self.parts:
-            part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        Return a file-like object reading the serialized part *partname* as
+        it is consumed, from the package file kept open by a package opened
+        with ``lazy=True``, for parsing a part too large to load whole.
+        Raises |ValueError| for a package not opened lazily or closed.
+        """
+        if self._pkg_reader is None:
+            raise ValueError('package file is not open')
+        return self._pkg_reader.stream_for(partname)
+
+    def _cache_sizes(self):
+        """
+        Return a dict mapping the name of each cache kept by this package to
+        its size, for :meth:`stats`. Empty by default; overridden by
+        subclasses that keep caches.
+        """
+        return {}
+
+    def _load_parts(self):
+        """
+        Load the content of each part not loaded yet from the package file
+        kept open by a lazily opened package, then close it, so the package
+        can be saved, even over the file it was opened from.
+        """
+        if self._pkg_reader is None:
+            return
+        for part in self.iter_parts():
+            part._load_content()
+        self.close()
 
     @property
     def _core_properties_part(self):
@@ -179,32 +319,60 @@ class Unmarshaller(object):
     instance.
     """
     @staticmethod
-    def unmarshal(pkg_reader, package, part_factory):
+    def unmarshal(pkg_reader, package, part_factory, profile=None,
+                  lazy=False):
         """
         Construct graph of parts and realized relationships based on the
         contents of *pkg_reader*, delegating construction of each part to
-        *part_factory*. Package relationships are added to *pkg*.
+        *part_factory*. Package relationships are added to *pkg*. *profile*
+        and *lazy* behave as for :meth:`_unmarshal_parts`.
         """
-        parts = Unmarshaller._unmarshal_parts(
-            pkg_reader, package, part_factory
-        )
-        Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
-        for part in parts.values():
-            part.after_unmarshal()
-        package.after_unmarshal()
+        with span('unmarshal_parts'):
+            parts = Unmarshaller._unmarshal_parts(
+                pkg_reader, package, part_factory, profile, lazy
+            )
+        with span('unmarshal_relationships'):
+            Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
+        with span('after_unmarshal'):
+            for part in parts.values():
+                part.after_unmarshal()
+            package.after_unmarshal()
 
     @staticmethod
-    def _unmarshal_parts(pkg_reader, package, part_factory):
+    def _unmarshal_parts(pkg_reader, package, part_factory, profile=None,
+                         lazy=False):
         """
         Return a dictionary of |Part| instances unmarshalled from
         *pkg_reader*, keyed by partname. Side-effect is that each part in
         *pkg_reader* is constructed using *part_factory*.
+
+        A part *pkg_reader* has not read the blob of is read from it now,
+        unless *lazy* is |True|, in which case its loading is deferred, or
+        the |LoadProfile| *profile* skips it, in which case it becomes an
+        opaque |Part| whose blob is read when needed.
         """
         parts = {}
         for partname, content_type, reltype, blob in pkg_reader.iter_sparts():
-            parts[partname] = part_factory(
-                partname, content_type, reltype, blob, package
-            )
+            if blob is None:
+                read_blob = functools.partial(pkg_reader.blob_for, partname)
+                if profile is not None and profile.skips(
+                        content_type, reltype):
+                    parts[partname] = Part.load_deferred(
+                        partname, content_type, read_blob, package
+                    )
+                    continue
+                if lazy:
+                    parts[partname] = part_factory.load_deferred(
+                        partname, content_type, reltype, read_blob, package
+                    )
+                    continue
+                blob = read_blob()
+            with span('load_part', partname) as load_span:
+                parts[partname] = part_factory(
+                    partname, content_type, reltype, blob, package
+                )
+                if load_span:
+                    load_span.record(len(blob))
         return parts
 
     @staticmethod
@@ -8,12 +8,15 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import copy
+
 from .compat import cls_method_fn
 from .oxml import serialize_part_xml
 from ..oxml import parse_xml
 from .packuri import PackURI
 from .rel import Relationships
 from .shared import lazyproperty
+from .tracing import span
 
 
 class Part(object):
@@ -22,6 +25,11 @@ class Part(object):
     intended to be subclassed in client code to implement specific part
     behaviors.
     """
+
+    #: Name of the attribute holding the content of the part, left unset on
+    #: a part created by :meth:`load_deferred` until its content is loaded.
+    _content_attr = '_blob'
+
     def __init__(self, partname, content_type, blob=None, package=None):
         super(Part, self).__init__()
         self._partname = partname
@@ -29,6 +37,20 @@ class Part(object):
         self._blob = blob
         self._package = package
 
+    def __getattr__(self, name):
+        """
+        Load the content of a part created by :meth:`load_deferred` on first
+        access to the attribute holding it. Only called for an attribute
+        not found by normal lookup.
+        """
+        if name != self._content_attr or '_read_blob' not in self.__dict__:
+            raise AttributeError(
+                "'%s' object has no attribute '%s'" %
+                (type(self).__name__, name)
+            )
+        self._load_content()
+        return getattr(self, name)
+
     def after_unmarshal(self):
         """
         Entry point for post-unmarshaling processing, for example to parse
@@ -78,6 +100,17 @@ class Part(object):
     def load(cls, partname, content_type, blob, package):
         return cls(partname, content_type, blob, package)
 
+    @classmethod
+    def load_deferred(cls, partname, content_type, read_blob, package):
+        """
+        Return a part as :meth:`load` would, but whose blob is only read, by
+        calling *read_blob*, when its content is first needed. A subclass
+        whose :meth:`load` makes use of the blob must override this method.
+        """
+        part = cls.load(partname, content_type, None, package)
+        part._defer_content(read_blob)
+        return part
+
     def load_rel(self, reltype, target, rId, is_external=False):
         """
         Return newly added |_Relationship| instance of *reltype* between this
@@ -155,6 +188,56 @@ class Part(object):
         rel = self.rels[rId]
         return rel.target_ref
 
+    def _cache_sizes(self):
+        """
+        Return a dict mapping the name of each cache kept by this part to
+        its size, for :meth:`OpcPackage.stats`. Empty by default; overridden
+        by subclasses that keep caches.
+        """
+        return {}
+
+    def _copy(self, package):
+        """
+        Return a new part of the same class, partname and content type as
+        this one, belonging to *package*, without relationships, for
+        :meth:`OpcPackage.clone`. The blob, being immutable, is shared
+        rather than copied; the copy of a part not loaded yet loads its
+        content from the same package file when needed. Overridden by
+        subclasses that hold their content otherwise or have other state to
+        carry over.
+        """
+        read_blob = self.__dict__.get('_read_blob')
+        if read_blob is not None:
+            return type(self).load_deferred(
+                self._partname, self._content_type, read_blob, package
+            )
+        return type(self)(
+            self._partname, self._content_type, self._blob, package
+        )
+
+    def _defer_content(self, read_blob):
+        """
+        Unset the content of this part so it is loaded from the blob
+        returned by *read_blob* when first accessed.
+        """
+        delattr(self, self._content_attr)
+        self._read_blob = read_blob
+
+    def _load_content(self):
+        """
+        Load the content of this part if it is deferred, otherwise do
+        nothing.
+        """
+        read_blob = self.__dict__.pop('_read_blob', None)
+        if read_blob is not None:
+            self._set_content(read_blob())
+
+    def _set_content(self, blob):
+        """
+        Make *blob*, just read from the package, the content of this part.
+        """
+        self._blob = blob
+
     def _rel_ref_count(self, rId):
         """
         Return the count of references in this part's XML to the relationship
@@ -182,14 +265,22 @@ class PartFactory(object):
     default_part_type = Part
 
     def __new__(cls, partname, content_type, reltype, blob, package):
-        PartClass = None
-        if cls.part_class_selector is not None:
-            part_class_selector = cls_method_fn(cls, 'part_class_selector')
-            PartClass = part_class_selector(content_type, reltype)
-        if PartClass is None:
-            PartClass = cls._part_cls_for(content_type)
+        PartClass = cls._select_part_cls(content_type, reltype)
         return PartClass.load(partname, content_type, blob, package)
 
+    @classmethod
+    def load_deferred(cls, partname, content_type, reltype, read_blob,
+                      package):
+        """
+        Return a part of the class selected as for a part being loaded, but
+        whose blob is only read, by calling *read_blob*, when its content is
+        first needed.
+        """
+        PartClass = cls._select_part_cls(content_type, reltype)
+        return PartClass.load_deferred(
+            partname, content_type, read_blob, package
+        )
+
     @classmethod
     def _part_cls_for(cls, content_type):
         """
@@ -201,6 +292,21 @@ class PartFactory(object):
             return cls.part_type_for[content_type]
         return cls.default_part_type
 
+    @classmethod
+    def _select_part_cls(cls, content_type, reltype):
+        """
+        Return the part class for a part of *content_type* related by
+        *reltype*, from ``part_class_selector`` when it is set and selects
+        one, otherwise by content type.
+        """
+        PartClass = None
+        if cls.part_class_selector is not None:
+            part_class_selector = cls_method_fn(cls, 'part_class_selector')
+            PartClass = part_class_selector(content_type, reltype)
+        if PartClass is None:
+            PartClass = cls._part_cls_for(content_type)
+        return PartClass
+
 
 class XmlPart(Part):
     """
@@ -209,6 +315,9 @@ class XmlPart(Part):
     of parsing and reserializing the XML payload and managing relationships
     to other parts.
     """
+
+    _content_attr = '_element'
+
     def __init__(self, partname, content_type, element, package):
         super(XmlPart, self).__init__(
             partname, content_type, package=package
@@ -228,8 +337,18 @@ class XmlPart(Part):
 
     @classmethod
     def load(cls, partname, content_type, blob, package):
-        element = parse_xml(blob)
-        return cls(partname, content_type, element, package)
+        return cls(partname, content_type, _parse_part_xml(partname, blob),
+                   package)
+
+    @classmethod
+    def load_deferred(cls, partname, content_type, read_blob, package):
+        """
+        Return a part whose XML is only read and parsed, from the blob
+        returned by *read_blob*, when its element is first needed.
+        """
+        part = cls(partname, content_type, None, package)
+        part._defer_content(read_blob)
+        return part
 
     @property
     def part(self):
@@ -239,3 +358,31 @@ class XmlPart(Part):
         chain of delegation ends here for child objects.
         """
         return self
+
+    def _copy(self, package):
+        """
+        Return a new part like this one, belonging to *package*, with its
+        own copy of the XML tree.
+        """
+        if '_read_blob' in self.__dict__:
+            return super(XmlPart, self)._copy(package)
+        return type(self)(
+            self._partname, self._content_type,
+            copy.deepcopy(self._element), package
+        )
+
+    def _set_content(self, blob):
+        self._element = _parse_part_xml(self._partname, blob)
+
+
+def _parse_part_xml(partname, blob):
+    """
+    Return the root element of the XML in *blob*, the content of the part
+    *partname*, timed as its ``parse_xml`` phase.
+    """
+    with span('parse_xml', partname) as parse_span:
+        element = parse_xml(blob)
+        if parse_span:
+            parse_span.record(len(blob))
+            parse_span.count_elements(element)
+    return element
@@ -6,15 +6,29 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 
 from __future__ import absolute_import
 
+import mmap
 import os
+import struct
+import time
+import zlib
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from collections import deque
+from zipfile import (
+    BadZipfile, ZipFile, is_zipfile, ZIP_DEFLATED, ZIP_STORED
+)
 
 from .compat import is_string
 from .exceptions import PackageNotFoundError
 from .packuri import CONTENT_TYPES_URI
 
 
+_BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+#: Upper bound of the deflate compression ratio, bounding the size a member
+#: can decompress to whatever size its zip header declares.
+_MAX_DEFLATE_RATIO = 1032
+
+
 class PhysPkgReader(object):
     """
     Factory for physical package reader objects.
@@ -38,10 +52,22 @@ class PhysPkgReader(object):
 
 class PhysPkgWriter(object):
     """
-    Factory for physical package writer objects.
+    Factory for physical package writer objects. *compress_level* is the
+    zlib compression level (0-9) used for deflated members, the zlib default
+    when |None|; at 0, members are stored without compression. When an
+    *executor* (a `concurrent.futures` executor) is provided, members are
+    deflated on its workers and written in order as they become available.
+    When *pkg_file* is the path of an existing directory, the package is
+    written expanded into it, uncompressed, as read by |_DirPkgReader|.
     """
-    def __new__(cls, pkg_file):
-        return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
+    def __new__(cls, pkg_file, compress_level=None, executor=None):
+        if is_string(pkg_file) and os.path.isdir(pkg_file):
+            writer_cls = _DirPkgWriter
+        elif executor is None:
+            writer_cls = _ZipPkgWriter
+        else:
+            writer_cls = _ParallelZipPkgWriter
+        return super(PhysPkgWriter, cls).__new__(writer_cls)
 
 
 class _DirPkgReader(PhysPkgReader):
@@ -80,6 +106,21 @@ class _DirPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    @property
+    def compressed_sizes(self):
+        """
+        Empty dict; files in a directory have no compressed size.
+        """
+        return {}
+
+    @property
+    def sizes(self):
+        """
+        Empty dict; the size of a file in a directory is not recorded apart
+        from the file.
+        """
+        return {}
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri*, or None if the
@@ -91,27 +132,92 @@ class _DirPkgReader(PhysPkgReader):
             rels_xml = None
         return rels_xml
 
+    def stream_for(self, pack_uri):
+        """
+        Return a binary file object reading the file corresponding to
+        *pack_uri* in the package directory.
+        """
+        return open(os.path.join(self._path, pack_uri.membername), 'rb')
+
 
 class _ZipPkgReader(PhysPkgReader):
     """
     Implements |PhysPkgReader| interface for a zip file OPC package.
+    *pkg_file* is a path, a file-like object or a buffer holding the
+    package: bytes, a bytearray, a memoryview or an mmap. A buffer is read
+    in place rather than copied. So is the buffer of a |BytesIO|, but it is
+    exported only while a member is read, since a |BytesIO| cannot be
+    resized while its buffer is exported; the caller can go on writing to
+    it while a package opened lazily from it is open.
+
+    Deflated and stored members are read by decompressing their raw data in
+    one step into a blob of the size recorded for them, which avoids the
+    transient copy made by `ZipFile.read()` and so halves the peak memory
+    taken to read a large member. The buffer allocated for that is bounded
+    by the size the raw data can decompress to, not only by the size
+    recorded in the zip header, and a blob of a size other than the one
+    recorded is rejected.
     """
     def __init__(self, pkg_file):
         super(_ZipPkgReader, self).__init__()
-        self._zipf = ZipFile(pkg_file, 'r')
+        self._file = self._view = self._getbuffer = None
+        if is_string(pkg_file):
+            stream = self._file = open(pkg_file, 'rb')
+        elif isinstance(pkg_file, _BUFFER_TYPES):
+            self._view = memoryview(pkg_file)
+            stream = _BufferStream(self._view)
+        else:
+            stream = pkg_file
+            self._getbuffer = getattr(pkg_file, 'getbuffer', None)
+        self._stream = stream
+        self._zipf = ZipFile(stream, 'r')
 
     def blob_for(self, pack_uri):
         """
-        Return blob corresponding to *pack_uri*. Raises |ValueError| if no
+        Return blob corresponding to *pack_uri*. Raises |KeyError| if no
         matching member is present in zip archive.
         """
-        return self._zipf.read(pack_uri.membername)
+        info = self._zipf.getinfo(pack_uri.membername)
+        method = info.compress_type
+        if method not in (ZIP_DEFLATED, ZIP_STORED) or info.flag_bits & 0x1:
+            return self._zipf.read(info)
+        if self._getbuffer is None:
+            return self._read_member(info, self._view)
+        with self._getbuffer() as view:
+            return self._read_member(info, view)
+
+    def _read_member(self, info, view):
+        """
+        Return the blob of the deflated or stored member described by the
+        `ZipInfo` *info*, read in place from *view* when it is not |None|,
+        checking its size and CRC. No slice of *view* is left exported.
+        """
+        data = self._raw_data(info, view)
+        try:
+            if info.compress_type == ZIP_DEFLATED:
+                # one spare byte, as zlib grows a buffer that fills up exactly
+                bufsize = min(info.file_size, len(data) * _MAX_DEFLATE_RATIO)
+                blob = zlib.decompress(data, -15, bufsize + 1)
+            else:
+                blob = bytes(data)
+        finally:
+            if isinstance(data, memoryview):
+                data.release()
+        if len(blob) != info.file_size:
+            raise BadZipfile('Bad size for file %r' % info.filename)
+        if zlib.crc32(blob) & 0xFFFFFFFF != info.CRC:
+            raise BadZipfile('Bad CRC-32 for file %r' % info.filename)
+        return blob
 
     def close(self):
         """
         Close the zip archive, releasing any resources it is using.
         """
         self._zipf.close()
+        if self._view is not None:
+            self._view.release()
+        if self._file is not None:
+            self._file.close()
 
     @property
     def content_types_xml(self):
@@ -120,6 +226,27 @@ class _ZipPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    @property
+    def compressed_sizes(self):
+        """
+        Return a dict mapping the name of each member of the zip archive to
+        its compressed size in bytes.
+        """
+        return dict(
+            (info.filename, info.compress_size)
+            for info in self._zipf.infolist()
+        )
+
+    @property
+    def sizes(self):
+        """
+        Return a dict mapping the name of each member of the zip archive to
+        its uncompressed size in bytes, as recorded in the archive.
+        """
+        return dict(
+            (info.filename, info.file_size) for info in self._zipf.infolist()
+        )
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri* or None if no rels
@@ -131,14 +258,116 @@ class _ZipPkgReader(PhysPkgReader):
             rels_xml = None
         return rels_xml
 
+    def stream_for(self, pack_uri):
+        """
+        Return a file-like object decompressing the member corresponding to
+        *pack_uri* as it is read, so a large member can be parsed without
+        holding all of it in memory. Raises |KeyError| if no matching member
+        is present in zip archive.
+        """
+        return self._zipf.open(pack_uri.membername)
+
+    def _raw_data(self, info, view):
+        """
+        Return the compressed data of the member described by the `ZipInfo`
+        *info*, a slice of the package buffer *view* when there is one.
+        """
+        offset = info.header_offset
+        stream = self._stream
+        if view is not None:
+            header = view[offset:offset + 30].tobytes()
+        else:
+            stream.seek(offset)
+            header = stream.read(30)
+        if header[:4] != b'PK\x03\x04':
+            raise BadZipfile('Bad magic number for file header')
+        name_len, extra_len = struct.unpack('<2H', header[26:30])
+        start = offset + 30 + name_len + extra_len
+        if view is not None:
+            return view[start:start + info.compress_size]
+        stream.seek(start)
+        return stream.read(info.compress_size)
+
+
+class _BufferStream(object):
+    """
+    Read-only, seekable file-like object over the memoryview *view*, so
+    a buffer can be opened as a zip file without being copied.
+    """
+    def __init__(self, view):
+        super(_BufferStream, self).__init__()
+        self._view = view
+        self._pos = 0
+
+    def read(self, size=-1):
+        start = self._pos
+        end = len(self._view) if size is None or size < 0 else start + size
+        data = self._view[start:end].tobytes()
+        self._pos = start + len(data)
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+
+class _DirPkgWriter(PhysPkgWriter):
+    """
+    Implements |PhysPkgWriter| interface for an OPC package expanded into
+    the directory at *path*, each member written to a file without
+    compression. Files already in the directory are overwritten when they
+    have the name of a member and otherwise left in place.
+    """
+    def __init__(self, path, compress_level=None, executor=None):
+        super(_DirPkgWriter, self).__init__()
+        self._path = os.path.abspath(path)
+
+    def close(self):
+        """
+        Provides interface consistency with |_ZipPkgWriter|, but does
+        nothing, each member is written to its file in full by :meth:`write`.
+        """
+        pass
+
+    def write(self, pack_uri, blob, compress=True):
+        """
+        Write *blob* to the file corresponding to *pack_uri* in the package
+        directory, creating its parent directories as needed. *compress* is
+        ignored.
+        """
+        path = os.path.join(self._path, pack_uri.membername)
+        dirname = os.path.dirname(path)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        with open(path, 'wb') as f:
+            f.write(blob)
+
 
 class _ZipPkgWriter(PhysPkgWriter):
     """
     Implements |PhysPkgWriter| interface for a zip file OPC package.
     """
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, compress_level=None, executor=None):
         super(_ZipPkgWriter, self).__init__()
-        self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        if compress_level == 0:
+            self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_STORED)
+        elif compress_level is None:
+            self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        else:
+            self._zipf = ZipFile(
+                pkg_file, 'w', compression=ZIP_DEFLATED,
+                compresslevel=compress_level
+            )
 
     def close(self):
         """
@@ -147,9 +376,209 @@ class _ZipPkgWriter(PhysPkgWriter):
         """
         self._zipf.close()
 
-    def write(self, pack_uri, blob):
+    def write(self, pack_uri, blob, compress=True):
         """
         Write *blob* to this zip package with the membername corresponding to
-        *pack_uri*.
+        *pack_uri*. *blob* is stored without compression when *compress* is
+        |False|.
+        """
+        if compress:
+            self._zipf.writestr(pack_uri.membername, blob)
+        else:
+            self._zipf.writestr(pack_uri.membername, blob, ZIP_STORED)
+
+
+class _ParallelZipPkgWriter(PhysPkgWriter):
+    """
+    Implements |PhysPkgWriter| interface for a zip file OPC package whose
+    members are deflated concurrently on the workers of an executor. zlib
+    releases the GIL while compressing, so members are compressed in
+    parallel. Members are written in the order they were submitted, each as
+    soon as it and all members before it are ready. The zip file is written
+    strictly sequentially, so *pkg_file* need not be seekable.
+    """
+    def __init__(self, pkg_file, compress_level=None, executor=None):
+        super(_ParallelZipPkgWriter, self).__init__()
+        self._member_writer = _ZipMemberWriter(pkg_file)
+        if compress_level is None:
+            compress_level = zlib.Z_DEFAULT_COMPRESSION
+        elif compress_level == 0:
+            compress_level = None
+        self._compress_level = compress_level
+        self._executor = executor
+        self._pending = deque()
+
+    def close(self):
+        """
+        Write any members still pending and the central directory, then
+        close the file if this writer opened it.
+        """
+        self._write_ready_members(wait=True)
+        self._member_writer.close()
+
+    def write(self, pack_uri, blob, compress=True):
+        """
+        Schedule *blob* to be written to this zip package with the
+        membername corresponding to *pack_uri*, deflated on a worker unless
+        *compress* is |False|.
+        """
+        level = self._compress_level if compress else None
+        future = self._executor.submit(
+            _ZipMember.from_blob, pack_uri.membername, blob, level
+        )
+        self._pending.append(future)
+        self._write_ready_members()
+
+    def _write_ready_members(self, wait=False):
+        """
+        Write each pending member, in submission order, whose compression
+        has completed; all of them when *wait* is |True|.
+        """
+        pending = self._pending
+        while pending and (wait or pending[0].done()):
+            self._member_writer.write_member(pending.popleft().result())
+
+
+class _ZipMemberWriter(object):
+    """
+    Writes a zip file to *pkg_file*, a path or a file-like object, from
+    |_ZipMember| objects already compressed in memory. The file is written
+    strictly sequentially, so a file-like object need not be seekable.
+    """
+    def __init__(self, pkg_file):
+        super(_ZipMemberWriter, self).__init__()
+        if is_string(pkg_file):
+            self._file, self._owns_file = open(pkg_file, 'wb'), True
+        else:
+            self._file, self._owns_file = pkg_file, False
+        self._members = []
+        self._offset = 0
+
+    def close(self):
+        """
+        Write the central directory, then close the file if this writer
+        opened it.
+        """
+        self._write_central_directory()
+        if self._owns_file:
+            self._file.close()
+
+    def write_member(self, member):
+        """
+        Write *member* at the current end of the zip file. Its data is
+        released once written.
+        """
+        member.header_offset = self._offset
+        self._write_bytes(member.local_header)
+        self._write_bytes(member.data)
+        member.data = None
+        self._members.append(member)
+
+    def _write_central_directory(self):
         """
-        self._zipf.writestr(pack_uri.membername, blob)
+        Write the central directory and end-of-central-directory record
+        following the members written so far.
+        """
+        if len(self._members) > 0xFFFF or self._offset > 0xFFFFFFFF:
+            raise ValueError('package too large for a non-ZIP64 zip file')
+        cd_offset = self._offset
+        for member in self._members:
+            self._write_bytes(member.central_header)
+        cd_size = self._offset - cd_offset
+        count = len(self._members)
+        self._write_bytes(struct.pack(
+            '<4s4H2LH', b'PK\x05\x06', 0, 0, count, count, cd_size,
+            cd_offset, 0
+        ))
+
+    def _write_bytes(self, data):
+        self._file.write(data)
+        self._offset += len(data)
+
+
+class _ZipMember(object):
+    """
+    A zip archive member compressed in memory, providing the local and
+    central directory header bytes for it.
+    """
+    def __init__(self, name, method, crc, file_size, data):
+        super(_ZipMember, self).__init__()
+        self._name = name.encode('utf-8')
+        self._method = method
+        self._crc = crc
+        self._file_size = file_size
+        self._compress_size = len(data)
+        self._dos_time, self._dos_date = _dos_datetime(time.localtime())
+        self.data = data
+        self.header_offset = 0
+
+    def copy(self):
+        """
+        Return a new |_ZipMember| having the same name and data as this one,
+        which must not yet have been written, so the same compressed data
+        can be written to more than one zip file.
+        """
+        member = _ZipMember(
+            self._name.decode('utf-8'), self._method, self._crc,
+            self._file_size, self.data
+        )
+        member._dos_time, member._dos_date = self._dos_time, self._dos_date
+        return member
+
+    @classmethod
+    def from_blob(cls, name, blob, compress_level):
+        """
+        Return a new |_ZipMember| for *blob*, deflated at *compress_level*,
+        or stored if *compress_level* is |None|.
+        """
+        crc = zlib.crc32(blob) & 0xFFFFFFFF
+        if compress_level is None:
+            return cls(name, ZIP_STORED, crc, len(blob), blob)
+        compressor = zlib.compressobj(compress_level, zlib.DEFLATED, -15)
+        data = compressor.compress(blob) + compressor.flush()
+        return cls(name, ZIP_DEFLATED, crc, len(blob), data)
+
+    @property
+    def central_header(self):
+        """
+        Central directory file header for this member.
+        """
+        return struct.pack(
+            '<4s6H3L5H2L', b'PK\x01\x02', 20, 20, self._flags,
+            self._method, self._dos_time, self._dos_date, self._crc,
+            self._compress_size, self._file_size, len(self._name), 0, 0, 0,
+            0, 0, self.header_offset
+        ) + self._name
+
+    @property
+    def local_header(self):
+        """
+        Local file header for this member.
+        """
+        return struct.pack(
+            '<4s5H3L2H', b'PK\x03\x04', 20, self._flags, self._method,
+            self._dos_time, self._dos_date, self._crc, self._compress_size,
+            self._file_size, len(self._name), 0
+        ) + self._name
+
+    @property
+    def _flags(self):
+        """
+        General purpose bit flags, marking the name as UTF-8 encoded when it
+        is not plain ASCII.
+        """
+        try:
+            self._name.decode('ascii')
+        except UnicodeDecodeError:
+            return 0x800
+        return 0
+
+
+def _dos_datetime(tm):
+    """
+    Return a (time, date) pair of MS-DOS packed integers for the
+    `time.struct_time` *tm*.
+    """
+    dos_time = (tm[3] << 11) | (tm[4] << 5) | (tm[5] // 2)
+    dos_date = ((max(tm[0], 1980) - 1980) << 9) | (tm[1] << 5) | tm[2]
+    return dos_time, dos_date
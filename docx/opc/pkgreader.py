@@ -12,31 +12,115 @@ from .oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
 from .phys_pkg import PhysPkgReader
 from .shared import CaseInsensitiveDict
+from .tracing import span
 
 
 class PackageReader(object):
     """
     Provides access to the contents of a zip-format OPC package via its
     :attr:`serialized_parts` and :attr:`pkg_srels` attributes.
+    `compressed_sizes` maps the name of each member of the physical package
+    to its compressed size in bytes and `sizes` to its uncompressed size,
+    where the package records them.
+
+    A reader whose parts were read without their blobs keeps *phys_reader*,
+    the open physical package, from which :meth:`blob_for` reads each blob
+    when it is needed, until :meth:`close` is called.
     """
-    def __init__(self, content_types, pkg_srels, sparts):
+    def __init__(self, content_types, pkg_srels, sparts,
+                 compressed_sizes=None, phys_reader=None, sizes=None):
         super(PackageReader, self).__init__()
         self._pkg_srels = pkg_srels
         self._sparts = sparts
+        self.compressed_sizes = (
+            {} if compressed_sizes is None else compressed_sizes
+        )
+        self.sizes = {} if sizes is None else sizes
+        self._phys_reader = phys_reader
+
+    def blob_for(self, partname):
+        """
+        Return the blob of the part *partname*, read from the physical
+        package kept open by this reader. Raises |ValueError| once the
+        reader is closed.
+        """
+        if self._phys_reader is None:
+            raise ValueError(
+                "package closed before part '%s' was loaded" % partname
+            )
+        with span('read_part', partname) as read_span:
+            blob = self._phys_reader.blob_for(partname)
+            if read_span:
+                read_span.record(len(blob))
+        return blob
+
+    def close(self):
+        """
+        Close the physical package kept open by this reader, if any.
+        """
+        if self._phys_reader is not None:
+            self._phys_reader.close()
+            self._phys_reader = None
+
+    def stream_for(self, partname):
+        """
+        Return a file-like object reading the blob of the part *partname* as
+        it is consumed, from the physical package kept open by this reader.
+        Raises |ValueError| once the reader is closed.
+        """
+        if self._phys_reader is None:
+            raise ValueError(
+                "package closed before part '%s' was read" % partname
+            )
+        return self._phys_reader.stream_for(partname)
 
     @staticmethod
-    def from_file(pkg_file):
+    def from_file(pkg_file, lazy=False):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
+        When *lazy* is |True|, only the content types and relationships are
+        read; the blob of each serialized part is |None| and the physical
+        package is kept open to read it from with :meth:`blob_for`.
         """
         phys_reader = PhysPkgReader(pkg_file)
         content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
         pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
         sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
+            phys_reader, pkg_srels, content_types, not lazy
+        )
+        compressed_sizes, sizes = (
+            phys_reader.compressed_sizes, phys_reader.sizes
+        )
+        if not lazy:
+            phys_reader.close()
+            phys_reader = None
+        return PackageReader(
+            content_types, pkg_srels, sparts, compressed_sizes, phys_reader,
+            sizes
         )
-        phys_reader.close()
-        return PackageReader(content_types, pkg_srels, sparts)
+
+    @staticmethod
+    def package_part_blobs(pkg_file, reltypes):
+        """
+        Return a dict mapping each of *reltypes* for which the package in
+        *pkg_file* has a package relationship to the blob of the part it
+        targets. Only those parts are read, so this is a cheap way to get at,
+        say, the main document part without loading the rest of the package.
+        """
+        phys_reader = PhysPkgReader(pkg_file)
+        try:
+            pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+            blobs = {}
+            for srel in pkg_srels:
+                reltype = srel.reltype
+                if srel.is_external or reltype not in reltypes:
+                    continue
+                if reltype in blobs:
+                    continue
+                blobs[reltype] = phys_reader.blob_for(srel.target_partname)
+            return blobs
+        finally:
+            phys_reader.close()
 
     def iter_sparts(self):
         """
@@ -58,14 +142,18 @@ class PackageReader(object):
                 yield (spart.partname, srel)
 
     @staticmethod
-    def _load_serialized_parts(phys_reader, pkg_srels, content_types):
+    def _load_serialized_parts(phys_reader, pkg_srels, content_types,
+                               read_blobs=True):
         """
         Return a list of |_SerializedPart| instances corresponding to the
         parts in *phys_reader* accessible by walking the relationship graph
-        starting with *pkg_srels*.
+        starting with *pkg_srels*. Their blob is |None| unless *read_blobs*
+        is |True|.
         """
         sparts = []
-        part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
+        part_walker = PackageReader._walk_phys_parts(
+            phys_reader, pkg_srels, read_blobs
+        )
         for partname, blob, reltype, srels in part_walker:
             content_type = content_types[partname]
             spart = _SerializedPart(
@@ -85,30 +173,37 @@ class PackageReader(object):
             source_uri.baseURI, rels_xml)
 
     @staticmethod
-    def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
+    def _walk_phys_parts(phys_reader, srels, read_blobs=True):
         """
         Generate a 4-tuple `(partname, blob, reltype, srels)` for each of the
         parts in *phys_reader* by walking the relationship graph rooted at
-        srels.
-        """
-        if visited_partnames is None:
-            visited_partnames = []
-        for srel in srels:
+        srels, depth first. *blob* is |None| unless *read_blobs* is |True|.
+        The walk uses a stack of relationship iterators rather than
+        recursion, so a deep graph costs no nested generators.
+        """
+        visited_partnames = set()
+        stack = [iter(srels)]
+        while stack:
+            srel = next(stack[-1], None)
+            if srel is None:
+                stack.pop()
+                continue
             if srel.is_external:
                 continue
             partname = srel.target_partname
             if partname in visited_partnames:
                 continue
-            visited_partnames.append(partname)
-            reltype = srel.reltype
-            part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
-            yield (partname, blob, reltype, part_srels)
-            next_walker = PackageReader._walk_phys_parts(
-                phys_reader, part_srels, visited_partnames
-            )
-            for partname, blob, reltype, srels in next_walker:
-                yield (partname, blob, reltype, srels)
+            visited_partnames.add(partname)
+            with span('read_rels', partname):
+                part_srels = PackageReader._srels_for(phys_reader, partname)
+            blob = None
+            if read_blobs:
+                with span('read_part', partname) as read_span:
+                    blob = phys_reader.blob_for(partname)
+                    if read_span:
+                        read_span.record(len(blob))
+            yield (partname, blob, srel.reltype, part_srels)
+            stack.append(iter(part_srels))
 
 
 class _ContentTypeMap(object):
@@ -13,6 +13,13 @@ from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
 from .phys_pkg import PhysPkgWriter
 from .shared import CaseInsensitiveDict
 from .spec import default_content_types
+from .tracing import get_tracer, span, using
+
+
+#: Content types of parts whose payload is already compressed, such that
+#: deflating it again costs time for little or no reduction in size. Suitable
+#: as the *stored_content_types* argument to :meth:`PackageWriter.write`.
+PRECOMPRESSED_CONTENT_TYPES = frozenset((CT.GIF, CT.JPEG, CT.PNG))
 
 
 class PackageWriter(object):
@@ -23,16 +30,86 @@ class PackageWriter(object):
     be instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, compress_level=None,
+              stored_content_types=None, max_workers=None):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
         content types of the parts.
+
+        *compress_level* is the zlib compression level (0-9) for deflated
+        members, 0 storing them all without compression. When *pkg_file* is
+        the path of an existing directory, the package is written expanded
+        into it. Parts having a content type in *stored_content_types* are
+        stored without compression. When *max_workers* is not |None|, parts
+        are serialized and deflated concurrently on a pool of that many
+        threads and written to the package in order.
+        """
+        if max_workers is None:
+            phys_writer = PhysPkgWriter(pkg_file, compress_level)
+            PackageWriter._write_package(
+                phys_writer, pkg_rels, parts, stored_content_types
+            )
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers) as executor:
+            phys_writer = PhysPkgWriter(pkg_file, compress_level, executor)
+            PackageWriter._write_package(
+                phys_writer, pkg_rels, parts, stored_content_types, executor
+            )
+
+    @staticmethod
+    def iter_blobs(pkg_rels, parts):
+        """
+        Generate a ``(pack_uri, blob)`` pair for each member of a package
+        containing *pkg_rels* and *parts*, in the order they are written: the
+        content types stream, the package rels item, then each part followed
+        by its rels item if it has relationships.
+        """
+        yield CONTENT_TYPES_URI, _ContentTypesItem.from_parts(parts).blob
+        yield PACKAGE_URI.rels_uri, pkg_rels.xml
+        for part in parts:
+            yield part.partname, part.blob
+            if len(part._rels):
+                yield part.partname.rels_uri, part._rels.xml
+
+    @staticmethod
+    def iter_write(pkg_rels, parts, compress_level=None,
+                   stored_content_types=None):
+        """
+        Generate the bytes of a physical package containing *pkg_rels* and
+        *parts*, yielding the next chunk as soon as each part is written.
+        Only about one part is held in memory at a time, so the package can
+        be streamed to a destination, such as an HTTP response, without
+        first being assembled in memory. *compress_level* and
+        *stored_content_types* behave as for :meth:`write`.
+        """
+        stream = _ChunkStream()
+        phys_writer = PhysPkgWriter(stream, compress_level)
+        PackageWriter._write_content_types_stream(phys_writer, parts)
+        PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
+        yield stream.drain()
+        for part in parts:
+            PackageWriter._write_parts(
+                phys_writer, [part], stored_content_types
+            )
+            yield stream.drain()
+        phys_writer.close()
+        yield stream.drain()
+
+    @staticmethod
+    def _write_package(phys_writer, pkg_rels, parts, stored_content_types,
+                       executor=None):
+        """
+        Write the content types stream, package rels and *parts* to
+        *phys_writer* and close it.
         """
-        phys_writer = PhysPkgWriter(pkg_file)
         PackageWriter._write_content_types_stream(phys_writer, parts)
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
+        PackageWriter._write_parts(
+            phys_writer, parts, stored_content_types, executor
+        )
         phys_writer.close()
 
     @staticmethod
@@ -45,13 +122,31 @@ class PackageWriter(object):
         phys_writer.write(CONTENT_TYPES_URI, cti.blob)
 
     @staticmethod
-    def _write_parts(phys_writer, parts):
+    def _write_parts(phys_writer, parts, stored_content_types=None,
+                     executor=None):
         """
         Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
+        rels item for its relationships if and only if it has any. The blob
+        of a part having a content type in *stored_content_types* is written
+        without compression. When *executor* is provided, part blobs are
+        serialized on its workers.
         """
-        for part in parts:
-            phys_writer.write(part.partname, part.blob)
+        stored_content_types = stored_content_types or ()
+        if executor is None:
+            blobs = (_serialize(part) for part in parts)
+        else:
+            tracer = get_tracer()
+            blobs = executor.map(
+                lambda part: _serialize(part, tracer), parts
+            )
+        for part, blob in zip(parts, blobs):
+            with span('write_part', part.partname) as write_span:
+                if part.content_type in stored_content_types:
+                    phys_writer.write(part.partname, blob, False)
+                else:
+                    phys_writer.write(part.partname, blob)
+                if write_span:
+                    write_span.record(len(blob))
             if len(part._rels):
                 phys_writer.write(part.partname.rels_uri, part._rels.xml)
 
@@ -64,6 +159,47 @@ class PackageWriter(object):
         phys_writer.write(PACKAGE_URI.rels_uri, pkg_rels.xml)
 
 
+def _serialize(part, tracer=None):
+    """
+    Return the blob of *part*, timed as its ``serialize_part`` phase and
+    reported to *tracer* when it is not |None|, as it is on a worker thread.
+    """
+    with using(tracer):
+        with span('serialize_part', part.partname) as serialize_span:
+            blob = part.blob
+            if serialize_span:
+                serialize_span.record(len(blob))
+    return blob
+
+
+class _ChunkStream(object):
+    """
+    Write-only, non-seekable file-like object that accumulates the bytes
+    written to it until they are collected by :meth:`drain`. Because it
+    offers no `tell()` or `seek()`, a zip file written to it is written
+    strictly sequentially, using data descriptors.
+    """
+    def __init__(self):
+        super(_ChunkStream, self).__init__()
+        self._chunks = []
+
+    def drain(self):
+        """
+        Return the bytes written since the prior call, removing them from
+        this stream.
+        """
+        data = b''.join(self._chunks)
+        del self._chunks[:]
+        return data
+
+    def flush(self):
+        pass
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+
 class _ContentTypesItem(object):
     """
     Service class that composes a content types item ([Content_Types].xml)
@@ -0,0 +1,110 @@
+# encoding: utf-8
+
+"""
+Load profiles, selecting the parts of a package loaded when it is opened, as
+the *load* argument to :meth:`OpcPackage.open`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from .constants import RELATIONSHIP_TYPE as RT
+
+
+class LoadProfile(object):
+    """
+    Selects the parts of a package that are loaded when it is opened. A part
+    related by a relationship type in *skip_reltypes* or having a content
+    type in *skip_content_types* is skipped, as is any part not related by
+    a relationship type in *keep_reltypes* when that is not |None|.
+
+    A skipped part is not unmarshalled into its usual part class. It is kept
+    as an opaque |Part| whose blob is read only when needed, such as when the
+    package is saved, which still produces a complete package. The package
+    file is kept open for that until the package is closed or saved. The
+    API that relies on a skipped part, such as the header of a section when
+    headers are skipped, is not available.
+    """
+
+    __slots__ = ('_skip_reltypes', '_skip_content_types', '_keep_reltypes')
+
+    def __init__(self, skip_reltypes=(), skip_content_types=(),
+                 keep_reltypes=None):
+        self._skip_reltypes = frozenset(skip_reltypes)
+        self._skip_content_types = frozenset(skip_content_types)
+        self._keep_reltypes = (
+            None if keep_reltypes is None else frozenset(keep_reltypes)
+        )
+
+    @classmethod
+    def from_load(cls, load):
+        """
+        Return the |LoadProfile| for *load*, a profile, the name of one of
+        :data:`LOAD_PROFILES` or |None| for the full profile. Raises
+        |ValueError| on an unknown name.
+        """
+        if load is None:
+            return LOAD_PROFILES['full']
+        if isinstance(load, LoadProfile):
+            return load
+        try:
+            return LOAD_PROFILES[load]
+        except KeyError:
+            raise ValueError(
+                'unknown load profile %r, expected one of %s' %
+                (load, ', '.join(sorted(LOAD_PROFILES)))
+            )
+
+    def skips(self, content_type, reltype):
+        """
+        |True| if a part of *content_type*, related by *reltype*, is to be
+        skipped.
+        """
+        if reltype in self._skip_reltypes:
+            return True
+        if content_type in self._skip_content_types:
+            return True
+        keep_reltypes = self._keep_reltypes
+        return keep_reltypes is not None and reltype not in keep_reltypes
+
+    @property
+    def skips_parts(self):
+        """
+        |True| if this profile may skip any part.
+        """
+        return bool(
+            self._skip_reltypes or self._skip_content_types or
+            self._keep_reltypes is not None
+        )
+
+
+#: Relationship types of parts holding media and other binary payloads.
+MEDIA_RELTYPES = frozenset((
+    RT.AUDIO, RT.FONT, RT.IMAGE, RT.OLE_OBJECT, RT.PACKAGE, RT.THUMBNAIL,
+    RT.VIDEO,
+))
+
+#: Relationship types of parts besides media with no bearing on the text of
+#: the document body.
+NON_BODY_RELTYPES = frozenset((
+    RT.CHART, RT.COMMENTS, RT.COMMENT_AUTHORS, RT.CUSTOM_XML,
+    RT.CUSTOM_XML_PROPS, RT.DIAGRAM_COLORS, RT.DIAGRAM_DATA,
+    RT.DIAGRAM_LAYOUT, RT.DIAGRAM_QUICK_STYLE, RT.ENDNOTES, RT.FONT_TABLE,
+    RT.FOOTER, RT.FOOTNOTES, RT.GLOSSARY_DOCUMENT, RT.HEADER, RT.THEME,
+    RT.WEB_SETTINGS,
+))
+
+#: The load profiles available by name. ``'full'`` loads every part, the
+#: default. ``'no-media'`` skips images and other media. ``'text'`` also
+#: skips the parts not needed for the text of the document body, such as
+#: headers, footers, notes and comments, keeping its styles, numbering and
+#: settings. ``'metadata'`` keeps only the main document part and the
+#: document properties.
+LOAD_PROFILES = {
+    'full': LoadProfile(),
+    'no-media': LoadProfile(skip_reltypes=MEDIA_RELTYPES),
+    'text': LoadProfile(skip_reltypes=MEDIA_RELTYPES | NON_BODY_RELTYPES),
+    'metadata': LoadProfile(keep_reltypes=(
+        RT.OFFICE_DOCUMENT, RT.CORE_PROPERTIES, RT.EXTENDED_PROPERTIES,
+        RT.CUSTOM_PROPERTIES,
+    )),
+}
@@ -0,0 +1,203 @@
+# encoding: utf-8
+
+"""
+Size and memory accounting of the parts of a package, as returned by
+:meth:`OpcPackage.stats`.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from lxml import etree
+
+from ..compat import is_string
+from .part import XmlPart
+
+
+#: Approximate bytes taken by a libxml2 node (``xmlNode``) on a 64-bit build,
+#: used for each element and each text node.
+NODE_BYTES = 120
+#: Approximate bytes taken by a libxml2 attribute (``xmlAttr``), not counting
+#: the text node holding its value.
+ATTRIBUTE_BYTES = 96
+
+_count_elements = etree.XPath('count(descendant-or-self::*)')
+_count_attributes = etree.XPath('count(descendant-or-self::*/@*)')
+_count_text_nodes = etree.XPath('count(descendant::text())')
+# the lxml properties, which element classes such as CT_P override
+_text_of = etree._Element.text.__get__
+_tail_of = etree._Element.tail.__get__
+
+
+class PackageStats(object):
+    """
+    Sizes of a package. `parts` is a list of |PartStats|, one for each part
+    in the package, and `caches` a dict mapping the name of each cache kept
+    by the package, such as ``'image_parts'``, to its size.
+    """
+
+    __slots__ = ('parts', 'caches')
+
+    def __init__(self, parts, caches):
+        self.parts = parts
+        self.caches = caches
+
+    def __repr__(self):
+        return self.report()
+
+    @property
+    def compressed_size(self):
+        """
+        Total compressed size in bytes of the parts having one.
+        """
+        return sum(p.compressed_size or 0 for p in self.parts)
+
+    @property
+    def element_count(self):
+        """
+        Total number of elements in the XML trees of the parts.
+        """
+        return sum(p.element_count or 0 for p in self.parts)
+
+    @property
+    def rel_count(self):
+        """
+        Total number of relationships from the parts.
+        """
+        return sum(p.rel_count for p in self.parts)
+
+    def report(self):
+        """
+        Return a text report of the sizes of each part, largest tree first,
+        followed by the cache sizes.
+        """
+        columns = '%-38s %10s %10s %9s %10s %5s'
+        lines = [columns % (
+            'part', 'zipped', 'bytes', 'elements', 'tree', 'rels'
+        )]
+        parts = sorted(
+            self.parts, key=lambda p: (p.tree_memory or 0, p.size or 0),
+            reverse=True
+        )
+        for part in parts + [self]:
+            lines.append(columns % (
+                'total' if part is self else part.partname,
+                _blank_if_none(part.compressed_size),
+                _blank_if_none(part.size),
+                _blank_if_none(part.element_count),
+                _blank_if_none(part.tree_memory), part.rel_count,
+            ))
+        caches = [('', name, size) for name, size in self.caches.items()]
+        for part in self.parts:
+            caches.extend(
+                (part.partname, name, size)
+                for name, size in part.caches.items()
+            )
+        if caches:
+            lines.append('')
+            lines.append('%-38s %-20s %10s' % ('cache', 'name', 'size'))
+            for partname, name, size in caches:
+                lines.append('%-38s %-20s %10d' % (partname, name, size))
+        return '\n'.join(lines)
+
+    @property
+    def size(self):
+        """
+        Total uncompressed size in bytes of the parts having a known size.
+        """
+        return sum(p.size or 0 for p in self.parts)
+
+    @property
+    def tree_memory(self):
+        """
+        Total approximate memory in bytes taken by the XML trees of the
+        parts.
+        """
+        return sum(p.tree_memory or 0 for p in self.parts)
+
+
+class PartStats(object):
+    """
+    Sizes of one part. `compressed_size` is its size in bytes in the package
+    it was read from, |None| for a part added since or a package that
+    doesn't record it. `size` is its uncompressed size in bytes: that of its
+    blob for a loaded part that isn't XML, otherwise the size recorded in
+    the package, which predates any change to the part, unless the part is
+    serialized to measure it. It is |None| when unknown. `element_count`
+    and `tree_memory`, the approximate memory in bytes taken by the part's
+    XML tree, are |None| for a part that isn't XML or isn't loaded.
+    `rel_count` is the number of relationships from the part and `caches`
+    a dict mapping the name of each cache the part keeps to its size.
+    """
+
+    __slots__ = (
+        'partname', 'content_type', 'compressed_size', 'size',
+        'element_count', 'tree_memory', 'rel_count', 'caches'
+    )
+
+    def __init__(self, partname, content_type, compressed_size, size,
+                 element_count, tree_memory, rel_count, caches):
+        self.partname = partname
+        self.content_type = content_type
+        self.compressed_size = compressed_size
+        self.size = size
+        self.element_count = element_count
+        self.tree_memory = tree_memory
+        self.rel_count = rel_count
+        self.caches = caches
+
+    @classmethod
+    def from_part(cls, part, compressed_size=None, size=None,
+                  serialize=False):
+        """
+        Return a |PartStats| for *part*, stored in its package with
+        *compressed_size* bytes and *size* bytes uncompressed, if known.
+        A part not loaded yet is not loaded for it. *part* is serialized to
+        measure its size only when *serialize* is |True|, which also loads
+        it.
+        """
+        loaded = '_read_blob' not in part.__dict__
+        is_xml = isinstance(part, XmlPart)
+        element_count = tree_memory = None
+        if is_xml and loaded:
+            element_count, tree_memory = tree_stats(part.element)
+        if serialize or (loaded and not is_xml):
+            size = len(part.blob)
+        return cls(
+            part.partname, part.content_type, compressed_size, size,
+            element_count, tree_memory, len(part.rels), part._cache_sizes()
+        )
+
+
+def tree_stats(element):
+    """
+    Return an ``(element_count, memory)`` tuple for the XML tree rooted at
+    *element*, *memory* being an estimate in bytes of the libxml2 nodes and
+    strings making up the tree, not counting any Python proxy objects. The
+    nodes are counted with XPath and the lengths of the strings added up
+    node by node, so no list of the strings in the tree is built.
+    """
+    element_count = int(_count_elements(element))
+    attribute_count = int(_count_attributes(element))
+    text_count = int(_count_text_nodes(element))
+    string_size = 0
+    for node in element.iter():
+        tail = _tail_of(node)
+        if tail and node is not element:
+            string_size += len(tail)
+        if not is_string(node.tag):
+            continue
+        text = _text_of(node)
+        if text:
+            string_size += len(text)
+        for value in node.values():
+            string_size += len(value)
+    memory = (
+        element_count * NODE_BYTES +
+        attribute_count * (ATTRIBUTE_BYTES + NODE_BYTES) +
+        text_count * NODE_BYTES + string_size
+    )
+    return element_count, memory
+
+
+def _blank_if_none(value):
+    return '' if value is None else value
@@ -0,0 +1,230 @@
+# encoding: utf-8
+
+"""
+Instrumentation of the phases of opening and saving a package. A tracer
+installed with :func:`set_tracer` or :func:`trace` receives a |Span| as
+each phase, and each step on an individual part, completes. A tracer is
+installed for the current thread only, so documents opened or saved at the
+same time on other threads are not reported to it; the threads a package
+is saved on using *max_workers* report to the tracer of the saving thread.
+When no tracer is installed, which is the default, instrumented code gets
+a shared no-op span and does no further work.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+_clock = getattr(time, 'perf_counter', time.time)
+_local = threading.local()
+
+
+class Tracer(object):
+    """
+    Base class for tracers. A tracer is called with each |Span| as it ends,
+    possibly from more than one thread when a package is saved using
+    a thread pool or the tracer is installed on more than one thread.
+    """
+    def on_span(self, span):
+        """
+        Called with each *span* as it ends. Does nothing by default.
+        """
+        pass
+
+
+class TimingCollector(Tracer):
+    """
+    Tracer that keeps each span it is given and summarizes them by phase in
+    :meth:`report`.
+    """
+    def __init__(self):
+        super(TimingCollector, self).__init__()
+        self.spans = []
+
+    def on_span(self, span):
+        self.spans.append(span)
+
+    def phase_totals(self):
+        """
+        Return an ordered mapping of phase name to a ``(count, seconds,
+        size)`` tuple totalling the spans of that phase, phases in the
+        order they first ended.
+        """
+        totals = OrderedDict()
+        for span in self.spans:
+            count, seconds, size = totals.get(span.phase, (0, 0.0, 0))
+            totals[span.phase] = (
+                count + 1, seconds + span.seconds, size + (span.size or 0)
+            )
+        return totals
+
+    def report(self, slowest=10):
+        """
+        Return a text report of the time spent in each phase followed by
+        the *slowest* slowest steps on individual parts.
+        """
+        lines = ['%-26s %6s %10s %12s' % ('phase', 'count', 'seconds',
+                                          'bytes')]
+        for phase, (count, seconds, size) in self.phase_totals().items():
+            lines.append(
+                '%-26s %6d %10.4f %12d' % (phase, count, seconds, size)
+            )
+        part_spans = sorted(
+            (s for s in self.spans if s.partname is not None),
+            key=lambda s: s.seconds, reverse=True
+        )[:slowest]
+        if part_spans:
+            lines.append('')
+            lines.append('%-22s %-34s %10s %10s %9s' % (
+                'phase', 'part', 'seconds', 'bytes', 'elements'
+            ))
+            for span in part_spans:
+                lines.append('%-22s %-34s %10.4f %10s %9s' % (
+                    span.phase, span.partname, span.seconds,
+                    '' if span.size is None else span.size,
+                    '' if span.element_count is None else span.element_count
+                ))
+        return '\n'.join(lines)
+
+
+class Span(object):
+    """
+    The timing of one phase of opening or saving a package. `partname` is
+    the part the phase worked on, |None| for a phase of the whole package.
+    `size` in bytes and `element_count` are recorded where they apply and
+    are |None| otherwise.
+    """
+
+    __slots__ = (
+        '_tracer', 'phase', 'partname', 'size', 'element_count', 'start',
+        'seconds'
+    )
+
+    def __init__(self, tracer, phase, partname):
+        self._tracer = tracer
+        self.phase = phase
+        self.partname = partname
+        self.size = None
+        self.element_count = None
+        self.start = None
+        self.seconds = None
+
+    def __bool__(self):
+        return True
+
+    __nonzero__ = __bool__
+
+    def __enter__(self):
+        self.start = _clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.seconds = _clock() - self.start
+        self._tracer.on_span(self)
+
+    def count_elements(self, element):
+        """
+        Record the number of elements in the tree rooted at *element*.
+        """
+        self.element_count = sum(1 for _ in element.iter())
+
+    def record(self, size=None):
+        """
+        Record the *size* in bytes of the data this span worked on.
+        """
+        self.size = size
+
+
+class _NullSpan(object):
+    """
+    Span used when no tracer is installed. Does nothing and is falsy;
+    instrumented code records details such as sizes only on a truthy span.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def get_tracer():
+    """
+    Return the tracer installed for the current thread, |None| when tracing
+    is disabled.
+    """
+    return getattr(_local, 'tracer', None)
+
+
+def set_tracer(tracer):
+    """
+    Install *tracer* for the packages opened and saved from now on by the
+    current thread, or disable tracing when *tracer* is |None|. Return the
+    tracer it replaces.
+    """
+    previous = getattr(_local, 'tracer', None)
+    _local.tracer = tracer
+    return previous
+
+
+def span(phase, partname=None):
+    """
+    Return a context manager timing *phase*, on the part *partname* if it
+    applies to one part. The span is passed to the tracer of the current
+    thread when the block exits.
+    """
+    tracer = getattr(_local, 'tracer', None)
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(tracer, phase, partname)
+
+
+@contextmanager
+def using(tracer):
+    """
+    Context manager installing *tracer* for the current thread for the
+    duration of the block, leaving the installed tracer in place when
+    *tracer* is |None|. Used to scope the tracer passed to a call, such as
+    ``Document(path, tracer=collector)``, to that call.
+    """
+    if tracer is None:
+        yield
+        return
+    previous = set_tracer(tracer)
+    try:
+        yield
+    finally:
+        set_tracer(previous)
+
+
+@contextmanager
+def trace(tracer=None):
+    """
+    Context manager installing *tracer*, a new |TimingCollector| when
+    |None|, for the current thread for the duration of the block, e.g.::
+
+        with trace() as collector:
+            document = Document(path)
+        print(collector.report())
+    """
+    tracer = TimingCollector() if tracer is None else tracer
+    previous = set_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        set_tracer(previous)
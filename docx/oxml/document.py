@@ -5,6 +5,9 @@ Custom element classes that correspond to the document part, e.g.
 <w:document>.
 """
 
+from lxml import etree
+
+from .ns import nsmap, qn
 from .xmlchemy import BaseOxmlElement, ZeroOrOne, ZeroOrMore
 
 
@@ -14,6 +17,25 @@ class CT_Document(BaseOxmlElement):
     """
     body = ZeroOrOne('w:body')
 
+    @property
+    def last_sectPr(self):
+        """
+        Return the last ``<w:sectPr>`` element in the document, or |None| if
+        there is none. This is the sentinel ``<w:sectPr>`` ending the body
+        when it is present, in which case it is found without searching the
+        document.
+        """
+        body = self.body
+        if body is not None:
+            try:
+                last_child = body[-1]
+            except IndexError:
+                return None
+            if last_child.tag == qn('w:sectPr'):
+                return last_child
+        sectPr_lst = self.sectPr_lst
+        return sectPr_lst[-1] if sectPr_lst else None
+
     @property
     def sectPr_lst(self):
         """
@@ -32,6 +54,10 @@ class CT_Body(BaseOxmlElement):
     tbl = ZeroOrMore('w:tbl', successors=('w:sectPr',))
     sectPr = ZeroOrOne('w:sectPr', successors=())
 
+    _inline_lst = etree.XPath(
+        './/w:p/w:r/w:drawing/wp:inline', namespaces=nsmap
+    )
+
     def add_section_break(self):
         """
         Return the current ``<w:sectPr>`` element after adding a clone of it
@@ -57,3 +83,11 @@ class CT_Body(BaseOxmlElement):
             content_elms = self[:]
         for content_elm in content_elms:
             self.remove(content_elm)
+
+    @property
+    def inline_lst(self):
+        """
+        Return a list containing each ``<wp:inline>`` element in a run in
+        this body, in document order.
+        """
+        return self._inline_lst(self)
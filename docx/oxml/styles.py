@@ -4,7 +4,10 @@
 Custom element classes related to the styles part
 """
 
+from lxml import etree
+
 from ..enum.style import WD_STYLE_TYPE
+from .ns import nsmap
 from .simpletypes import ST_DecimalNumber, ST_OnOff, ST_String
 from .xmlchemy import (
     BaseOxmlElement, OptionalAttribute, RequiredAttribute, ZeroOrMore,
@@ -31,6 +34,15 @@ def styleId_from_name(name):
     }.get(name, name.replace(' ', ''))
 
 
+class CT_DocDefaults(BaseOxmlElement):
+    """
+    ``<w:docDefaults>`` element, containing the document-wide default run
+    and paragraph properties, the base of every style hierarchy.
+    """
+    rPrDefault = ZeroOrOne('w:rPrDefault', successors=('w:pPrDefault',))
+    pPrDefault = ZeroOrOne('w:pPrDefault', successors=())
+
+
 class CT_LatentStyles(BaseOxmlElement):
     """
     `w:latentStyles` element, defining behavior defaults for latent styles
@@ -105,6 +117,22 @@ class CT_LsdException(BaseOxmlElement):
         setattr(self, attr_name, value)
 
 
+class CT_PPrDefault(BaseOxmlElement):
+    """
+    ``<w:pPrDefault>`` element, containing the default paragraph properties
+    for the document in its ``<w:pPr>`` child.
+    """
+    pPr = ZeroOrOne('w:pPr', successors=())
+
+
+class CT_RPrDefault(BaseOxmlElement):
+    """
+    ``<w:rPrDefault>`` element, containing the default run properties for
+    the document in its ``<w:rPr>`` child.
+    """
+    rPr = ZeroOrOne('w:rPr', successors=())
+
+
 class CT_Style(BaseOxmlElement):
     """
     A ``<w:style>`` element, representing a style definition
@@ -292,10 +320,19 @@ class CT_Styles(BaseOxmlElement):
     styles.xml
     """
     _tag_seq = ('w:docDefaults', 'w:latentStyles', 'w:style')
+    docDefaults = ZeroOrOne('w:docDefaults', successors=_tag_seq[1:])
     latentStyles = ZeroOrOne('w:latentStyles', successors=_tag_seq[2:])
     style = ZeroOrMore('w:style', successors=())
     del _tag_seq
 
+    # compiled once; the lookup value is passed as an XPath variable
+    _style_by_id = etree.XPath(
+        'w:style[@w:styleId=$styleId]', namespaces=nsmap
+    )
+    _style_by_name = etree.XPath(
+        'w:style[w:name/@w:val=$name]', namespaces=nsmap
+    )
+
     def add_style_of_type(self, name, style_type, builtin):
         """
         Return a newly added `w:style` element having *name* and
@@ -327,9 +364,8 @@ class CT_Styles(BaseOxmlElement):
         Return the ``<w:style>`` child element having ``styleId`` attribute
         matching *styleId*, or |None| if not found.
         """
-        xpath = 'w:style[@w:styleId="%s"]' % styleId
         try:
-            return self.xpath(xpath)[0]
+            return self._style_by_id(self, styleId=styleId)[0]
         except IndexError:
             return None
 
@@ -338,9 +374,8 @@ class CT_Styles(BaseOxmlElement):
         Return the ``<w:style>`` child element having ``<w:name>`` child
         element with value *name*, or |None| if not found.
         """
-        xpath = 'w:style[w:name/@w:val="%s"]' % name
         try:
-            return self.xpath(xpath)[0]
+            return self._style_by_name(self, name=name)[0]
         except IndexError:
             return None
 
@@ -4,8 +4,11 @@
 Custom element classes related to paragraphs (CT_P).
 """
 
-from ..ns import qn
+from lxml import etree
+
+from ..ns import nsmap, qn
 from ..xmlchemy import BaseOxmlElement, OxmlElement, ZeroOrMore, ZeroOrOne
+from .run import text_from_items
 
 
 class CT_P(BaseOxmlElement):
@@ -15,6 +18,28 @@ class CT_P(BaseOxmlElement):
     pPr = ZeroOrOne('w:pPr')
     r = ZeroOrMore('w:r')
 
+    _text_items = etree.XPath(
+        'w:r/w:t/text() | w:r/w:tab | w:r/w:br | w:r/w:cr',
+        namespaces=nsmap, smart_strings=False
+    )
+
+    @classmethod
+    def new_p(cls, text='', style_id=None):
+        """
+        Return a new ``<w:p>`` element having paragraph style *style_id* and
+        containing *text* in a single run, either of which may be omitted.
+        Its children are appended directly since a new paragraph has no
+        existing children to order them against.
+        """
+        p = OxmlElement('w:p')
+        if style_id is not None:
+            pPr = etree.SubElement(p, qn('w:pPr'))
+            pStyle = etree.SubElement(pPr, qn('w:pStyle'))
+            pStyle.set(qn('w:val'), style_id)
+        if text:
+            etree.SubElement(p, qn('w:r')).text = text
+        return p
+
     def _insert_pPr(self, pPr):
         self.insert(0, pPr)
         return pPr
@@ -76,3 +101,11 @@ class CT_P(BaseOxmlElement):
     def style(self, style):
         pPr = self.get_or_add_pPr()
         pPr.style = style
+
+    @property
+    def text(self):
+        """
+        The text of the ``<w:r>`` children of this paragraph, the same as
+        concatenating the text of each run but gathered in a single pass.
+        """
+        return text_from_items(self._text_items(self))
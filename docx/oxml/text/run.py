@@ -4,7 +4,11 @@
 Custom element classes related to text runs (CT_R).
 """
 
-from ..ns import qn
+import re
+
+from lxml import etree
+
+from ..ns import nsmap, qn
 from ..simpletypes import ST_BrClear, ST_BrType
 from ..xmlchemy import (
     BaseOxmlElement, OxmlElement, OptionalAttribute, ZeroOrMore, ZeroOrOne
@@ -30,6 +34,11 @@ class CT_R(BaseOxmlElement):
     tab = ZeroOrMore('w:tab')
     drawing = ZeroOrMore('w:drawing')
 
+    _text_items = etree.XPath(
+        'w:t/text() | w:tab | w:br | w:cr', namespaces=nsmap,
+        smart_strings=False
+    )
+
     def _insert_rPr(self, rPr):
         self.insert(0, rPr)
         return rPr
@@ -47,7 +56,7 @@ class CT_R(BaseOxmlElement):
         Return a newly added ``<w:t>`` element containing *text*.
         """
         t = self._add_t(text=text)
-        if len(text.strip()) < len(text):
+        if text[:1].isspace() or text[-1:].isspace():
             t.set(qn('xml:space'), 'preserve')
         return t
 
@@ -68,6 +77,38 @@ class CT_R(BaseOxmlElement):
         for child in content_child_elms:
             self.remove(child)
 
+    def replace_text(self, start, end, text):
+        """
+        Replace the characters from *start* to *end* of the text of this run
+        with *text*. Only the ``<w:t>``, ``<w:tab/>``, ``<w:br/>`` and
+        ``<w:cr/>`` children holding those characters are rewritten, so other
+        run content such as a drawing or a field character is kept in place.
+        """
+        items, offset = [], 0
+        for child in self.iterchildren(_T, _TAB, _BR, _CR):
+            child_text = (
+                child.text or '' if child.tag == _T
+                else _TEXT_OF_ELEMENT[child.tag]
+            )
+            child_end = offset + len(child_text)
+            if child_end > start and offset < end:
+                items.append((child, child_text, offset))
+            if child_end >= end:
+                break
+            offset = child_end
+        if not items:
+            return
+        first, first_text, first_offset = items[0]
+        last, last_text, last_offset = items[-1]
+        head = first_text[:start - first_offset] + text
+        tail = last_text[end - last_offset:]
+        if first is last:
+            head, tail = head + tail, ''
+        _insert_text_before(first, head)
+        _insert_text_before(last, tail)
+        for child, _, _ in items:
+            self.remove(child)
+
     @property
     def style(self):
         """
@@ -95,16 +136,7 @@ class CT_R(BaseOxmlElement):
         child elements like ``<w:tab/>`` translated to their Python
         equivalent.
         """
-        text = ''
-        for child in self:
-            if child.tag == qn('w:t'):
-                t_text = child.text
-                text += t_text if t_text is not None else ''
-            elif child.tag == qn('w:tab'):
-                text += '\t'
-            elif child.tag in (qn('w:br'), qn('w:cr')):
-                text += '\n'
-        return text
+        return text_from_items(self._text_items(self))
 
     @text.setter
     def text(self, text):
@@ -118,6 +150,40 @@ class CT_Text(BaseOxmlElement):
     """
 
 
+_BR, _CR, _T, _TAB = qn('w:br'), qn('w:cr'), qn('w:t'), qn('w:tab')
+_XML_SPACE = qn('xml:space')
+_TEXT_OF_ELEMENT = {qn('w:tab'): '\t', qn('w:br'): '\n', qn('w:cr'): '\n'}
+
+
+def _insert_text_before(successor, text):
+    """
+    Insert the run content elements for *text* just before the run content
+    element *successor*.
+    """
+    if not text:
+        return
+    scratch = OxmlElement('w:r')
+    _RunContentAppender.append_to_run_from_text(scratch, text)
+    for element in list(scratch):
+        successor.addprevious(element)
+
+
+def text_from_items(items):
+    """
+    Return *items*, the result of evaluating an XPath expression selecting
+    the text nodes of ``<w:t>`` elements and the ``<w:tab/>``, ``<w:br/>``
+    and ``<w:cr/>`` elements of run content, joined into a single string.
+    Text is included as is, a tab element is translated to a tab and
+    a break element to a newline. Selecting the text nodes directly avoids
+    creating an element object for each ``<w:t>``.
+    """
+    return ''.join([
+        _TEXT_OF_ELEMENT[item.tag] if isinstance(item, etree._Element)
+        else item
+        for item in items
+    ])
+
+
 class _RunContentAppender(object):
     """
     Service object that knows how to translate a Python string into run
@@ -127,6 +193,9 @@ class _RunContentAppender(object):
     appended. Likewise a newline or carriage return character ('\n', '\r')
     causes a ``<w:cr>`` element to be appended.
     """
+
+    _special_chars = re.compile(r'([\t\r\n])')
+
     def __init__(self, r):
         self._r = r
         self._bfr = []
@@ -144,11 +213,26 @@ class _RunContentAppender(object):
     def add_text(self, text):
         """
         Append the run content elements corresponding to *text* to the
-        ``<w:r>`` element of this instance.
+        ``<w:r>`` element of this instance. *text* is split on tab and line
+        break characters in a single pass, so each run of regular
+        characters is appended as a whole rather than character by
+        character.
         """
-        for char in text:
-            self.add_char(char)
+        r, SubElement = self._r, etree.SubElement
         self.flush()
+        # run content elements have no successors, so each is appended
+        for segment in self._special_chars.split(text):
+            if not segment:
+                continue
+            if segment == '\t':
+                SubElement(r, _TAB)
+            elif segment in ('\r', '\n'):
+                SubElement(r, _BR)
+            else:
+                t = SubElement(r, _T)
+                t.text = segment
+                if segment[0].isspace() or segment[-1].isspace():
+                    t.set(_XML_SPACE, 'preserve')
 
     def add_char(self, char):
         """
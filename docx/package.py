@@ -10,6 +10,7 @@ from docx.image.image import Image
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
+from docx.opc.tracing import span
 from docx.parts.image import ImagePart
 from docx.shared import lazyproperty
 
@@ -23,7 +24,8 @@ class Package(OpcPackage):
         Called by loading code after all parts and relationships have been
         loaded, to afford the opportunity for any required post-processing.
         """
-        self._gather_image_parts()
+        with span('gather_image_parts'):
+            self._gather_image_parts()
 
     @lazyproperty
     def image_parts(self):
@@ -32,18 +34,39 @@ class Package(OpcPackage):
         """
         return ImageParts()
 
+    def _cache_sizes(self):
+        """
+        Return the number of image parts and the total size in bytes of
+        those loaded, an image not loaded yet taking no memory.
+        """
+        image_parts = self.image_parts
+        return {
+            'image_parts': len(image_parts),
+            'image_bytes': sum(
+                len(part.blob) for part in image_parts
+                if '_read_blob' not in part.__dict__
+            ),
+        }
+
     def _gather_image_parts(self):
         """
         Load the image part collection with all the image parts in package.
+        An image skipped by the load profile, an opaque part rather than an
+        |ImagePart|, only has its partname reserved.
         """
+        image_parts = self.image_parts
         for rel in self.iter_rels():
             if rel.is_external:
                 continue
             if rel.reltype != RT.IMAGE:
                 continue
-            if rel.target_part in self.image_parts:
+            part = rel.target_part
+            if not isinstance(part, ImagePart):
+                image_parts.reserve_partname(part.partname)
+                continue
+            if part in image_parts:
                 continue
-            self.image_parts.append(rel.target_part)
+            image_parts.append(part)
 
 
 class ImageParts(object):
@@ -54,6 +77,7 @@ class ImageParts(object):
     def __init__(self):
         super(ImageParts, self).__init__()
         self._image_parts = []
+        self._reserved_partnames = set()
 
     def __contains__(self, item):
         return self._image_parts.__contains__(item)
@@ -67,6 +91,13 @@ class ImageParts(object):
     def append(self, item):
         self._image_parts.append(item)
 
+    def reserve_partname(self, partname):
+        """
+        Keep *partname*, that of an image not in this collection, from being
+        given to an image part added to it.
+        """
+        self._reserved_partnames.add(partname)
+
     def get_or_add_image_part(self, image_descriptor):
         """
         Return an |ImagePart| instance containing the image identified by
@@ -108,8 +139,11 @@ class ImageParts(object):
         """
         def image_partname(n):
             return PackURI('/word/media/image%d.%s' % (n, ext))
-        used_numbers = [image_part.partname.idx for image_part in self]
-        for n in range(1, len(self)+1):
-            if n not in used_numbers:
-                return image_partname(n)
-        return image_partname(len(self)+1)
+        used_numbers = set(image_part.partname.idx for image_part in self)
+        used_numbers.update(
+            partname.idx for partname in self._reserved_partnames
+        )
+        n = 1
+        while n in used_numbers:
+            n += 1
+        return image_partname(n)
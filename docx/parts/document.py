@@ -43,6 +43,14 @@ class DocumentPart(XmlPart):
         """
         return Document(self._element, self)
 
+    @property
+    def format_resolver(self):
+        """
+        The |EffectiveFormatResolver| object used to compute the effective
+        formatting of runs and paragraphs in this document.
+        """
+        return self._styles_part.format_resolver
+
     def get_or_add_image(self, image_descriptor):
         """
         Return an (rId, image) 2-tuple for the image identified by
@@ -107,6 +115,16 @@ class DocumentPart(XmlPart):
             if n not in used_ids:
                 return n
 
+    def iter_save_chunks(self, compress_level=None,
+                         stored_content_types=None):
+        """
+        Return an iterator of byte strings that together form the saved
+        package of this document.
+        """
+        return self.package.iter_save_chunks(
+            compress_level, stored_content_types
+        )
+
     @lazyproperty
     def numbering_part(self):
         """
@@ -121,12 +139,15 @@ class DocumentPart(XmlPart):
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, compress_level=None,
+             stored_content_types=None, max_workers=None):
         """
         Save this document to *path_or_stream*, which can be either a path to
         a filesystem location (a string) or a file-like object.
         """
-        self.package.save(path_or_stream)
+        self.package.save(
+            path_or_stream, compress_level, stored_content_types, max_workers
+        )
 
     @property
     def settings(self):
@@ -12,7 +12,7 @@ import hashlib
 
 from docx.image.image import Image
 from docx.opc.part import Part
-from docx.shared import Emu, Inches
+from docx.shared import Emu, Inches, lazyproperty
 
 
 class ImagePart(Part):
@@ -81,9 +81,22 @@ class ImagePart(Part):
         """
         return cls(partname, content_type, blob)
 
-    @property
+    def _copy(self, package):
+        """
+        Return a new image part sharing the blob and image of this one.
+        """
+        if '_read_blob' in self.__dict__:
+            return super(ImagePart, self)._copy(package)
+        return ImagePart(
+            self._partname, self._content_type, self._blob, self._image
+        )
+
+    @lazyproperty
     def sha1(self):
         """
-        SHA1 hash digest of the blob of this image part.
+        SHA1 hash digest of the blob of this image part, computed once. The
+        blob of a part not loaded yet is read for it but not kept.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        read_blob = self.__dict__.get('_read_blob')
+        blob = self._blob if read_blob is None else read_blob()
+        return hashlib.sha1(blob).hexdigest()
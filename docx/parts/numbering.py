@@ -8,7 +8,11 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from ..opc.constants import CONTENT_TYPE as CT
+from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
+from ..oxml import parse_xml
+from ..oxml.ns import nsdecls
 from ..shared import lazyproperty
 
 
@@ -23,7 +27,9 @@ class NumberingPart(XmlPart):
         Return newly created empty numbering part, containing only the root
         ``<w:numbering>`` element.
         """
-        raise NotImplementedError
+        partname = PackURI('/word/numbering.xml')
+        element = parse_xml('<w:numbering %s/>' % nsdecls('w'))
+        return cls(partname, CT.WML_NUMBERING, element, None)
 
     @lazyproperty
     def numbering_definitions(self):
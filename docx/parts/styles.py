@@ -14,7 +14,9 @@ from ..opc.constants import CONTENT_TYPE as CT
 from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
 from ..oxml import parse_xml
-from ..styles.styles import Styles
+from ..shared import lazyproperty
+from ..styles.effective import EffectiveFormatResolver
+from ..styles.styles import Styles, StyleIndex
 
 
 class StylesPart(XmlPart):
@@ -33,13 +35,43 @@ class StylesPart(XmlPart):
         element = parse_xml(cls._default_styles_xml())
         return cls(partname, content_type, element, package)
 
+    @lazyproperty
+    def format_resolver(self):
+        """
+        |EffectiveFormatResolver| instance computing effective run and
+        paragraph formatting from the styles of this part. It caches the
+        flattened properties of each style as they are first used.
+        """
+        return EffectiveFormatResolver(self.element, self.style_index)
+
     @property
     def styles(self):
         """
         The |_Styles| instance containing the styles (<w:style> element
         proxies) for this styles part.
         """
-        return Styles(self.element)
+        return Styles(self.element, self.style_index)
+
+    @lazyproperty
+    def style_index(self):
+        """
+        |StyleIndex| instance indexing the styles of this part by name and
+        by style id, shared by each |Styles| object for this part so lookups
+        such as assigning a style by name don't search the XML each time.
+        """
+        return StyleIndex(self.element)
+
+    def _cache_sizes(self):
+        """
+        Return the number of entries in the style index and the format
+        resolver, those not yet created being left out.
+        """
+        sizes = {}
+        for name in ('style_index', 'format_resolver'):
+            cache = getattr(self, '_%s' % name, None)
+            if cache is not None:
+                sizes[name] = len(cache)
+        return sizes
 
     @classmethod
     def _default_styles_xml(cls):
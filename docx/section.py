@@ -12,8 +12,12 @@ from collections import Sequence
 class Sections(Sequence):
     """
     Sequence of |Section| objects corresponding to the sections in the
-    document. Supports ``len()``, iteration, and indexed access.
+    document. Supports ``len()``, iteration, and indexed access. The last
+    section, ``sections[-1]``, is found without searching the document.
     """
+
+    __slots__ = ('_document_elm',)
+
     def __init__(self, document_elm):
         super(Sections, self).__init__()
         self._document_elm = document_elm
@@ -22,6 +26,11 @@ class Sections(Sequence):
         if isinstance(key, slice):
             sectPr_lst = self._document_elm.sectPr_lst[key]
             return [Section(sectPr) for sectPr in sectPr_lst]
+        if key == -1:
+            sectPr = self._document_elm.last_sectPr
+            if sectPr is None:
+                raise IndexError('section index out of range')
+            return Section(sectPr)
         sectPr = self._document_elm.sectPr_lst[key]
         return Section(sectPr)
 
@@ -37,6 +46,9 @@ class Section(object):
     """
     Document section, providing access to section and page setup settings.
     """
+
+    __slots__ = ('_sectPr',)
+
     def __init__(self, sectPr):
         super(Section, self).__init__()
         self._sectPr = sectPr
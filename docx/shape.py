@@ -11,14 +11,22 @@ from __future__ import (
 
 from .enum.shape import WD_INLINE_SHAPE
 from .oxml.ns import nsmap
-from .shared import Parented
+from .shared import Emu, Parented
+
+
+_PICTURE_TYPES = (WD_INLINE_SHAPE.PICTURE, WD_INLINE_SHAPE.LINKED_PICTURE)
 
 
 class InlineShapes(Parented):
     """
     Sequence of |InlineShape| instances, supporting len(), iteration, and
-    indexed access.
+    indexed access. Each use finds the inline shapes in the document afresh,
+    in a single pass, so iterate over the shapes rather than index them up
+    to their count, which searches the document for each of them.
     """
+
+    __slots__ = ('_body',)
+
     def __init__(self, body_elm, parent):
         super(InlineShapes, self).__init__(parent)
         self._body = body_elm
@@ -28,23 +36,41 @@ class InlineShapes(Parented):
         Provide indexed access, e.g. 'inline_shapes[idx]'
         """
         try:
-            inline = self._inline_lst[idx]
+            inline = self._body.inline_lst[idx]
         except IndexError:
             msg = "inline shape index [%d] out of range" % idx
             raise IndexError(msg)
         return InlineShape(inline)
 
     def __iter__(self):
-        return (InlineShape(inline) for inline in self._inline_lst)
+        return (InlineShape(inline) for inline in self._body.inline_lst)
 
     def __len__(self):
-        return len(self._inline_lst)
+        return len(self._body.inline_lst)
 
-    @property
-    def _inline_lst(self):
-        body = self._body
-        xpath = '//w:p/w:r/w:drawing/wp:inline'
-        return body.xpath(xpath)
+    def resize_all(self, max_width=None, max_height=None):
+        """
+        Scale down each picture wider than *max_width* or taller than
+        *max_height*, both |Length| values or |None| for no limit,
+        preserving its aspect ratio, in a single pass over the shapes.
+        Return the number of pictures resized.
+        """
+        resized = 0
+        for shape in list(self):
+            if shape.type not in _PICTURE_TYPES:
+                continue
+            cx, cy = shape.width, shape.height
+            scale = 1.0
+            if max_width is not None and cx > max_width:
+                scale = max_width / cx
+            if max_height is not None and cy * scale > max_height:
+                scale = max_height / cy
+            if scale == 1.0:
+                continue
+            shape.width = Emu(int(cx * scale))
+            shape.height = Emu(int(cy * scale))
+            resized += 1
+        return resized
 
 
 class InlineShape(object):
@@ -52,6 +78,9 @@ class InlineShape(object):
     Proxy for an ``<wp:inline>`` element, representing the container for an
     inline graphical object.
     """
+
+    __slots__ = ('_inline',)
+
     def __init__(self, inline):
         super(InlineShape, self).__init__()
         self._inline = inline
@@ -238,6 +238,9 @@ class Parented(object):
     such as add or drop a relationship. Provides ``self._parent`` attribute
     to subclasses.
     """
+
+    __slots__ = ('_parent',)
+
     def __init__(self, parent):
         super(Parented, self).__init__()
         self._parent = parent
@@ -0,0 +1,303 @@
+# encoding: utf-8
+
+"""
+:func:`split`, streaming the body of a document into a new document for
+each chapter or section.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import copy
+
+from lxml import etree
+
+from .composer import Composer
+from .opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from .opc.packuri import PackURI
+from .oxml import OxmlElement, element_class_lookup, parse_xml
+from .oxml.ns import qn
+from .package import Package
+from .parts.document import DocumentPart
+from .parts.styles import StylesPart
+from .shared import lazyproperty
+from .table import Table
+from .text.paragraph import Paragraph
+
+
+#: The values of *by* naming a way of splitting for :func:`split`.
+SPLIT_BY = ('heading1', 'section')
+
+#: Relationship types of the document-level parts each chunk gets a copy of.
+_COPIED_RELTYPES = (RT.SETTINGS, RT.THEME, RT.FONT_TABLE, RT.WEB_SETTINGS)
+
+#: Bytes of the main document part read and parsed at a time.
+_READ_SIZE = 64 * 1024
+
+_BODY = qn('w:body')
+_P = qn('w:p')
+_PPR_SECTPR = '%s/%s' % (qn('w:pPr'), qn('w:sectPr'))
+_SECTPR = qn('w:sectPr')
+_TBL = qn('w:tbl')
+
+
+def split(docx, by='heading1'):
+    """
+    Generate a |Document| for each chunk of the body of the ``.docx``
+    package *docx*, a path, file-like object or buffer as accepted by
+    :func:`docx.Document`. *by* is ``'heading1'`` to start a chunk at each
+    paragraph styled Heading 1, ``'section'`` to end one at each section
+    break, or a callable taking each |Paragraph| and |Table| of the body
+    and returning |True| for one starting a new chunk.
+
+    The main document part is parsed as a stream, each body element being
+    moved into the chunk being built as soon as it is read, so memory is
+    bounded by the largest chunk rather than the whole document. A chunk
+    holds only the styles, numbering definitions, images and other parts
+    its content references, plus copies of the settings, theme and font
+    table of *docx*, and takes the section properties in effect at its
+    end. A quick first pass over the part collects those section
+    properties. Each part of *docx* a chunk copies is read into the chunk
+    alone, so the parts of *docx* are not kept in memory either. As for
+    :func:`docx.compose`, the footnote, endnote and comment references in
+    the body are dropped from the chunks, their parts not being copied.
+
+    Raises |ValueError| on the call, not on the first chunk, when *by* is
+    none of these.
+    """
+    if not (by in SPLIT_BY or callable(by)):
+        raise ValueError(
+            'unknown split %r, expected one of %s or a callable' %
+            (by, ', '.join(SPLIT_BY))
+        )
+    return _iter_chunks(docx, by)
+
+
+def _iter_chunks(docx, by):
+    """
+    Generate the chunks of *docx* for :func:`split`, *by* having been
+    checked.
+    """
+    starts_chunk = by if callable(by) else None
+    package = Package.open(docx, lazy=True)
+    try:
+        splitter = _Splitter(package)
+        if by == 'heading1':
+            starts_chunk = splitter.is_heading1
+        for document in splitter.iter_chunks(starts_chunk):
+            yield document
+    finally:
+        package.close()
+
+
+class _Splitter(object):
+    """
+    Splits the body of the lazily opened *package*, building each chunk from
+    the parts of *package*.
+    """
+    def __init__(self, package):
+        super(_Splitter, self).__init__()
+        self._package = package
+        self._part = package.main_document_part
+        self._document_xml = None
+
+    def is_heading1(self, block):
+        """
+        |True| if *block*, a |Paragraph| or |Table|, is a paragraph styled
+        Heading 1. Always |False| when the source has no Heading 1 style.
+        """
+        heading1_id = self._heading1_id
+        return (
+            heading1_id is not None and isinstance(block, Paragraph) and
+            block._p.style == heading1_id
+        )
+
+    def iter_chunks(self, starts_chunk):
+        """
+        Generate a |Document| for each chunk of the body, a new chunk being
+        started at each block for which *starts_chunk* returns |True|, or
+        after each section break when *starts_chunk* is |None|.
+        """
+        sectPrs = self._section_properties()
+        section_idx = 0
+        blocks = []
+        for block in self._iter_blocks():
+            if block.tag == _SECTPR:
+                continue
+            if starts_chunk is not None and blocks:
+                proxy = self._proxy(block)
+                if proxy is not None and starts_chunk(proxy):
+                    yield self._chunk(blocks, sectPrs, section_idx)
+                    blocks = []
+            blocks.append(block)
+            if _sectPr_of(block) is None:
+                continue
+            if starts_chunk is None:
+                yield self._chunk(blocks, sectPrs, section_idx)
+                blocks = []
+            section_idx += 1
+        if blocks:
+            yield self._chunk(blocks, sectPrs, section_idx)
+
+    def _chunk(self, blocks, sectPrs, section_idx):
+        """
+        Return a new |Document| holding *blocks*, closed by the section
+        properties of the last of them, or those of section *section_idx*
+        in *sectPrs*.
+        """
+        document = self._new_document()
+        sectPr = _sectPr_of(blocks[-1])
+        if sectPr is not None:
+            sectPr.getparent().remove(sectPr)
+        elif section_idx < len(sectPrs):
+            sectPr = copy.deepcopy(sectPrs[section_idx])
+        composer = Composer(document)
+        for reltype in _COPIED_RELTYPES:
+            composer.copy_related_part(self._part, reltype)
+        composer.append_elements(
+            self._part, blocks if sectPr is None else blocks + [sectPr]
+        )
+        for part in document.part.package.iter_parts():
+            part._load_content()
+        return document
+
+    @lazyproperty
+    def _heading1_id(self):
+        """
+        The style id of the Heading 1 style, |None| if there is none.
+        """
+        try:
+            return self._part.styles['Heading 1'].style_id
+        except KeyError:
+            return None
+
+    def _iter_blocks(self):
+        """
+        Generate each child element of the `w:body` element of the main
+        document part as soon as it has been parsed, the part being fed to
+        the parser as it is read from the package file. Every child of the
+        body but the last is complete, so Python code runs once per block
+        rather than once per element. A block is removed from the tree once
+        the next one is requested, unless it has been moved out of it.
+        """
+        stream = self._package.stream_for(self._part.partname)
+        parser = etree.XMLPullParser(
+            events=('start',), tag=_BODY, remove_blank_text=True,
+            resolve_entities=False
+        )
+        parser.set_element_class_lookup(element_class_lookup)
+        body = None
+        try:
+            while True:
+                data = stream.read(_READ_SIZE)
+                if data:
+                    parser.feed(data)
+                else:
+                    parser.close()
+                if body is None:
+                    for _, body in parser.read_events():
+                        self._set_document_xml(body.getparent())
+                    if body is None:
+                        continue
+                for _ in range(len(body) - 1 if data else len(body)):
+                    block = body[0]
+                    yield block
+                    if block.getparent() is body:
+                        body.remove(block)
+                if not data:
+                    break
+        finally:
+            stream.close()
+
+    def _new_document(self):
+        """
+        Return a new, empty |Document| in a package of its own, having only
+        the document defaults, latent styles and default styles of the
+        source and a copy of its core properties.
+        """
+        package = Package()
+        element = parse_xml(self._document_xml)
+        element.append(OxmlElement('w:body'))
+        document_part = DocumentPart(
+            PackURI('/word/document.xml'), CT.WML_DOCUMENT_MAIN, element,
+            package
+        )
+        package.relate_to(document_part, RT.OFFICE_DOCUMENT)
+        try:
+            core_properties_part = self._package.part_related_by(
+                RT.CORE_PROPERTIES
+            )
+        except KeyError:
+            pass
+        else:
+            package.relate_to(
+                core_properties_part._copy(package), RT.CORE_PROPERTIES
+            )
+        document_part.relate_to(
+            StylesPart(
+                PackURI('/word/styles.xml'), CT.WML_STYLES,
+                self._styles_xml(), package
+            ), RT.STYLES
+        )
+        return document_part.document
+
+    def _proxy(self, block):
+        """
+        Return a |Paragraph| or |Table| proxy for the body element *block*,
+        |None| for any other element.
+        """
+        if block.tag == _P:
+            return Paragraph(block, self._part)
+        if block.tag == _TBL:
+            return Table(block, self._part)
+        return None
+
+    def _section_properties(self):
+        """
+        Return a copy of the `w:sectPr` element of each section of the body,
+        in order, read in a first pass over the part.
+        """
+        sectPrs = []
+        for block in self._iter_blocks():
+            sectPr = block if block.tag == _SECTPR else _sectPr_of(block)
+            if sectPr is not None:
+                sectPrs.append(copy.deepcopy(sectPr))
+        return sectPrs
+
+    def _set_document_xml(self, document):
+        """
+        Keep the XML of the `w:document` element *document* without its
+        children, the root element of each chunk.
+        """
+        if self._document_xml is None:
+            self._document_xml = etree.tostring(etree.Element(
+                document.tag, dict(document.attrib), nsmap=document.nsmap
+            ))
+
+    def _styles_xml(self):
+        """
+        Return a new `w:styles` element having a copy of the document
+        defaults, latent styles and default styles of the source.
+        """
+        source = self._part._styles_part.element
+        styles = parse_xml(etree.tostring(etree.Element(
+            source.tag, dict(source.attrib), nsmap=source.nsmap
+        )))
+        for child in (source.docDefaults, source.latentStyles):
+            if child is not None:
+                styles.append(copy.deepcopy(child))
+        for style in source.style_lst:
+            if style.default:
+                styles.append(copy.deepcopy(style))
+        return styles
+
+
+def _sectPr_of(block):
+    """
+    Return the `w:sectPr` of *block* when it is a paragraph ending
+    a section, |None| otherwise.
+    """
+    if block.tag != _P:
+        return None
+    return block.find(_PPR_SECTPR)
@@ -0,0 +1,269 @@
+# encoding: utf-8
+
+"""
+Resolution of the effective formatting of runs and paragraphs, the values
+that apply once the style hierarchy is taken into account.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+from ..enum.style import WD_STYLE_TYPE
+from ..oxml.ns import qn
+from ..text.font import Font
+from ..text.parfmt import ParagraphFormat
+
+
+FONT_PROPERTIES = (
+    'all_caps', 'bold', 'complex_script', 'cs_bold', 'cs_italic',
+    'double_strike', 'emboss', 'hidden', 'highlight_color', 'imprint',
+    'italic', 'math', 'name', 'no_proof', 'outline', 'rtl', 'shadow', 'size',
+    'small_caps', 'snap_to_grid', 'spec_vanish', 'strike', 'subscript',
+    'superscript', 'underline', 'web_hidden',
+)
+
+PARAGRAPH_FORMAT_PROPERTIES = (
+    'alignment', 'first_line_indent', 'keep_together', 'keep_with_next',
+    'left_indent', 'line_spacing', 'line_spacing_rule', 'page_break_before',
+    'right_indent', 'space_after', 'space_before', 'widow_control',
+)
+
+
+class EffectiveFormatResolver(object):
+    """
+    Computes the effective character formatting of a run and the effective
+    paragraph formatting of a paragraph. Formatting is layered, lowest
+    priority first, from the document defaults (`w:docDefaults`), the
+    paragraph style, the character style and finally the formatting applied
+    directly to the run or paragraph. Each style's properties are flattened
+    along its `basedOn` chain once and cached by style id, as is each
+    paragraph style/character style combination, so resolving the
+    formatting of a run costs little more than reading its direct
+    formatting.
+
+    Style definitions are read when first needed. Call :meth:`clear` after
+    changing style definitions or document defaults so later resolution
+    reflects the change. Table styles are not taken into account.
+    """
+    def __init__(self, styles_elm, style_index):
+        super(EffectiveFormatResolver, self).__init__()
+        self._styles = styles_elm
+        self._style_index = style_index
+        self._style_props = {}
+        self._run_props = {}
+        self._default_props = None
+
+    def __len__(self):
+        """
+        Number of style and run property sets cached.
+        """
+        return len(self._style_props) + len(self._run_props)
+
+    def clear(self):
+        """
+        Discard all cached style properties.
+        """
+        self._style_props.clear()
+        self._run_props.clear()
+        self._default_props = None
+
+    def font(self, r):
+        """
+        Return an |EffectiveFont| object for the `w:r` element *r*.
+        """
+        p = next(r.iterancestors(qn('w:p')), None)
+        key = (None if p is None else p.style, r.style)
+        props = self._run_props.get(key)
+        if props is None:
+            props = self._run_props[key] = self._run_style_props(*key)
+        direct_props = _font_props(r)
+        if direct_props:
+            props = _merged(props, direct_props)
+        return EffectiveFont(props)
+
+    def paragraph_format(self, p):
+        """
+        Return an |EffectiveParagraphFormat| object for the `w:p` element
+        *p*.
+        """
+        props = self._paragraph_style_props(p.style)
+        direct_props = _paragraph_format_props(p)
+        if direct_props:
+            props = _merged(props, direct_props)
+        return EffectiveParagraphFormat(props)
+
+    @property
+    def _defaults(self):
+        """
+        (font_props, paragraph_format_props) pair for the document defaults.
+        """
+        if self._default_props is None:
+            docDefaults = self._styles.docDefaults
+            rPrDefault = pPrDefault = None
+            if docDefaults is not None:
+                rPrDefault = docDefaults.rPrDefault
+                pPrDefault = docDefaults.pPrDefault
+            self._default_props = (
+                {} if rPrDefault is None else _font_props(rPrDefault),
+                {} if pPrDefault is None else
+                _paragraph_format_props(pPrDefault),
+            )
+        return self._default_props
+
+    def _flattened(self, style_id):
+        """
+        (font_props, paragraph_format_props) pair for the style having
+        *style_id*, including the properties it inherits through its
+        `basedOn` chain. A pair of empty dicts is returned for a style that
+        is not defined.
+        """
+        if style_id in self._style_props:
+            return self._style_props[style_id]
+        # placeholder guards against a basedOn cycle
+        self._style_props[style_id] = ({}, {})
+        style = (
+            None if style_id is None else
+            self._style_index.get_by_id(style_id)
+        )
+        if style is None:
+            return self._style_props[style_id]
+        base_font, base_parfmt = self._flattened(style.basedOn_val)
+        flattened = (
+            _merged(base_font, _font_props(style)),
+            _merged(base_parfmt, _paragraph_format_props(style)),
+        )
+        self._style_props[style_id] = flattened
+        return flattened
+
+    def _paragraph_style_props(self, style_id):
+        """
+        Paragraph format properties of paragraph style *style_id* layered
+        over the document defaults.
+        """
+        style_id = self._style_id_or_default(
+            style_id, WD_STYLE_TYPE.PARAGRAPH
+        )
+        return _merged(self._defaults[1], self._flattened(style_id)[1])
+
+    def _run_style_props(self, p_style_id, r_style_id):
+        """
+        Font properties for a run having character style *r_style_id* in
+        a paragraph having paragraph style *p_style_id*, layered over the
+        document defaults.
+        """
+        p_style_id = self._style_id_or_default(
+            p_style_id, WD_STYLE_TYPE.PARAGRAPH
+        )
+        r_style_id = self._style_id_or_default(
+            r_style_id, WD_STYLE_TYPE.CHARACTER
+        )
+        props = dict(self._defaults[0])
+        props.update(self._flattened(p_style_id)[0])
+        props.update(self._flattened(r_style_id)[0])
+        return props
+
+    def _style_id_or_default(self, style_id, style_type):
+        """
+        *style_id* if a style having that id is defined, otherwise the id of
+        the default style of *style_type*, |None| if there isn't one.
+        """
+        if style_id is not None:
+            if self._style_index.get_by_id(style_id) is not None:
+                return style_id
+        default = self._style_index.default_for(style_type)
+        return None if default is None else default.styleId
+
+
+class _EffectiveFormat(object):
+    """
+    Base class for read-only formatting value objects. Each property
+    returns the effective value, or |None| where no level of the style
+    hierarchy specifies it.
+    """
+
+    __slots__ = ('_props',)
+
+    def __init__(self, props):
+        self._props = props
+
+    @property
+    def properties(self):
+        """
+        Dict of the properties having an effective value, keyed by property
+        name.
+        """
+        return dict(self._props)
+
+
+class EffectiveFont(_EffectiveFormat):
+    """
+    Effective character formatting of a run. Provides read-only properties
+    having the same names and value types as those of |Font|, such as
+    `bold`, `name` and `size`.
+    """
+
+    __slots__ = ()
+
+
+class EffectiveParagraphFormat(_EffectiveFormat):
+    """
+    Effective paragraph formatting of a paragraph. Provides read-only
+    properties having the same names and value types as those of
+    |ParagraphFormat|, such as `alignment` and `space_after`.
+    """
+
+    __slots__ = ()
+
+
+def _effective_property(name):
+    def get_value(obj):
+        return obj._props.get(name)
+    return property(get_value, doc='Effective value of ``%s``.' % name)
+
+
+for _name in FONT_PROPERTIES:
+    setattr(EffectiveFont, _name, _effective_property(_name))
+for _name in PARAGRAPH_FORMAT_PROPERTIES:
+    setattr(EffectiveParagraphFormat, _name, _effective_property(_name))
+del _name
+
+
+def _font_props(rPr_parent):
+    """
+    Dict of the character properties directly specified by the `w:rPr`
+    child of *rPr_parent*.
+    """
+    if rPr_parent.rPr is None:
+        return {}
+    return _specified_props(Font(rPr_parent), FONT_PROPERTIES)
+
+
+def _merged(props, overrides):
+    """
+    Return a new dict containing *props* updated with *overrides*.
+    """
+    merged = dict(props)
+    merged.update(overrides)
+    return merged
+
+
+def _paragraph_format_props(pPr_parent):
+    """
+    Dict of the paragraph properties directly specified by the `w:pPr`
+    child of *pPr_parent*.
+    """
+    if pPr_parent.pPr is None:
+        return {}
+    return _specified_props(
+        ParagraphFormat(pPr_parent), PARAGRAPH_FORMAT_PROPERTIES
+    )
+
+
+def _specified_props(proxy, names):
+    props = {}
+    for name in names:
+        value = getattr(proxy, name)
+        if value is not None:
+            props[name] = value
+    return props
@@ -15,10 +15,11 @@ from ..text.font import Font
 from ..text.parfmt import ParagraphFormat
 
 
-def StyleFactory(style_elm):
+def StyleFactory(style_elm, parent=None):
     """
     Return a style object of the appropriate |BaseStyle| subclass, according
-    to the type of *style_elm*.
+    to the type of *style_elm*. *parent* is the |Styles| object the style is
+    obtained from, if any, which is told when the style is deleted.
     """
     style_cls = {
         WD_STYLE_TYPE.PARAGRAPH: _ParagraphStyle,
@@ -27,7 +28,7 @@ def StyleFactory(style_elm):
         WD_STYLE_TYPE.LIST:      _NumberingStyle
     }[style_elm.type]
 
-    return style_cls(style_elm)
+    return style_cls(style_elm, parent)
 
 
 class BaseStyle(ElementProxy):
@@ -57,7 +58,10 @@ class BaseStyle(ElementProxy):
         rendered using the default style, as is any content with a style not
         defined in the document.
         """
-        self._element.delete()
+        element = self._element
+        element.delete()
+        if self._parent is not None:
+            self._parent._forget(element)
         self._element = None
 
     @property
@@ -186,7 +190,7 @@ class _CharacterStyle(BaseStyle):
         base_style = self._element.base_style
         if base_style is None:
             return None
-        return StyleFactory(base_style)
+        return StyleFactory(base_style, self._parent)
 
     @base_style.setter
     def base_style(self, style):
@@ -227,7 +231,7 @@ class _ParagraphStyle(_CharacterStyle):
             return self
         if next_style_elm.type != WD_STYLE_TYPE.PARAGRAPH:
             return self
-        return StyleFactory(next_style_elm)
+        return StyleFactory(next_style_elm, self._parent)
 
     @next_paragraph_style.setter
     def next_paragraph_style(self, style):
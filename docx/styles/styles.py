@@ -23,17 +23,18 @@ class Styles(ElementProxy):
     iteration, and dictionary-style access by style name.
     """
 
-    __slots__ = ()
+    __slots__ = ('_index',)
+
+    def __init__(self, element, index=None):
+        super(Styles, self).__init__(element)
+        self._index = StyleIndex(element) if index is None else index
 
     def __contains__(self, name):
         """
         Enables `in` operator on style name.
         """
         internal_name = BabelFish.ui2internal(name)
-        for style in self._element.style_lst:
-            if style.name_val == internal_name:
-                return True
-        return False
+        return self._index.get_by_name(internal_name) is not None
 
     def __getitem__(self, key):
         """
@@ -41,23 +42,23 @@ class Styles(ElementProxy):
         deprecated, triggers a warning, and will be removed in a near-future
         release.
         """
-        style_elm = self._element.get_by_name(BabelFish.ui2internal(key))
+        style_elm = self._index.get_by_name(BabelFish.ui2internal(key))
         if style_elm is not None:
-            return StyleFactory(style_elm)
+            return StyleFactory(style_elm, self)
 
-        style_elm = self._element.get_by_id(key)
+        style_elm = self._index.get_by_id(key)
         if style_elm is not None:
             msg = (
                 'style lookup by style_id is deprecated. Use style name as '
                 'key instead.'
             )
             warn(msg, UserWarning)
-            return StyleFactory(style_elm)
+            return StyleFactory(style_elm, self)
 
         raise KeyError("no style with name '%s'" % key)
 
     def __iter__(self):
-        return (StyleFactory(style) for style in self._element.style_lst)
+        return (StyleFactory(style, self) for style in self._element.style_lst)
 
     def __len__(self):
         return len(self._element.style_lst)
@@ -74,17 +75,18 @@ class Styles(ElementProxy):
         style = self._element.add_style_of_type(
             style_name, style_type, builtin
         )
-        return StyleFactory(style)
+        self._index.add(style)
+        return StyleFactory(style, self)
 
     def default(self, style_type):
         """
         Return the default style for *style_type* or |None| if no default is
         defined for that type (not common).
         """
-        style = self._element.default_for(style_type)
+        style = self._index.default_for(style_type)
         if style is None:
             return None
-        return StyleFactory(style)
+        return StyleFactory(style, self)
 
     def get_by_id(self, style_id, style_type):
         """
@@ -122,16 +124,23 @@ class Styles(ElementProxy):
         """
         return LatentStyles(self._element.get_or_add_latentStyles())
 
+    def _forget(self, style_elm):
+        """
+        Drop *style_elm*, just deleted by its style object, from the style
+        index.
+        """
+        self._index.remove(style_elm)
+
     def _get_by_id(self, style_id, style_type):
         """
         Return the style of *style_type* matching *style_id*. Returns the
         default for *style_type* if *style_id* is not found or if the style
         having *style_id* is not of *style_type*.
         """
-        style = self._element.get_by_id(style_id)
+        style = self._index.get_by_id(style_id)
         if style is None or style.type != style_type:
             return self.default(style_type)
-        return StyleFactory(style)
+        return StyleFactory(style, self)
 
     def _get_style_id_from_name(self, style_name, style_type):
         """
@@ -155,3 +164,147 @@ class Styles(ElementProxy):
         if style == self.default(style_type):
             return None
         return style.style_id
+
+
+class StyleIndex(object):
+    """
+    Dictionary indexes of the `w:style` elements in a `w:styles` element by
+    name and by style id, plus the default style of each type. The indexes
+    are built on first use and kept current by :meth:`add` and
+    :meth:`remove`, which |Styles| calls as styles are added and deleted
+    through it. Each hit is checked against the XML and a miss falls back to
+    searching the XML, so styles removed, renamed, or added directly in the
+    XML are still found correctly, just without the benefit of the index.
+    """
+    def __init__(self, styles_elm):
+        super(StyleIndex, self).__init__()
+        self._styles = styles_elm
+        self._by_id = None
+        self._by_name = None
+        self._defaults = {}
+
+    def __len__(self):
+        """
+        Number of entries in the id and name indexes, zero until they are
+        built.
+        """
+        if self._by_id is None:
+            return 0
+        return len(self._by_id) + len(self._by_name)
+
+    def add(self, style):
+        """
+        Add the `w:style` element *style*, newly added to the styles
+        element, to the indexes.
+        """
+        if self._by_id is None:
+            return
+        self._index_style(style)
+
+    def remove(self, style):
+        """
+        Remove the `w:style` element *style*, just removed from the styles
+        element, from the indexes.
+        """
+        for index in (self._by_id, self._by_name, self._defaults):
+            if not index:
+                continue
+            for key in [k for k, v in index.items() if v is style]:
+                del index[key]
+
+    def default_for(self, style_type):
+        """
+        Return the default `w:style` element for *style_type* or |None| if
+        there is no default for that type. Only a style found is cached, and
+        it is used only while it is still in the styles element and still
+        marked as the default.
+        """
+        style = self._defaults.get(style_type)
+        if (
+            style is not None and style.default and
+            style.getparent() is self._styles
+        ):
+            return style
+        style = self._styles.default_for(style_type)
+        if style is None:
+            self._defaults.pop(style_type, None)
+        else:
+            self._defaults[style_type] = style
+        return style
+
+    def get_by_id(self, style_id):
+        """
+        Return the `w:style` element having *style_id*, or |None| if not
+        found.
+        """
+        style = self._id_map.get(style_id)
+        if style is not None and self._is_current(style, style_id, None):
+            return style
+        style = self._styles.get_by_id(style_id)
+        self._update(self._by_id, style_id, style)
+        return style
+
+    def get_by_name(self, name):
+        """
+        Return the `w:style` element having internal style name *name*, or
+        |None| if not found.
+        """
+        style = self._name_map.get(name)
+        if style is not None and self._is_current(style, None, name):
+            return style
+        style = self._styles.get_by_name(name)
+        self._update(self._by_name, name, style)
+        return style
+
+    @property
+    def _id_map(self):
+        if self._by_id is None:
+            self._build()
+        return self._by_id
+
+    def _build(self):
+        """
+        Populate the indexes from the `w:style` children of the styles
+        element in a single pass.
+        """
+        self._by_id, self._by_name = {}, {}
+        for style in self._styles.style_lst:
+            self._index_style(style)
+
+    def _index_style(self, style):
+        """
+        Add *style* to the id and name indexes. The first style in document
+        order wins on a duplicate key, matching an XPath search.
+        """
+        style_id, name = style.styleId, style.name_val
+        if style_id is not None:
+            self._by_id.setdefault(style_id, style)
+        if name is not None:
+            self._by_name.setdefault(name, style)
+
+    def _is_current(self, style, style_id, name):
+        """
+        |True| if *style* is still a child of the styles element and still
+        has the *style_id* or *name* it is indexed under.
+        """
+        if style.getparent() is not self._styles:
+            return False
+        if name is not None:
+            return style.name_val == name
+        return style.styleId == style_id
+
+    @property
+    def _name_map(self):
+        if self._by_name is None:
+            self._build()
+        return self._by_name
+
+    @staticmethod
+    def _update(index, key, style):
+        """
+        Correct the entry for *key* in *index* to *style* found by search.
+        """
+        if style is None:
+            index.pop(key, None)
+        else:
+            index[key] = style
@@ -16,6 +16,9 @@ class Table(Parented):
     """
     Proxy class for a WordprocessingML ``<w:tbl>`` element.
     """
+
+    __slots__ = ('_element', '_tbl', '_columns', '_rows')
+
     def __init__(self, tbl, parent):
         super(Table, self).__init__(parent)
         self._element = self._tbl = tbl
@@ -193,6 +196,9 @@ class _Cell(BlockItemContainer):
     """
     Table cell
     """
+
+    __slots__ = ('_tc',)
+
     def __init__(self, tc, parent):
         super(_Cell, self).__init__(tc, parent)
         self._tc = tc
@@ -256,7 +262,7 @@ class _Cell(BlockItemContainer):
         a string to this property replaces all existing content with a single
         paragraph containing the assigned text in a single run.
         """
-        return '\n'.join(p.text for p in self.paragraphs)
+        return '\n'.join(p.text for p in self._tc.p_lst)
 
     @text.setter
     def text(self, text):
@@ -286,6 +292,9 @@ class _Column(Parented):
     """
     Table column
     """
+
+    __slots__ = ('_gridCol',)
+
     def __init__(self, gridCol, parent):
         super(_Column, self).__init__(parent)
         self._gridCol = gridCol
@@ -329,6 +338,9 @@ class _Columns(Parented):
     Sequence of |_Column| instances corresponding to the columns in a table.
     Supports ``len()``, iteration and indexed access.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Columns, self).__init__(parent)
         self._tbl = tbl
@@ -372,6 +384,9 @@ class _Row(Parented):
     """
     Table row
     """
+
+    __slots__ = ('_tr',)
+
     def __init__(self, tr, parent):
         super(_Row, self).__init__(parent)
         self._tr = tr
@@ -403,6 +418,9 @@ class _Rows(Parented):
     Sequence of |_Row| objects corresponding to the rows in a table.
     Supports ``len()``, iteration, indexed access, and slicing.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Rows, self).__init__(parent)
         self._tbl = tbl
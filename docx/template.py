@@ -0,0 +1,254 @@
+# encoding: utf-8
+
+"""
+|Template| object, a document compiled once for rendering many times with
+different values for its ``{{placeholders}}``.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import re
+import zlib
+
+from xml.sax.saxutils import escape
+
+from .api import Document
+from .compat import BytesIO
+from .opc.constants import CONTENT_TYPE as CT
+from .opc.oxml import serialize_part_xml
+from .opc.part import XmlPart
+from .opc.phys_pkg import _ZipMember, _ZipMemberWriter
+from .opc.pkgwriter import PackageWriter
+from .oxml import parse_xml
+from .oxml.ns import qn
+from .text.search import replace
+
+
+#: Pattern matching a placeholder such as ``{{ name }}``, its first group
+#: being the placeholder name.
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+_MARKER_TMPL = '\ue000%d\ue001'
+_MARKER = re.compile('\ue000(\\d+)\ue001')
+_MARKER_BYTES = re.compile(b'\xee\x80\x80(\\d+)\xee\x80\x81')
+
+#: Content types of the header and footer parts, which are loaded as plain
+#: parts and so are parsed for their placeholders.
+_HDRFTR_CONTENT_TYPES = frozenset((CT.WML_FOOTER, CT.WML_HEADER))
+
+
+class Template(object):
+    """
+    A ``.docx`` file compiled for fast repeated rendering. *docx* is a path
+    or file-like object as for :func:`docx.Document`.
+
+    The package is parsed once. Each placeholder in a paragraph of the
+    document body, a header or a footer, like ``{{ name }}``, is gathered
+    into a single ``<w:t>`` element, even when the text of the placeholder
+    is split across runs, including those of a hyperlink, and each part is
+    then serialized and compressed once. A part containing placeholders is
+    kept as the bytes between them, so rendering it only joins those bytes
+    with the escaped values; every other part is reused exactly as
+    compressed.
+    The cost of a render is therefore proportional to the number of
+    placeholders and the size of the parts containing them, independent of
+    the rest of the package.
+
+    *compress_level* is the zlib compression level of the rendered
+    package, as for :meth:`.Document.save`; at 0, its members are stored
+    without compression.
+    """
+    def __init__(self, docx, compress_level=None):
+        super(Template, self).__init__()
+        # a level of None has _ZipMember store the members
+        self._compress_level = (
+            zlib.Z_DEFAULT_COMPRESSION if compress_level is None
+            else None if compress_level == 0 else compress_level
+        )
+        self._names = []
+        package = Document(docx).part.package
+        prefixes, marked = {}, set()
+        for part in package.parts:
+            if self._mark_part(part, prefixes):
+                marked.add(part.partname)
+            part.before_marshal()
+        self._members = [
+            self._compile_member(
+                pack_uri.membername, blob, prefixes, pack_uri in marked
+            )
+            for pack_uri, blob in PackageWriter.iter_blobs(
+                package.rels, package.parts
+            )
+        ]
+
+    @property
+    def placeholders(self):
+        """
+        List of the name of each placeholder in this template, in the order
+        they appear in the package. A name occurs once for each placeholder
+        having it.
+        """
+        return [
+            name for member in self._members
+            if isinstance(member, _PartTemplate) for name in member.names
+        ]
+
+    def render(self, context):
+        """
+        Return the bytes of a ``.docx`` package produced from this template
+        by replacing each placeholder with the value of its name in the
+        mapping *context*. See :meth:`save`.
+        """
+        stream = BytesIO()
+        self.save(stream, context)
+        return stream.getvalue()
+
+    def save(self, path_or_stream, context):
+        """
+        Write a ``.docx`` package produced from this template to
+        *path_or_stream*, a path or a file-like object that need not be
+        seekable. Each placeholder is replaced by the text of the value of
+        its name in the mapping *context*, in which a tab becomes a tab and
+        a newline a line break, as when assigning `Run.text`. Raises
+        |KeyError| when *context* has no value for a placeholder and
+        |ValueError| when the text of a value has a control character XML
+        does not allow.
+        """
+        writer = _ZipMemberWriter(path_or_stream)
+        for member in self._members:
+            if isinstance(member, _PartTemplate):
+                member = _ZipMember.from_blob(
+                    member.membername, member.render(context),
+                    self._compress_level
+                )
+            else:
+                member = member.copy()
+            writer.write_member(member)
+        writer.close()
+
+    def _compile_member(self, membername, blob, prefixes, marked):
+        """
+        Return a |_PartTemplate| for *blob* when *marked* is |True|, its
+        part having placeholder markers, otherwise a |_ZipMember| holding it
+        compressed.
+        """
+        if not marked:
+            return _ZipMember.from_blob(membername, blob, self._compress_level)
+        return _PartTemplate(membername, blob, self._names, prefixes)
+
+    def _mark_part(self, part, prefixes):
+        """
+        Mark the placeholders of *part* as for :meth:`_mark_placeholders`
+        and return |True| if it has any. A header or footer loaded as
+        a plain part is parsed for that, its blob being replaced by the
+        marked XML. Other parts not holding XML are left alone.
+        """
+        if isinstance(part, XmlPart):
+            return self._mark_placeholders(part.element, prefixes)
+        if part.content_type not in _HDRFTR_CONTENT_TYPES:
+            return False
+        element = parse_xml(part.blob)
+        if not self._mark_placeholders(element, prefixes):
+            return False
+        part._blob = serialize_part_xml(element)
+        return True
+
+    def _mark_placeholders(self, element, prefixes):
+        """
+        Replace each placeholder in the paragraphs of *element* with
+        a marker holding the index of its name in `_names`, gathering the
+        text of the placeholder into the first run it occupies. Markers are
+        delimited by private-use characters so they can be found in the
+        serialized XML. The namespace prefix of the ``<w:t>`` element each
+        marker lands in is recorded in *prefixes*, keyed by index. Return
+        |True| if *element* has any placeholder.
+        """
+        names = self._names
+
+        def marker(match):
+            names.append(match.group(1))
+            return _MARKER_TMPL % (len(names) - 1)
+
+        p_items = [(p, None) for p in element.iter(qn('w:p'))]
+        if not replace(p_items, PLACEHOLDER_PATTERN, marker, hyperlinks=True):
+            return False
+        for t in element.iter(qn('w:t')):
+            indices = _MARKER.findall(t.text or '')
+            if not indices:
+                continue
+            t.set(qn('xml:space'), 'preserve')
+            for idx in indices:
+                prefixes[int(idx)] = t.prefix
+        return True
+
+
+class _PartTemplate(object):
+    """
+    The serialized XML of a part split at its placeholder markers, rendered
+    by joining the literal byte segments with the XML of each value.
+    """
+
+    __slots__ = ('membername', '_segments', '_slots')
+
+    def __init__(self, membername, blob, names, prefixes):
+        self.membername = membername
+        pieces = _MARKER_BYTES.split(blob)
+        self._segments = pieces[0::2]
+        self._slots = [
+            (names[int(idx)], prefixes[int(idx)]) for idx in pieces[1::2]
+        ]
+
+    @property
+    def names(self):
+        """
+        List of the placeholder names in this part, in document order.
+        """
+        return [name for name, _ in self._slots]
+
+    def render(self, context):
+        """
+        Return the XML bytes of this part with each placeholder replaced by
+        the value of its name in *context*.
+        """
+        segments = self._segments
+        pieces = [segments[0]]
+        for idx, (name, prefix) in enumerate(self._slots):
+            pieces.append(_text_xml(context[name], prefix))
+            pieces.append(segments[idx + 1])
+        return b''.join(pieces)
+
+
+_SPECIAL_CHARS = re.compile(r'(\t|\r|\n)')
+# characters XML 1.0 does not allow, save those of surrogate pairs
+_INVALID_XML_CHARS = re.compile(
+    '[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]'
+)
+
+
+def _text_xml(value, prefix):
+    """
+    Return the UTF-8 encoded XML for the text of *value* placed within
+    a ``<w:t>`` element having namespace *prefix*, closing and reopening
+    that element around the ``<w:tab/>`` or ``<w:br/>`` each tab or line
+    break becomes. Raises |ValueError| when the text has a character XML
+    does not allow, which would make the package unreadable.
+    """
+    text = '%s' % value
+    invalid = _INVALID_XML_CHARS.search(text)
+    if invalid is not None:
+        raise ValueError(
+            'placeholder value %r has character %r, not allowed in XML' %
+            (text, invalid.group())
+        )
+    text = escape(text)
+    if _SPECIAL_CHARS.search(text) is not None:
+        w = '%s:' % prefix if prefix else ''
+        reopen = '<%st xml:space="preserve">' % w
+        tab = '</%st><%stab/>%s' % (w, w, reopen)
+        br = '</%st><%sbr/>%s' % (w, w, reopen)
+        text = _SPECIAL_CHARS.sub(
+            lambda m: tab if m.group() == '\t' else br, text
+        )
+    return text.encode('utf-8')
@@ -18,6 +18,9 @@ class Paragraph(Parented):
     """
     Proxy object wrapping ``<w:p>`` element.
     """
+
+    __slots__ = ('_p', '_element')
+
     def __init__(self, p, parent):
         super(Paragraph, self).__init__(parent)
         self._p = self._element = p
@@ -76,6 +79,16 @@ class Paragraph(Parented):
             paragraph.style = style
         return paragraph
 
+    @property
+    def effective_format(self):
+        """
+        Read-only |EffectiveParagraphFormat| object providing the paragraph
+        formatting that actually applies to this paragraph, resolved from
+        the document defaults, the paragraph style and its base styles, and
+        the formatting applied directly to this paragraph.
+        """
+        return self.part.format_resolver.paragraph_format(self._p)
+
     @property
     def paragraph_format(self):
         """
@@ -126,10 +139,7 @@ class Paragraph(Parented):
         Paragraph-level formatting, such as style, is preserved. All
         run-level formatting, such as bold or italic, is removed.
         """
-        text = ''
-        for run in self.runs:
-            text += run.text
-        return text
+        return self._p.text
 
     @text.setter
     def text(self, text):
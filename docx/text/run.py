@@ -21,6 +21,9 @@ class Run(Parented):
     not specified directly on the run and its effective value is taken from
     the style hierarchy.
     """
+
+    __slots__ = ('_r', '_element', 'element')
+
     def __init__(self, r, parent):
         super(Run, self).__init__(parent)
         self._r = self._element = self.element = r
@@ -99,6 +102,17 @@ class Run(Parented):
         self._r.clear_content()
         return self
 
+    @property
+    def effective_font(self):
+        """
+        Read-only |EffectiveFont| object providing the formatting this run
+        actually appears with, such as ``effective_font.size``, resolved
+        from the document defaults, the paragraph and character styles, and
+        the formatting applied directly to this run. A property is |None|
+        only when no level of the style hierarchy specifies it.
+        """
+        return self.part.format_resolver.font(self._r)
+
     @property
     def font(self):
         """
@@ -237,6 +251,9 @@ class _Text(object):
     """
     Proxy object wrapping ``<w:t>`` element.
     """
+
+    __slots__ = ('_t',)
+
     def __init__(self, t_elm):
         super(_Text, self).__init__()
         self._t = t_elm
@@ -0,0 +1,217 @@
+# encoding: utf-8
+
+"""
+Text search and replace across the runs of a paragraph.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import re
+from bisect import bisect_right
+
+from ..compat import is_string
+from .paragraph import Paragraph
+from .run import Run
+
+
+class TextMatch(object):
+    """
+    A match of a search pattern in the text of a paragraph. The matched text
+    may be drawn from several runs; `spans` gives the part contributed by
+    each of them.
+    """
+
+    __slots__ = ('_paragraph', '_match', '_spans')
+
+    def __init__(self, paragraph, match, spans):
+        self._paragraph = paragraph
+        self._match = match
+        self._spans = spans
+
+    @property
+    def end(self):
+        """
+        Offset in the paragraph text just past the end of the match.
+        """
+        return self._match.end()
+
+    def group(self, *groups):
+        """
+        Return one or more subgroups of the match, as for
+        :meth:`re.Match.group`.
+        """
+        return self._match.group(*groups)
+
+    @property
+    def paragraph(self):
+        """
+        The |Paragraph| containing this match.
+        """
+        return self._paragraph
+
+    @property
+    def spans(self):
+        """
+        List of ``(run, start, end)`` tuples, one for each |Run| contributing
+        text to this match, in document order. *start* and *end* are the
+        offsets of the matched part in the `text` of *run*.
+        """
+        return list(self._spans)
+
+    @property
+    def start(self):
+        """
+        Offset of the start of the match in the paragraph text.
+        """
+        return self._match.start()
+
+    @property
+    def text(self):
+        """
+        The matched text.
+        """
+        return self._match.group()
+
+
+def compile_pattern(pattern, regex=True):
+    """
+    Return a compiled regular expression for *pattern*. When *regex* is
+    |False|, a string *pattern* is matched literally. A *pattern* that is
+    already compiled is returned unchanged, whatever *regex*.
+    """
+    if not is_string(pattern):
+        return pattern
+    if not regex:
+        return re.compile(re.escape(pattern))
+    return re.compile(pattern)
+
+
+def iter_matches(paragraph_items, pattern, regex=True):
+    """
+    Generate a |TextMatch| for each match of *pattern* in the paragraphs of
+    *paragraph_items*, an iterable of ``(p, parent)`` pairs giving each
+    ``<w:p>`` element with the proxy of the object containing it. Empty
+    matches are skipped, as they are by :func:`replace`.
+    """
+    compiled = compile_pattern(pattern, regex)
+    for p, parent in paragraph_items:
+        index = _ParagraphTextIndex(p)
+        paragraph = None
+        for match in compiled.finditer(index.text):
+            if match.end() == match.start():
+                continue
+            if paragraph is None:
+                paragraph = Paragraph(p, parent)
+            spans = [
+                (Run(index.r_lst[idx], paragraph), start, end)
+                for idx, start, end in index.spans(match.start(), match.end())
+            ]
+            yield TextMatch(paragraph, match, spans)
+
+
+def replace(paragraph_items, pattern, repl, regex=True, hyperlinks=False):
+    """
+    Replace each match of *pattern* in the paragraphs of *paragraph_items*
+    with *repl* and return the number of replacements made. For a regular
+    expression, backreferences like ``\\1`` in *repl* are expanded, and
+    *repl* can be a function taking the :class:`re.Match` object and
+    returning the replacement. The replacement is placed in the first run
+    of the match, so it takes on the formatting of that run; the matched
+    text is removed from the other runs, and a run left without content is
+    removed. Content of a run other than its text, such as a picture, is
+    kept. Runs not touched by a match are not changed. Empty matches are
+    ignored. When *hyperlinks* is |True|, the text of the runs in the
+    hyperlinks of a paragraph is matched along with that of its other runs.
+    """
+    compiled = compile_pattern(pattern, regex)
+    if callable(repl):
+        expand = repl
+    elif regex:
+        expand = lambda match: match.expand(repl)  # noqa
+    else:
+        expand = lambda match: repl  # noqa
+
+    count = 0
+    for p, parent in paragraph_items:
+        index = _ParagraphTextIndex(p, hyperlinks)
+        matches = [
+            m for m in compiled.finditer(index.text) if m.end() > m.start()
+        ]
+        if not matches:
+            continue
+        for match in reversed(matches):
+            index.replace(match.start(), match.end(), expand(match))
+        index.flush()
+        count += len(matches)
+    return count
+
+
+class _ParagraphTextIndex(object):
+    """
+    The text of a ``<w:p>`` element together with the offset at which the
+    text of each of its runs begins, computed in a single pass. The runs in
+    its hyperlinks are included when *hyperlinks* is |True|. Replacements
+    are recorded as edits of the text of each run and applied to the runs
+    they change by :meth:`flush`.
+    """
+
+    __slots__ = ('r_lst', 'text', '_starts', '_ends', '_edits')
+
+    def __init__(self, p, hyperlinks=False):
+        self.r_lst = (
+            p.xpath('./w:r | ./w:hyperlink/w:r') if hyperlinks else p.r_lst
+        )
+        run_texts = [r.text for r in self.r_lst]
+        self._starts, self._ends = starts, ends = [], []
+        offset = 0
+        for run_text in run_texts:
+            starts.append(offset)
+            offset += len(run_text)
+            ends.append(offset)
+        self.text = ''.join(run_texts)
+        self._edits = {}
+
+    def flush(self):
+        """
+        Apply the edits of each changed run to its ``<w:r>`` element, in
+        reverse order so the offsets of each remain valid, removing a run
+        left without content.
+        """
+        for idx, edits in self._edits.items():
+            r = self.r_lst[idx]
+            for start, end, new_text in edits:
+                r.replace_text(start, end, new_text)
+            if len(r) == (0 if r.rPr is None else 1):
+                r.getparent().remove(r)
+        self._edits.clear()
+
+    def replace(self, start, end, new_text):
+        """
+        Replace the text from *start* to *end* in the original paragraph
+        text with *new_text*. Replacements must be made in reverse document
+        order so the offsets of those still to be made remain valid.
+        """
+        edits = self._edits
+        for idx, span_start, span_end in self.spans(start, end):
+            edits.setdefault(idx, []).append((span_start, span_end, new_text))
+            new_text = ''
+
+    def spans(self, start, end):
+        """
+        Generate an ``(idx, start, end)`` tuple for each run contributing
+        text to the range *start* to *end* of the paragraph text, where
+        *idx* is the index of the run and *start* and *end* are offsets in
+        its original text.
+        """
+        starts, ends = self._starts, self._ends
+        idx = bisect_right(starts, start) - 1
+        while idx < len(starts) and starts[idx] < end:
+            run_start, run_end = starts[idx], ends[idx]
+            if run_end > start:
+                yield (
+                    idx, max(start, run_start) - run_start,
+                    min(end, run_end) - run_start
+                )
+            idx += 1
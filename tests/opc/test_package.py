@@ -11,10 +11,11 @@ import pytest
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
 from docx.opc.package import OpcPackage, Unmarshaller
-from docx.opc.packuri import PACKAGE_URI
+from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.part import Part
 from docx.opc.parts.coreprops import CorePropertiesPart
 from docx.opc.pkgreader import PackageReader
+from docx.opc.profile import LOAD_PROFILES
 from docx.opc.rel import _Relationship, Relationships
 
 from ..unitutil.mock import (
@@ -33,10 +34,23 @@ class DescribeOpcPackage(object):
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
-        Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg,
-                                                        PartFactory_)
+        PackageReader_.from_file.assert_called_once_with(pkg_file, False)
+        Unmarshaller_.unmarshal.assert_called_once_with(
+            pkg_reader, pkg, PartFactory_, LOAD_PROFILES['full'], False
+        )
         assert isinstance(pkg, OpcPackage)
+        assert pkg._compressed_sizes is pkg_reader.compressed_sizes
+        assert pkg._pkg_reader is None
+
+    def it_keeps_the_pkg_file_open_for_parts_a_profile_skips(
+            self, PackageReader_, PartFactory_, Unmarshaller_):
+        pkg_reader = PackageReader_.from_file.return_value
+        pkg = OpcPackage.open('foo.docx', load='no-media')
+        PackageReader_.from_file.assert_called_once_with('foo.docx', True)
+        Unmarshaller_.unmarshal.assert_called_once_with(
+            pkg_reader, pkg, PartFactory_, LOAD_PROFILES['no-media'], False
+        )
+        assert pkg._pkg_reader is pkg_reader
 
     def it_initializes_its_rels_collection_on_first_reference(
             self, Relationships_):
@@ -109,8 +123,51 @@ class DescribeOpcPackage(object):
         for part in parts_:
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(
-            pkg_file_, pkg._rels, parts_
+            pkg_file_, pkg._rels, parts_, None, None, None
+        )
+
+    def it_can_save_to_an_iterator_of_chunks(
+            self, PackageWriter_, parts, parts_):
+        pkg = OpcPackage()
+        chunks = pkg.iter_save_chunks(6)
+        for part in parts_:
+            part.before_marshal.assert_called_once_with()
+        PackageWriter_.iter_write.assert_called_once_with(
+            pkg._rels, parts_, 6, None
+        )
+        assert chunks is PackageWriter_.iter_write.return_value
+
+    def it_can_report_its_stats(self, request, parts_, PartStats_):
+        pkg = OpcPackage()
+        pkg._compressed_sizes = {'pn/1': 2}
+        part_, part_2_ = parts_
+        part_.partname, part_2_.partname = PackURI('/pn/1'), PackURI('/pn/2')
+        method_mock(request, OpcPackage, 'iter_parts', return_value=iter(
+            [part_, part_2_]
+        ))
+
+        stats = pkg.stats()
+
+        assert PartStats_.from_part.call_args_list == [
+            call(part_, 2, None, False), call(part_2_, None, None, False)
+        ]
+        assert stats.parts == [PartStats_.from_part.return_value] * 2
+        assert stats.caches == {}
+
+    def it_can_stream_a_part_from_the_pkg_file_it_keeps_open(self, request):
+        pkg = OpcPackage()
+        pkg._pkg_reader = instance_mock(request, PackageReader)
+
+        stream = pkg.stream_for('/word/document.xml')
+
+        pkg._pkg_reader.stream_for.assert_called_once_with(
+            '/word/document.xml'
         )
+        assert stream is pkg._pkg_reader.stream_for.return_value
+
+    def it_raises_on_stream_for_when_no_pkg_file_is_open(self):
+        with pytest.raises(ValueError):
+            OpcPackage().stream_for('/word/document.xml')
 
     def it_provides_access_to_the_core_properties(self, core_props_fixture):
         opc_package, core_properties_ = core_props_fixture
@@ -234,6 +291,10 @@ class DescribeOpcPackage(object):
         part_2_ = instance_mock(request, Part, name='part_2_')
         return [part_, part_2_]
 
+    @pytest.fixture
+    def PartStats_(self, request):
+        return class_mock(request, 'docx.opc.package.PartStats')
+
     @pytest.fixture
     def pkg(self, request):
         return OpcPackage()
@@ -285,7 +346,7 @@ class DescribeUnmarshaller(object):
         Unmarshaller.unmarshal(pkg_reader_, pkg_, part_factory_)
         # verify -----------------------
         _unmarshal_parts.assert_called_once_with(
-            pkg_reader_, pkg_, part_factory_
+            pkg_reader_, pkg_, part_factory_, None, False
         )
         _unmarshal_relationships.assert_called_once_with(
             pkg_reader_, pkg_, parts_dict_
@@ -315,6 +376,47 @@ class DescribeUnmarshaller(object):
         )
         assert parts == parts_dict_
 
+    def it_defers_the_parts_a_profile_skips_or_all_when_lazy(
+            self, request, pkg_):
+        pkg_reader_ = instance_mock(request, PackageReader)
+        pkg_reader_.iter_sparts.return_value = (
+            (PackURI('/word/media/image1.png'), 'image/png', RT.IMAGE, None),
+            (PackURI('/word/styles.xml'), 'app/styles', RT.STYLES, None),
+        )
+        part_factory_ = Mock(name='part_factory')
+
+        parts = Unmarshaller._unmarshal_parts(
+            pkg_reader_, pkg_, part_factory_, LOAD_PROFILES['no-media'], True
+        )
+
+        image_part = parts['/word/media/image1.png']
+        assert type(image_part) is Part
+        assert image_part.content_type == 'image/png'
+        assert parts['/word/styles.xml'] is (
+            part_factory_.load_deferred.return_value
+        )
+        assert pkg_reader_.blob_for.call_count == 0
+        image_part.blob
+        pkg_reader_.blob_for.assert_called_once_with('/word/media/image1.png')
+
+    def it_reads_the_parts_a_profile_keeps_when_not_lazy(
+            self, request, pkg_):
+        pkg_reader_ = instance_mock(request, PackageReader)
+        pkg_reader_.iter_sparts.return_value = (
+            (PackURI('/word/styles.xml'), 'app/styles', RT.STYLES, None),
+        )
+        part_factory_ = Mock(name='part_factory')
+
+        parts = Unmarshaller._unmarshal_parts(
+            pkg_reader_, pkg_, part_factory_, LOAD_PROFILES['no-media']
+        )
+
+        part_factory_.assert_called_once_with(
+            '/word/styles.xml', 'app/styles', RT.STYLES,
+            pkg_reader_.blob_for.return_value, pkg_
+        )
+        assert parts['/word/styles.xml'] is part_factory_.return_value
+
     def it_can_unmarshal_relationships(self):
         # test data --------------------
         reltype = 'http://reltype'
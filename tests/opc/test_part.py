@@ -14,6 +14,7 @@ from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part, PartFactory, XmlPart
 from docx.opc.rel import _Relationship, Relationships
+from docx.oxml import parse_xml
 from docx.oxml.xmlchemy import BaseOxmlElement
 
 from ..unitutil.cxml import element
@@ -60,6 +61,40 @@ class DescribePart(object):
         part, load_blob = blob_fixture
         assert part.blob is load_blob
 
+    def it_reads_a_deferred_blob_when_first_accessed(self):
+        read_blob_ = Mock(name='read_blob', return_value=b'foobar')
+        part = Part.load_deferred(PackURI('/foo.bin'), 'ct', read_blob_, None)
+        assert read_blob_.call_count == 0
+
+        assert part.blob == b'foobar'
+        assert part.blob == b'foobar'
+        read_blob_.assert_called_once_with()
+
+    def it_can_copy_itself_into_another_package(self, package_):
+        part = Part(PackURI('/foo.bin'), 'ct', b'foobar', None)
+        copy = part._copy(package_)
+        assert type(copy) is Part
+        assert copy.partname == part.partname
+        assert copy.content_type == 'ct'
+        assert copy.blob is part.blob
+        assert copy.package is package_
+        assert len(copy.rels) == 0
+
+    def it_keeps_a_deferred_blob_deferred_when_copied(self, package_):
+        read_blob_ = Mock(name='read_blob', return_value=b'foobar')
+        part = Part.load_deferred(PackURI('/foo.bin'), 'ct', read_blob_, None)
+
+        copy = part._copy(package_)
+
+        assert read_blob_.call_count == 0
+        assert copy.blob == b'foobar'
+        assert copy.package is package_
+        assert '_read_blob' in part.__dict__
+
+    def it_still_raises_on_a_missing_attribute(self, part):
+        with pytest.raises(AttributeError):
+            part.foobar
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -322,6 +357,19 @@ class DescribePartFactory(object):
         )
         assert part is part_of_default_type_
 
+    def it_can_construct_a_part_whose_loading_is_deferred(
+            self, part_args_, CustomPartClass_):
+        partname, content_type, reltype, package, _ = part_args_
+        read_blob = Mock(name='read_blob')
+        PartFactory.part_type_for[content_type] = CustomPartClass_
+        part = PartFactory.load_deferred(
+            partname, content_type, reltype, read_blob, package
+        )
+        CustomPartClass_.load_deferred.assert_called_once_with(
+            partname, content_type, read_blob, package
+        )
+        assert part is CustomPartClass_.load_deferred.return_value
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -459,6 +507,38 @@ class DescribeXmlPart(object):
         xml_part = part_fixture
         assert xml_part.part is xml_part
 
+    def it_parses_a_deferred_blob_when_first_accessed(self):
+        read_blob_ = Mock(name='read_blob', return_value=b'<foo><bar/></foo>')
+        xml_part = XmlPart.load_deferred(
+            PackURI('/foo.xml'), 'ct', read_blob_, None
+        )
+        assert read_blob_.call_count == 0
+
+        assert xml_part.element.tag == 'foo'
+        assert xml_part.blob.endswith(b'<foo><bar/></foo>')
+        read_blob_.assert_called_once_with()
+
+    def it_copies_its_xml_tree_when_copied(self, package_):
+        xml_part = XmlPart(
+            PackURI('/foo.xml'), 'ct', parse_xml('<foo><bar/></foo>'), None
+        )
+        copy = xml_part._copy(package_)
+        copy.element.remove(copy.element[0])
+        assert copy.package is package_
+        assert copy.blob.endswith(b'<foo/>')
+        assert xml_part.blob.endswith(b'<foo><bar/></foo>')
+
+    def it_parses_a_deferred_blob_only_in_its_copy(self, package_):
+        read_blob_ = Mock(name='read_blob', return_value=b'<foo/>')
+        xml_part = XmlPart.load_deferred(
+            PackURI('/foo.xml'), 'ct', read_blob_, None
+        )
+
+        copy = xml_part._copy(package_)
+
+        assert copy.element.tag == 'foo'
+        assert '_element' not in xml_part.__dict__
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -12,14 +12,18 @@ except ImportError:
     from StringIO import StringIO as BytesIO
 
 import hashlib
+import mmap
 import pytest
 
-from zipfile import ZIP_DEFLATED, ZipFile
+from concurrent.futures import ThreadPoolExecutor
+from zipfile import BadZipfile, ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from docx.opc.exceptions import PackageNotFoundError
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.phys_pkg import (
-    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
+    _DirPkgReader, _DirPkgWriter, _ParallelZipPkgWriter, PhysPkgReader,
+    PhysPkgWriter, _ZipMember, _ZipMemberWriter, _ZipPkgReader,
+    _ZipPkgWriter
 )
 
 from ..unitutil.file import absjoin, test_file_dir
@@ -47,6 +51,14 @@ class DescribeDirPkgReader(object):
         sha1 = hashlib.sha1(blob).hexdigest()
         assert sha1 == '0e62d87ea74ea2b8088fd11ee97b42da9b4c77b0'
 
+    def it_can_stream_the_blob_for_a_pack_uri(self, dir_reader):
+        pack_uri = PackURI('/word/document.xml')
+        stream = dir_reader.stream_for(pack_uri)
+        try:
+            assert stream.read() == dir_reader.blob_for(pack_uri)
+        finally:
+            stream.close()
+
     def it_can_get_the_content_types_xml(self, dir_reader):
         sha1 = hashlib.sha1(dir_reader.content_types_xml).hexdigest()
         assert sha1 == '89aadbb12882dd3d7340cd47382dc2c73d75dd81'
@@ -61,6 +73,9 @@ class DescribeDirPkgReader(object):
         rels_xml = dir_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_has_no_compressed_sizes(self, dir_reader):
+        assert dir_reader.compressed_sizes == {}
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -109,6 +124,15 @@ class DescribeZipPkgReader(object):
         sha1 = hashlib.sha1(blob).hexdigest()
         assert sha1 == 'b9b4a98bcac7c5a162825b60c3db7df11e02ac5f'
 
+    def it_can_stream_the_blob_for_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI('/word/document.xml')
+        stream = phys_reader.stream_for(pack_uri)
+        try:
+            assert stream.read(5) == b'<?xml'
+            assert b'<?xml' + stream.read() == phys_reader.blob_for(pack_uri)
+        finally:
+            stream.close()
+
     def it_has_the_content_types_xml(self, phys_reader):
         sha1 = hashlib.sha1(phys_reader.content_types_xml).hexdigest()
         assert sha1 == 'cd687f67fd6b5f526eedac77cf1deb21968d7245'
@@ -123,8 +147,85 @@ class DescribeZipPkgReader(object):
         rels_xml = phys_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_knows_the_size_of_its_members(self, phys_reader):
+        size = phys_reader.sizes['word/document.xml']
+        assert size == len(phys_reader.blob_for(PackURI('/word/document.xml')))
+
+    def it_knows_the_compressed_size_of_its_members(self, phys_reader):
+        compressed_size = phys_reader.compressed_sizes['word/document.xml']
+        blob = phys_reader.blob_for(PackURI('/word/document.xml'))
+        assert 0 < compressed_size < len(blob)
+
+    def it_can_read_a_package_from_a_buffer(self, buffer_fixture):
+        pkg_file = buffer_fixture
+        phys_reader = PhysPkgReader(pkg_file)
+        blob = phys_reader.blob_for(PackURI('/word/document.xml'))
+        phys_reader.close()
+        sha1 = hashlib.sha1(blob).hexdigest()
+        assert sha1 == 'b9b4a98bcac7c5a162825b60c3db7df11e02ac5f'
+
+    def it_can_read_a_package_from_an_mmap(self):
+        with open(zip_pkg_path, 'rb') as f:
+            pkg_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        phys_reader = PhysPkgReader(pkg_map)
+        blob = phys_reader.blob_for(PackURI('/word/document.xml'))
+        phys_reader.close()
+        pkg_map.close()
+        sha1 = hashlib.sha1(blob).hexdigest()
+        assert sha1 == 'b9b4a98bcac7c5a162825b60c3db7df11e02ac5f'
+
+    def it_releases_the_buffer_of_a_stream_when_closed(self):
+        with open(zip_pkg_path, 'rb') as f:
+            stream = BytesIO(f.read())
+        _ZipPkgReader(stream).close()
+        stream.write(b'x' * 99)
+
+    def it_leaves_a_stream_writable_while_open(self):
+        with open(zip_pkg_path, 'rb') as f:
+            pkg_blob = f.read()
+        stream = BytesIO(pkg_blob)
+        phys_reader = _ZipPkgReader(stream)
+        phys_reader.blob_for(PackURI('/word/document.xml'))
+        stream.seek(0, 2)
+        stream.write(b'x' * 99)
+        stream.truncate(len(pkg_blob))
+        blob = phys_reader.blob_for(PackURI('/word/document.xml'))
+        phys_reader.close()
+        sha1 = hashlib.sha1(blob).hexdigest()
+        assert sha1 == 'b9b4a98bcac7c5a162825b60c3db7df11e02ac5f'
+
+    def it_can_retrieve_a_stored_member(self, stored_pkg_blob):
+        phys_reader = PhysPkgReader(stored_pkg_blob)
+        assert phys_reader.blob_for(PackURI('/foo.xml')) == b'<foo/>' * 9
+
+    def it_raises_on_a_corrupt_member(self, stored_pkg_blob):
+        pkg_blob = stored_pkg_blob.replace(b'<foo/><foo/>', b'<bar/><foo/>')
+        phys_reader = PhysPkgReader(pkg_blob)
+        with pytest.raises(BadZipfile):
+            phys_reader.blob_for(PackURI('/foo.xml'))
+
+    def it_raises_on_a_member_of_a_size_other_than_recorded(self):
+        stream = BytesIO()
+        with ZipFile(stream, 'w', ZIP_DEFLATED) as zipf:
+            zipf.writestr('foo.xml', b'<foo/>' * 9)
+        phys_reader = PhysPkgReader(stream.getvalue())
+        phys_reader._zipf.getinfo('foo.xml').file_size = 0xFFFFFFFF
+        with pytest.raises(BadZipfile):
+            phys_reader.blob_for(PackURI('/foo.xml'))
+
     # fixtures ---------------------------------------------
 
+    @pytest.fixture(params=['bytes', 'bytearray', 'memoryview', 'BytesIO'])
+    def buffer_fixture(self, request):
+        with open(zip_pkg_path, 'rb') as f:
+            pkg_blob = f.read()
+        return {
+            'bytes': pkg_blob,
+            'bytearray': bytearray(pkg_blob),
+            'memoryview': memoryview(pkg_blob),
+            'BytesIO': BytesIO(pkg_blob),
+        }[request.param]
+
     @pytest.fixture(scope='class')
     def phys_reader(self, request):
         phys_reader = _ZipPkgReader(zip_pkg_path)
@@ -135,10 +236,47 @@ class DescribeZipPkgReader(object):
     def pkg_file_(self, request):
         return loose_mock(request)
 
+    @pytest.fixture
+    def stored_pkg_blob(self):
+        stream = BytesIO()
+        with ZipFile(stream, 'w', ZIP_STORED) as zipf:
+            zipf.writestr('foo.xml', b'<foo/>' * 9)
+        return stream.getvalue()
+
+
+class DescribeDirPkgWriter(object):
+
+    def it_is_used_by_PhysPkgWriter_when_pkg_is_a_dir(self, tmpdir):
+        phys_writer = PhysPkgWriter(str(tmpdir))
+        assert isinstance(phys_writer, _DirPkgWriter)
+
+    def it_writes_each_blob_to_a_file(self, tmpdir):
+        phys_writer = PhysPkgWriter(str(tmpdir), executor=Mock())
+        phys_writer.write(PackURI('/word/document.xml'), b'<w:document/>')
+        phys_writer.write(PackURI('/word/styles.xml'), b'<w:styles/>', False)
+        phys_writer.close()
+        assert tmpdir.join('word', 'document.xml').read_binary() == (
+            b'<w:document/>'
+        )
+        assert tmpdir.join('word', 'styles.xml').read_binary() == (
+            b'<w:styles/>'
+        )
+
+    def it_writes_a_package_the_dir_reader_can_read(self, tmpdir):
+        pack_uri = PackURI('/word/document.xml')
+        phys_writer = PhysPkgWriter(str(tmpdir))
+        phys_writer.write(pack_uri, b'<w:document/>')
+        phys_writer.write(pack_uri, b'<w:document><w:body/></w:document>')
+        phys_writer.close()
+        phys_reader = PhysPkgReader(str(tmpdir))
+        assert phys_reader.blob_for(pack_uri) == (
+            b'<w:document><w:body/></w:document>'
+        )
+
 
 class DescribeZipPkgWriter(object):
 
-    def it_is_used_by_PhysPkgWriter_unconditionally(self, tmp_docx_path):
+    def it_is_used_by_PhysPkgWriter_unless_pkg_is_a_dir(self, tmp_docx_path):
         phys_writer = PhysPkgWriter(tmp_docx_path)
         assert isinstance(phys_writer, _ZipPkgWriter)
 
@@ -149,6 +287,20 @@ class DescribeZipPkgWriter(object):
             pkg_file, 'w', compression=ZIP_DEFLATED
         )
 
+    def it_passes_the_compression_level_to_the_zip(self, ZipFile_):
+        pkg_file = Mock(name='pkg_file')
+        _ZipPkgWriter(pkg_file, compress_level=1)
+        ZipFile_.assert_called_once_with(
+            pkg_file, 'w', compression=ZIP_DEFLATED, compresslevel=1
+        )
+
+    def it_stores_members_at_compression_level_0(self, ZipFile_):
+        pkg_file = Mock(name='pkg_file')
+        _ZipPkgWriter(pkg_file, compress_level=0)
+        ZipFile_.assert_called_once_with(
+            pkg_file, 'w', compression=ZIP_STORED
+        )
+
     def it_can_be_closed(self, ZipFile_):
         # mockery ----------------------
         zipf = ZipFile_.return_value
@@ -174,6 +326,16 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_write_a_blob_without_compression(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(PackURI('/word/media/image1.png'), b'\x89PNG', False)
+        pkg_writer.close()
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.getinfo('word/media/image1.png').compress_type == (
+            ZIP_STORED
+        )
+        zipf.close()
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -183,6 +345,76 @@ class DescribeZipPkgWriter(object):
         return pkg_file
 
 
+class DescribeParallelZipPkgWriter(object):
+
+    def it_is_used_by_PhysPkgWriter_when_given_an_executor(self, executor):
+        phys_writer = PhysPkgWriter(BytesIO(), executor=executor)
+        assert isinstance(phys_writer, _ParallelZipPkgWriter)
+
+    def it_writes_members_in_order(self, executor):
+        pkg_file = BytesIO()
+        blobs = [
+            ('/word/document.xml', b'<w:document/>' * 1000, True),
+            ('/word/media/image1.png', b'\x89PNG\x00\xff' * 100, False),
+            ('/docProps/\u00e9t\u00e9.xml', b'<x/>', True),
+        ]
+        pkg_writer = PhysPkgWriter(pkg_file, 9, executor)
+        for partname, blob, compress in blobs:
+            pkg_writer.write(PackURI(partname), blob, compress)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.namelist() == [b[0][1:] for b in blobs]
+        assert [zipf.read(b[0][1:]) for b in blobs] == [b[1] for b in blobs]
+        assert [i.compress_type for i in zipf.infolist()] == [
+            ZIP_DEFLATED, ZIP_STORED, ZIP_DEFLATED
+        ]
+        zipf.close()
+
+    def it_stores_members_at_compression_level_0(self, executor):
+        pkg_file = BytesIO()
+        pkg_writer = PhysPkgWriter(pkg_file, 0, executor)
+        pkg_writer.write(PackURI('/word/document.xml'), b'<w:document/>')
+        pkg_writer.close()
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.getinfo('word/document.xml').compress_type == ZIP_STORED
+        assert zipf.read('word/document.xml') == b'<w:document/>'
+        zipf.close()
+
+    def it_can_write_to_a_path(self, executor, tmp_docx_path):
+        pkg_writer = PhysPkgWriter(tmp_docx_path, executor=executor)
+        pkg_writer.write(PackURI('/foo.xml'), b'<foo/>')
+        pkg_writer.close()
+        zipf = ZipFile(tmp_docx_path, 'r')
+        assert zipf.read('foo.xml') == b'<foo/>'
+        zipf.close()
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def executor(self, request):
+        executor = ThreadPoolExecutor(2)
+        request.addfinalizer(executor.shutdown)
+        return executor
+
+
+class Describe_ZipMemberWriter(object):
+
+    def it_can_write_the_same_member_to_many_zip_files(self):
+        member = _ZipMember.from_blob('word/document.xml', b'<w:p/>' * 99, 6)
+        for _ in range(2):
+            pkg_file = BytesIO()
+            member_writer = _ZipMemberWriter(pkg_file)
+            member_writer.write_member(member.copy())
+            member_writer.close()
+            zipf = ZipFile(pkg_file, 'r')
+            assert zipf.testzip() is None
+            assert zipf.read('word/document.xml') == b'<w:p/>' * 99
+            zipf.close()
+        assert member.data is not None
+
+
 # fixtures -------------------------------------------------
 
 @pytest.fixture
@@ -9,7 +9,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 import pytest
 
 from docx.opc.constants import (
-    CONTENT_TYPE as CT, RELATIONSHIP_TARGET_MODE as RTM
+    CONTENT_TYPE as CT, RELATIONSHIP_TARGET_MODE as RTM,
+    RELATIONSHIP_TYPE as RT
 )
 from docx.opc.packuri import PackURI
 from docx.opc.phys_pkg import _ZipPkgReader
@@ -18,6 +19,7 @@ from docx.opc.pkgreader import (
     _SerializedRelationships
 )
 
+from ..unitutil.file import docx_path
 from .unitdata.types import a_Default, a_Types, an_Override
 from ..unitutil.mock import (
     call, class_mock, function_mock, initializer_mock, instance_mock,
@@ -42,17 +44,72 @@ class DescribePackageReader(object):
         PhysPkgReader_.assert_called_once_with(pkg_file)
         from_xml.assert_called_once_with(phys_reader.content_types_xml)
         _srels_for.assert_called_once_with(phys_reader, '/')
-        _load_serialized_parts.assert_called_once_with(phys_reader, pkg_srels,
-                                                       content_types)
+        _load_serialized_parts.assert_called_once_with(
+            phys_reader, pkg_srels, content_types, True
+        )
         phys_reader.close.assert_called_once_with()
-        init.assert_called_once_with(content_types, pkg_srels, sparts)
+        init.assert_called_once_with(
+            content_types, pkg_srels, sparts, phys_reader.compressed_sizes,
+            None, phys_reader.sizes
+        )
         assert isinstance(pkg_reader, PackageReader)
 
+    def it_keeps_the_pkg_file_open_when_lazy(
+            self, init, PhysPkgReader_, from_xml, _srels_for,
+            _load_serialized_parts):
+        phys_reader = PhysPkgReader_.return_value
+        PackageReader.from_file('foo.docx', lazy=True)
+        _load_serialized_parts.assert_called_once_with(
+            phys_reader, _srels_for.return_value, from_xml.return_value,
+            False
+        )
+        assert phys_reader.close.call_count == 0
+        init.assert_called_once_with(
+            from_xml.return_value, _srels_for.return_value,
+            _load_serialized_parts.return_value,
+            phys_reader.compressed_sizes, phys_reader, phys_reader.sizes
+        )
+
+    def it_reads_a_blob_from_the_pkg_file_it_keeps_open(self):
+        phys_reader = Mock(name='phys_reader')
+        phys_reader.blob_for.return_value = b'<foo/>'
+        pkg_reader = PackageReader(None, [], [], None, phys_reader)
+
+        blob = pkg_reader.blob_for('/word/foo.xml')
+        pkg_reader.close()
+
+        phys_reader.blob_for.assert_called_once_with('/word/foo.xml')
+        phys_reader.close.assert_called_once_with()
+        assert blob == b'<foo/>'
+        with pytest.raises(ValueError):
+            pkg_reader.blob_for('/word/foo.xml')
+
+    def it_streams_a_blob_from_the_pkg_file_it_keeps_open(self):
+        phys_reader = Mock(name='phys_reader')
+        pkg_reader = PackageReader(None, [], [], None, phys_reader)
+
+        stream = pkg_reader.stream_for('/word/foo.xml')
+        pkg_reader.close()
+
+        phys_reader.stream_for.assert_called_once_with('/word/foo.xml')
+        assert stream is phys_reader.stream_for.return_value
+        with pytest.raises(ValueError):
+            pkg_reader.stream_for('/word/foo.xml')
+
     def it_can_iterate_over_the_serialized_parts(self, iter_sparts_fixture):
         pkg_reader, expected_iter_spart_items = iter_sparts_fixture
         iter_spart_items = list(pkg_reader.iter_sparts())
         assert iter_spart_items == expected_iter_spart_items
 
+    def it_can_read_only_the_parts_related_to_the_package(self):
+        reltypes = (RT.OFFICE_DOCUMENT, RT.CORE_PROPERTIES, RT.IMAGE)
+        blobs = PackageReader.package_part_blobs(
+            docx_path('test'), reltypes
+        )
+        assert sorted(blobs) == sorted(reltypes[:2])
+        assert blobs[RT.OFFICE_DOCUMENT].startswith(b'<?xml')
+        assert b'coreProperties' in blobs[RT.CORE_PROPERTIES]
+
     def it_can_iterate_over_all_the_srels(self):
         # mockery ----------------------
         pkg_srels = ['srel1', 'srel2']
@@ -155,6 +212,26 @@ class DescribePackageReader(object):
         ]
         assert generated_tuples == expected_tuples
 
+    def it_can_walk_phys_pkg_parts_without_reading_blobs(self, _srels_for):
+        srels = [
+            Mock(name='rId1', is_external=False, reltype='reltype1',
+                 target_partname='/part/name1.xml'),
+            Mock(name='rId2', is_external=False, reltype='reltype2',
+                 target_partname='/part/name2.xml'),
+        ]
+        _srels_for.side_effect = [srels[1:], []]
+        phys_reader = Mock(name='phys_reader')
+
+        generated_tuples = list(
+            PackageReader._walk_phys_parts(phys_reader, srels[:1], False)
+        )
+
+        assert generated_tuples == [
+            ('/part/name1.xml', None, 'reltype1', srels[1:]),
+            ('/part/name2.xml', None, 'reltype2', []),
+        ]
+        assert phys_reader.blob_for.call_count == 0
+
     def it_can_retrieve_srels_for_a_source_uri(
             self, _SerializedRelationships_):
         # mockery ----------------------
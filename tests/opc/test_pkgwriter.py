@@ -6,11 +6,16 @@ Test suite for opc.pkgwriter module
 
 import pytest
 
+from io import BytesIO
+from zipfile import ZipFile
+
 from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part
 from docx.opc.phys_pkg import _ZipPkgWriter
-from docx.opc.pkgwriter import _ContentTypesItem, PackageWriter
+from docx.opc.pkgwriter import (
+    _ContentTypesItem, PackageWriter, PRECOMPRESSED_CONTENT_TYPES
+)
 
 from .unitdata.types import a_Default, a_Types, an_Override
 from ..unitutil.mock import (
@@ -32,12 +37,92 @@ class DescribePackageWriter(object):
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
             call._write_pkg_rels(phys_writer, pkg_rels),
-            call._write_parts(phys_writer, parts),
+            call._write_parts(phys_writer, parts, None, None),
         ]
-        PhysPkgWriter_.assert_called_once_with(pkg_file)
+        PhysPkgWriter_.assert_called_once_with(pkg_file, None)
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
 
+    def it_can_write_a_package_using_a_thread_pool(
+            self, PhysPkgWriter_, _write_methods):
+        pkg_file, pkg_rels, parts = 'foo.docx', Mock(name='pkg_rels'), []
+        phys_writer = PhysPkgWriter_.return_value
+
+        PackageWriter.write(pkg_file, pkg_rels, parts, 6, (), max_workers=2)
+
+        _, _, executor = PhysPkgWriter_.call_args[0]
+        PhysPkgWriter_.assert_called_once_with(pkg_file, 6, executor)
+        assert _write_methods.mock_calls[-1] == call._write_parts(
+            phys_writer, parts, (), executor
+        )
+        phys_writer.close.assert_called_once_with()
+
+    def it_can_generate_a_package_in_chunks(self):
+        pkg_rels = Mock(name='pkg_rels', xml=b'<Relationships/>')
+        parts = [
+            Mock(
+                name='part%d' % n, partname=PackURI('/word/p%d.xml' % n),
+                content_type=CT.XML, blob=b'<p/>' * 100, _rels=[]
+            ) for n in range(3)
+        ]
+
+        chunks = list(PackageWriter.iter_write(pkg_rels, parts))
+
+        assert len(chunks) == 5
+        zipf = ZipFile(BytesIO(b''.join(chunks)), 'r')
+        assert zipf.namelist() == [
+            '[Content_Types].xml', '_rels/.rels', 'word/p0.xml',
+            'word/p1.xml', 'word/p2.xml'
+        ]
+        assert zipf.read('word/p2.xml') == b'<p/>' * 100
+        zipf.close()
+
+    def it_can_generate_the_blobs_of_a_package(self):
+        pkg_rels = Mock(name='pkg_rels', xml=b'<Relationships/>')
+        parts = [
+            Mock(
+                name='part%d' % n, partname=PackURI('/word/p%d.xml' % n),
+                content_type=CT.XML, blob=b'<p%d/>' % n, _rels=MagicMock()
+            ) for n in range(2)
+        ]
+        parts[0]._rels.__len__.return_value = 0
+        parts[1]._rels.__len__.return_value = 1
+        parts[1]._rels.xml = b'<rels/>'
+
+        blobs = list(PackageWriter.iter_blobs(pkg_rels, parts))
+
+        assert [uri for uri, _ in blobs] == [
+            '/[Content_Types].xml', '/_rels/.rels', '/word/p0.xml',
+            '/word/p1.xml', '/word/_rels/p1.xml.rels'
+        ]
+        assert [blob for _, blob in blobs[1:]] == [
+            b'<Relationships/>', b'<p0/>', b'<p1/>', b'<rels/>'
+        ]
+
+    def it_can_write_a_package_to_a_non_seekable_stream(self):
+        class WriteOnly(object):
+            def __init__(self):
+                self.data = BytesIO()
+
+            def write(self, data):
+                return self.data.write(data)
+
+            def flush(self):
+                pass
+
+        stream = WriteOnly()
+        part = Mock(
+            name='part', partname=PackURI('/word/document.xml'),
+            content_type=CT.XML, blob=b'<w:document/>', _rels=[]
+        )
+        pkg_rels = Mock(name='pkg_rels', xml=b'<Relationships/>')
+
+        PackageWriter.write(stream, pkg_rels, [part])
+
+        zipf = ZipFile(BytesIO(stream.data.getvalue()), 'r')
+        assert zipf.read('word/document.xml') == b'<w:document/>'
+        zipf.close()
+
     def it_can_write_a_content_types_stream(self, write_cti_fixture):
         _ContentTypesItem_, parts_, phys_pkg_writer_, blob_ = (
             write_cti_fixture
@@ -75,6 +160,20 @@ class DescribePackageWriter(object):
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
+    def it_stores_parts_of_a_stored_content_type_uncompressed(self):
+        phys_writer = Mock(name='phys_writer')
+        part1 = Mock(name='part1', content_type=CT.PNG, _rels=[])
+        part2 = Mock(name='part2', content_type=CT.XML, _rels=[])
+
+        PackageWriter._write_parts(
+            phys_writer, [part1, part2], PRECOMPRESSED_CONTENT_TYPES
+        )
+
+        assert phys_writer.write.mock_calls == [
+            call(part1.partname, part1.blob, False),
+            call(part2.partname, part2.blob),
+        ]
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,46 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.opc.profile module
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.profile import LOAD_PROFILES, LoadProfile
+
+
+class DescribeLoadProfile(object):
+
+    def it_resolves_the_load_argument_to_a_profile(self):
+        profile = LoadProfile(skip_reltypes=(RT.IMAGE,))
+        assert LoadProfile.from_load(None) is LOAD_PROFILES['full']
+        assert LoadProfile.from_load('text') is LOAD_PROFILES['text']
+        assert LoadProfile.from_load(profile) is profile
+
+    def it_raises_on_an_unknown_profile_name(self):
+        with pytest.raises(ValueError):
+            LoadProfile.from_load('everything')
+
+    @pytest.mark.parametrize('name, content_type, reltype, expected', [
+        ('full', CT.PNG, RT.IMAGE, False),
+        ('no-media', CT.PNG, RT.IMAGE, True),
+        ('no-media', CT.WML_HEADER, RT.HEADER, False),
+        ('text', CT.WML_HEADER, RT.HEADER, True),
+        ('text', CT.WML_STYLES, RT.STYLES, False),
+        ('metadata', CT.WML_STYLES, RT.STYLES, True),
+        ('metadata', CT.OPC_CORE_PROPERTIES, RT.CORE_PROPERTIES, False),
+        ('metadata', CT.WML_DOCUMENT_MAIN, RT.OFFICE_DOCUMENT, False),
+    ])
+    def it_knows_which_parts_it_skips(
+            self, name, content_type, reltype, expected):
+        profile = LOAD_PROFILES[name]
+        assert profile.skips(content_type, reltype) is expected
+        assert profile.skips_parts is (name != 'full')
+
+    def it_can_skip_parts_by_content_type(self):
+        profile = LoadProfile(skip_content_types=(CT.PNG,))
+        assert profile.skips(CT.PNG, RT.IMAGE) is True
+        assert profile.skips(CT.JPEG, RT.IMAGE) is False
@@ -0,0 +1,130 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.opc.stats module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from lxml import etree
+
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part, XmlPart
+from docx.opc.stats import (
+    ATTRIBUTE_BYTES, NODE_BYTES, PackageStats, PartStats, tree_stats
+)
+
+from ..unitutil.cxml import element
+from ..unitutil.mock import instance_mock, Mock
+
+
+class DescribePackageStats(object):
+
+    def it_totals_the_sizes_of_its_parts(self, package_stats):
+        assert package_stats.compressed_size == 300
+        assert package_stats.size == 1500
+        assert package_stats.element_count == 12
+        assert package_stats.tree_memory == 4000
+        assert package_stats.rel_count == 3
+
+    def it_can_report_its_sizes_as_text(self, package_stats):
+        lines = package_stats.report().splitlines()
+        assert lines[1].split() == ['/word/document.xml', '300', '1000',
+                                    '12', '4000', '2']
+        assert lines[2].split() == ['/media/image1.png', '500', '1']
+        assert lines[3].split() == ['total', '300', '1500', '12', '4000',
+                                    '3']
+        assert lines[6].split() == ['image_parts', '1']
+        assert lines[7].split() == ['/word/document.xml', 'index', '7']
+
+    def it_shows_its_report_as_its_repr(self, package_stats):
+        assert repr(package_stats) == package_stats.report()
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def package_stats(self):
+        return PackageStats([
+            PartStats('/media/image1.png', 'image/png', None, 500, None,
+                      None, 1, {}),
+            PartStats('/word/document.xml', 'application/xml', 300, 1000,
+                      12, 4000, 2, {'index': 7}),
+        ], {'image_parts': 1})
+
+
+class DescribePartStats(object):
+
+    def it_can_be_constructed_from_an_xml_part(self, request):
+        part_ = instance_mock(
+            request, XmlPart, partname=PackURI('/word/document.xml'),
+            content_type='application/xml', element=element('w:p/w:r'),
+            blob=b'0123456789', rels={'rId1': None}
+        )
+        part_._cache_sizes.return_value = {'index': 3}
+
+        stats = PartStats.from_part(part_, 6, 8)
+
+        assert stats.partname == '/word/document.xml'
+        assert stats.content_type == 'application/xml'
+        assert (stats.compressed_size, stats.size) == (6, 8)
+        assert stats.element_count == 2
+        assert stats.tree_memory == 2 * NODE_BYTES
+        assert stats.rel_count == 1
+        assert stats.caches == {'index': 3}
+
+    def it_can_be_constructed_from_a_binary_part(
+            self, request):
+        part_ = instance_mock(
+            request, Part, partname=PackURI('/media/image1.png'),
+            content_type='image/png', blob=b'0123', rels={}
+        )
+        part_._cache_sizes.return_value = {}
+
+        stats = PartStats.from_part(part_)
+
+        assert (stats.compressed_size, stats.size) == (None, 4)
+        assert (stats.element_count, stats.tree_memory) == (None, None)
+
+    def it_serializes_an_xml_part_to_measure_it_only_when_asked(
+            self, request):
+        part_ = instance_mock(
+            request, XmlPart, partname=PackURI('/word/document.xml'),
+            content_type='application/xml', element=element('w:p'),
+            blob=b'0123456789', rels={}
+        )
+        part_._cache_sizes.return_value = {}
+
+        assert PartStats.from_part(part_).size is None
+        assert PartStats.from_part(part_, 6, 8, serialize=True).size == 10
+
+    def it_leaves_a_part_not_loaded_yet_unloaded(self):
+        read_blob_ = Mock(name='read_blob', return_value=b'<foo/>')
+        part = XmlPart.load_deferred(
+            PackURI('/word/foo.xml'), 'application/xml', read_blob_, None
+        )
+
+        stats = PartStats.from_part(part, 4, 6)
+
+        assert read_blob_.call_count == 0
+        assert (stats.compressed_size, stats.size) == (4, 6)
+        assert (stats.element_count, stats.tree_memory) == (None, None)
+
+
+class Describe_tree_stats(object):
+
+    def it_counts_the_elements_and_estimates_the_memory_of_a_tree(self):
+        p = element('w:p/(w:pPr/w:jc{w:val=left},w:r/w:t"foo")')
+        element_count, memory = tree_stats(p)
+        assert element_count == 5
+        assert memory == (
+            5 * NODE_BYTES + ATTRIBUTE_BYTES + NODE_BYTES + len('left') +
+            NODE_BYTES + len('foo')
+        )
+
+    def it_counts_the_text_between_the_children_of_an_element(self):
+        p = etree.fromstring('<p>ab<r/>cde<!--fg--><r/>h</p>')
+        element_count, memory = tree_stats(p)
+        assert element_count == 3
+        assert memory == 3 * NODE_BYTES + 3 * NODE_BYTES + len('abcdeh')
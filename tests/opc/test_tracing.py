@@ -0,0 +1,108 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.opc.tracing module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+import threading
+
+from io import BytesIO
+
+from docx.api import Document
+from docx.opc.tracing import (
+    get_tracer, set_tracer, span, Span, TimingCollector, trace, Tracer,
+    using
+)
+
+
+class DescribeTracing(object):
+
+    def it_hands_out_a_null_span_when_disabled(self):
+        assert get_tracer() is None
+        with span('open') as open_span:
+            assert not open_span
+
+    def it_passes_each_ended_span_to_the_tracer(self):
+        tracer = TimingCollector()
+        previous = set_tracer(tracer)
+        try:
+            with span('read_part', '/word/document.xml') as read_span:
+                assert read_span
+                read_span.record(42)
+        finally:
+            assert set_tracer(previous) is tracer
+        assert tracer.spans == [read_span]
+        assert isinstance(read_span, Span)
+        assert read_span.phase == 'read_part'
+        assert read_span.partname == '/word/document.xml'
+        assert read_span.size == 42
+        assert read_span.seconds >= 0
+
+    def it_traces_opening_and_saving_a_document(self):
+        with trace() as collector:
+            document = Document()
+            document.save(BytesIO())
+
+        assert get_tracer() is None
+        phases = collector.phase_totals()
+        for phase in ('open', 'read_package', 'read_part', 'parse_xml',
+                      'load_part', 'unmarshal_parts', 'gather_image_parts',
+                      'save', 'serialize_part', 'write_part'):
+            assert phase in phases
+        parse_spans = [s for s in collector.spans if s.phase == 'parse_xml']
+        document_span = [
+            s for s in parse_spans if s.partname == '/word/document.xml'
+        ][0]
+        assert document_span.element_count > 1
+        assert document_span.size > 0
+        report = collector.report(slowest=len(collector.spans))
+        assert 'parse_xml' in report
+        assert '/word/document.xml' in report
+
+    def it_restores_the_prior_tracer_on_error(self):
+        tracer = Tracer()
+        with pytest.raises(ValueError):
+            with trace(tracer) as installed:
+                assert installed is tracer
+                raise ValueError()
+        assert get_tracer() is None
+
+    def it_traces_only_the_thread_it_is_installed_for(self):
+        seen = []
+
+        def open_untraced():
+            seen.append(get_tracer())
+            Document()
+
+        with trace() as collector:
+            thread = threading.Thread(target=open_untraced)
+            thread.start()
+            thread.join()
+
+        assert seen == [None]
+        assert collector.spans == []
+
+    def it_traces_the_call_it_is_passed_to(self):
+        open_collector, save_collector = TimingCollector(), TimingCollector()
+        with trace() as thread_collector:
+            document = Document(tracer=open_collector)
+            document.save(BytesIO(), max_workers=2, tracer=save_collector)
+
+        assert thread_collector.spans == []
+        assert 'open' in open_collector.phase_totals()
+        assert 'save' not in open_collector.phase_totals()
+        save_phases = save_collector.phase_totals()
+        assert 'open' not in save_phases
+        assert save_phases['serialize_part'][0] == len(
+            document.part.package.parts
+        )
+
+    def it_leaves_the_thread_tracer_in_place_without_one(self):
+        tracer = Tracer()
+        with trace(tracer):
+            with using(None):
+                assert get_tracer() is tracer
+        assert get_tracer() is None
@@ -20,11 +20,17 @@ class DescribeCT_R(object):
         r.add_t(text)
         assert r.xml == expected_xml
 
+    def it_can_replace_part_of_its_text(self, replace_text_fixture):
+        r, start, end, text, expected_xml = replace_text_fixture
+        r.replace_text(start, end, text)
+        assert r.xml == expected_xml
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
         ('w:r', 'foobar',  'w:r/w:t"foobar"'),
         ('w:r', 'foobar ', 'w:r/w:t{xml:space=preserve}"foobar "'),
+        ('w:r', ' foobar', 'w:r/w:t{xml:space=preserve}" foobar"'),
         ('w:r/(w:rPr/w:rStyle{w:val=emphasis}, w:cr)', 'foobar',
          'w:r/(w:rPr/w:rStyle{w:val=emphasis}, w:cr, w:t"foobar")'),
     ])
@@ -33,3 +39,18 @@ class DescribeCT_R(object):
         r = element(initial_cxml)
         expected_xml = xml(expected_cxml)
         return r, text, expected_xml
+
+    @pytest.fixture(params=[
+        ('w:r/w:t"foobar"', 1, 3, 'OO', 'w:r/w:t"fOObar"'),
+        ('w:r/(w:t"foo",w:drawing,w:t"bar")', 2, 4, 'X',
+         'w:r/(w:t"foX",w:drawing,w:t"ar")'),
+        ('w:r/(w:t"ab",w:tab,w:t"cd",w:fldChar)', 1, 4, '\t',
+         'w:r/(w:t"a",w:tab,w:t"d",w:fldChar)'),
+        ('w:r/(w:rPr/w:b,w:drawing,w:t"foo")', 0, 3, '',
+         'w:r/(w:rPr/w:b,w:drawing)'),
+    ])
+    def replace_text_fixture(self, request):
+        initial_cxml, start, end, text, expected_cxml = request.param
+        r = element(initial_cxml)
+        expected_xml = xml(expected_cxml)
+        return r, start, end, text, expected_xml
@@ -35,7 +35,15 @@ class DescribeDocumentPart(object):
     def it_can_save_the_package_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._package.save.assert_called_once_with(file_)
+        document._package.save.assert_called_once_with(
+            file_, None, None, None
+        )
+
+    def it_can_save_the_package_to_chunks(self, save_fixture):
+        document, _ = save_fixture
+        chunks = document.iter_save_chunks(1, ())
+        document._package.iter_save_chunks.assert_called_once_with(1, ())
+        assert chunks is document._package.iter_save_chunks.return_value
 
     def it_can_get_or_add_an_image(self, get_image_fixture):
         document_part, path, image_part_, rId_, image_ = get_image_fixture
@@ -57,6 +65,13 @@ class DescribeDocumentPart(object):
         styles = document_part.styles
         assert styles is styles_
 
+    def it_provides_access_to_the_format_resolver(
+            self, _styles_part_prop_, styles_part_):
+        document_part = DocumentPart(None, None, None, None)
+        _styles_part_prop_.return_value = styles_part_
+        format_resolver = document_part.format_resolver
+        assert format_resolver is styles_part_.format_resolver
+
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         document_part, core_properties_ = core_props_fixture
         core_properties = document_part.core_properties
@@ -16,7 +16,9 @@ from docx.package import Package
 from docx.parts.image import ImagePart
 
 from ..unitutil.file import test_file
-from ..unitutil.mock import initializer_mock, instance_mock, method_mock
+from ..unitutil.mock import (
+    initializer_mock, instance_mock, method_mock, Mock
+)
 
 
 class DescribeImagePart(object):
@@ -58,6 +60,14 @@ class DescribeImagePart(object):
         image_part = ImagePart(None, None, blob)
         assert image_part.sha1 == '4921e7002ddfba690a937d54bda226a7b8bdeb68'
 
+    def it_reads_a_deferred_blob_for_its_sha1_without_keeping_it(self):
+        read_blob_ = Mock(name='read_blob', return_value=b'fO0Bar')
+        image_part = ImagePart.load_deferred(None, None, read_blob_, None)
+
+        assert image_part.sha1 == '4921e7002ddfba690a937d54bda226a7b8bdeb68'
+        assert '_blob' not in image_part.__dict__
+        assert image_part.blob == b'fO0Bar'
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -8,6 +8,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from docx.opc.constants import CONTENT_TYPE as CT
 from docx.oxml.numbering import CT_Numbering
 from docx.parts.numbering import NumberingPart, _NumberingDefinitions
 
@@ -17,6 +18,13 @@ from ..unitutil.mock import class_mock, instance_mock
 
 class DescribeNumberingPart(object):
 
+    def it_can_create_a_new_numbering_part(self):
+        numbering_part = NumberingPart.new()
+        assert numbering_part.partname == '/word/numbering.xml'
+        assert numbering_part.content_type == CT.WML_NUMBERING
+        assert isinstance(numbering_part.element, CT_Numbering)
+        assert len(numbering_part.element) == 0
+
     def it_provides_access_to_the_numbering_definitions(
             self, num_defs_fixture):
         (numbering_part, _NumberingDefinitions_, numbering_elm_,
@@ -12,7 +12,8 @@ from docx.opc.constants import CONTENT_TYPE as CT
 from docx.opc.package import OpcPackage
 from docx.oxml.styles import CT_Styles
 from docx.parts.styles import StylesPart
-from docx.styles.styles import Styles
+from docx.styles.effective import EffectiveFormatResolver
+from docx.styles.styles import Styles, StyleIndex
 
 from ..unitutil.mock import class_mock, instance_mock
 
@@ -22,9 +23,37 @@ class DescribeStylesPart(object):
     def it_provides_access_to_its_styles(self, styles_fixture):
         styles_part, Styles_, styles_ = styles_fixture
         styles = styles_part.styles
-        Styles_.assert_called_once_with(styles_part.element)
+        Styles_.assert_called_once_with(
+            styles_part.element, styles_part.style_index
+        )
         assert styles is styles_
 
+    def it_keeps_one_style_index_for_its_styles(self, styles_elm_):
+        styles_part = StylesPart(None, None, styles_elm_, None)
+        style_index = styles_part.style_index
+        assert isinstance(style_index, StyleIndex)
+        assert styles_part.style_index is style_index
+        assert styles_part.styles._index is style_index
+
+    def it_keeps_one_format_resolver(self, styles_elm_):
+        styles_part = StylesPart(None, None, styles_elm_, None)
+        format_resolver = styles_part.format_resolver
+        assert isinstance(format_resolver, EffectiveFormatResolver)
+        assert format_resolver._style_index is styles_part.style_index
+        assert styles_part.format_resolver is format_resolver
+
+    def it_reports_the_size_of_its_caches(self):
+        styles_part = StylesPart.default(OpcPackage())
+        assert styles_part._cache_sizes() == {}
+
+        styles_part.style_index.get_by_id('Normal')
+        styles_part.format_resolver
+        assert styles_part._cache_sizes() == {
+            'style_index': len(styles_part.style_index),
+            'format_resolver': 0,
+        }
+        assert len(styles_part.style_index) > 0
+
     def it_can_construct_a_default_styles_part_to_help(self):
         package = OpcPackage()
         styles_part = StylesPart.default(package)
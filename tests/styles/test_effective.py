@@ -0,0 +1,131 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.styles.effective module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt
+from docx.styles.effective import (
+    EffectiveFont, EffectiveFormatResolver, EffectiveParagraphFormat
+)
+from docx.styles.styles import StyleIndex
+
+from ..unitutil.cxml import element
+
+
+STYLES_CXML = (
+    'w:styles/('
+    'w:docDefaults/(w:rPrDefault/w:rPr/(w:rFonts{w:ascii=Calibri},'
+    'w:sz{w:val=22}),w:pPrDefault/w:pPr/w:spacing{w:after=160}),'
+    'w:style{w:type=paragraph,w:default=1,w:styleId=Normal}/w:rPr/'
+    'w:sz{w:val=24},'
+    'w:style{w:type=paragraph,w:styleId=Heading1}/(w:basedOn{w:val=Normal}'
+    ',w:pPr/w:jc{w:val=center},w:rPr/(w:b,w:sz{w:val=32})),'
+    'w:style{w:type=paragraph,w:styleId=Title}/(w:basedOn{w:val=Heading1}'
+    ',w:rPr/w:i),'
+    'w:style{w:type=character,w:styleId=Emphasis}/w:rPr/(w:b{w:val=0},'
+    'w:u{w:val=single}),'
+    'w:style{w:type=paragraph,w:styleId=LoopA}/(w:basedOn{w:val=LoopB},'
+    'w:rPr/w:strike),'
+    'w:style{w:type=paragraph,w:styleId=LoopB}/w:basedOn{w:val=LoopA})'
+)
+
+
+class DescribeEffectiveFormatResolver(object):
+
+    def it_resolves_the_font_of_a_run(self, font_fixture):
+        resolver, r, expected_props = font_fixture
+        font = resolver.font(r)
+        assert isinstance(font, EffectiveFont)
+        assert font.properties == expected_props
+
+    def it_resolves_the_format_of_a_paragraph(self, parfmt_fixture):
+        resolver, p, expected_props = parfmt_fixture
+        paragraph_format = resolver.paragraph_format(p)
+        assert isinstance(paragraph_format, EffectiveParagraphFormat)
+        assert paragraph_format.properties == expected_props
+
+    def it_caches_the_properties_of_each_style(self, resolver):
+        p = element('w:p/(w:pPr/w:pStyle{w:val=Title},w:r)')
+        resolver.font(p[1])
+        cached = dict(resolver._style_props)
+        resolver.font(p[1])
+        assert set(cached) == {'Title', 'Heading1', 'Normal', None}
+        assert resolver._style_props == cached
+
+    def it_can_clear_its_cached_properties(self, resolver):
+        styles_elm = resolver._styles
+        p = element('w:p/(w:pPr/w:pStyle{w:val=Heading1},w:r)')
+        assert resolver.font(p[1]).size == Pt(16)
+        styles_elm.get_by_id('Heading1').rPr.sz_val = Pt(20)
+        assert resolver.font(p[1]).size == Pt(16)
+        resolver.clear()
+        assert resolver.font(p[1]).size == Pt(20)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:p/w:r',
+         {'name': 'Calibri', 'size': Pt(12)}),
+        ('w:r',
+         {'name': 'Calibri', 'size': Pt(12)}),
+        ('w:p/(w:pPr/w:pStyle{w:val=Heading1},w:r)',
+         {'name': 'Calibri', 'size': Pt(16), 'bold': True}),
+        ('w:p/(w:pPr/w:pStyle{w:val=Title},w:r)',
+         {'name': 'Calibri', 'size': Pt(16), 'bold': True, 'italic': True}),
+        ('w:p/(w:pPr/w:pStyle{w:val=Title},w:r/w:rPr/w:rStyle{w:val=Emph'
+         'asis})',
+         {'name': 'Calibri', 'size': Pt(16), 'bold': False, 'italic': True,
+          'underline': True}),
+        ('w:p/(w:pPr/w:pStyle{w:val=Title},w:r/w:rPr/(w:rStyle{w:val=Emph'
+         'asis},w:b,w:sz{w:val=8}))',
+         {'name': 'Calibri', 'size': Pt(4), 'bold': True, 'italic': True,
+          'underline': True}),
+        ('w:p/(w:pPr/w:pStyle{w:val=Missing},w:r)',
+         {'name': 'Calibri', 'size': Pt(12)}),
+        ('w:p/(w:pPr/w:pStyle{w:val=LoopA},w:r)',
+         {'name': 'Calibri', 'size': Pt(11), 'strike': True}),
+    ])
+    def font_fixture(self, request, resolver):
+        p_cxml, expected_props = request.param
+        p = element(p_cxml)
+        r = p if p.tag.endswith('}r') else p[-1]
+        return resolver, r, expected_props
+
+    @pytest.fixture(params=[
+        ('w:p',
+         {'space_after': Pt(8)}),
+        ('w:p/w:pPr/w:pStyle{w:val=Title}',
+         {'space_after': Pt(8), 'alignment': WD_ALIGN_PARAGRAPH.CENTER}),
+        ('w:p/w:pPr/(w:pStyle{w:val=Title},w:jc{w:val=right})',
+         {'space_after': Pt(8), 'alignment': WD_ALIGN_PARAGRAPH.RIGHT}),
+    ])
+    def parfmt_fixture(self, request, resolver):
+        p_cxml, expected_props = request.param
+        return resolver, element(p_cxml), expected_props
+
+    @pytest.fixture
+    def resolver(self):
+        styles_elm = element(STYLES_CXML)
+        return EffectiveFormatResolver(styles_elm, StyleIndex(styles_elm))
+
+
+class DescribeEffectiveFont(object):
+
+    def it_provides_access_to_each_effective_property(self):
+        font = EffectiveFont({'bold': True, 'size': Pt(12)})
+        assert font.bold is True
+        assert font.size == Pt(12)
+        assert font.italic is None
+
+    def it_is_read_only(self):
+        font = EffectiveFont({})
+        with pytest.raises(AttributeError):
+            font.bold = True
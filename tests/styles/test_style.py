@@ -15,6 +15,7 @@ from docx.styles.style import (
     BaseStyle, _CharacterStyle, _ParagraphStyle, _NumberingStyle,
     StyleFactory, _TableStyle
 )
+from docx.styles.styles import Styles
 from docx.text.font import Font
 from docx.text.parfmt import ParagraphFormat
 
@@ -27,7 +28,7 @@ class DescribeStyleFactory(object):
     def it_constructs_the_right_type_of_style(self, factory_fixture):
         style_elm, StyleCls_, style_ = factory_fixture
         style = StyleFactory(style_elm)
-        StyleCls_.assert_called_once_with(style_elm)
+        StyleCls_.assert_called_once_with(style_elm, None)
         assert style is style_
 
     # fixtures -------------------------------------------------------
@@ -174,6 +175,14 @@ class DescribeBaseStyle(object):
         assert styles.xml == expected_xml
         assert style._element is None
 
+    def it_tells_its_styles_when_deleted(self, request):
+        styles_ = instance_mock(request, Styles)
+        styles_elm = element('w:styles/w:style')
+        style_elm = styles_elm[0]
+        style = BaseStyle(style_elm, styles_)
+        style.delete()
+        styles_._forget.assert_called_once_with(style_elm)
+
     # fixture --------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -413,7 +422,7 @@ class Describe_CharacterStyle(object):
         style = _CharacterStyle(styles[style_idx])
         if base_style_idx >= 0:
             base_style = styles[base_style_idx]
-            StyleFactory_calls = [call(base_style)]
+            StyleFactory_calls = [call(base_style, None)]
             expected_value = StyleFactory_.return_value
         else:
             StyleFactory_calls = []
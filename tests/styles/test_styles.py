@@ -14,7 +14,7 @@ from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.styles import CT_Style, CT_Styles
 from docx.styles.latent import LatentStyles
 from docx.styles.style import BaseStyle
-from docx.styles.styles import Styles
+from docx.styles.styles import Styles, StyleIndex
 
 from ..unitutil.cxml import element
 from ..unitutil.mock import (
@@ -67,7 +67,7 @@ class DescribeStyles(object):
         styles._element.add_style_of_type.assert_called_once_with(
             name_, style_type, builtin
         )
-        StyleFactory_.assert_called_once_with(style_elm_)
+        StyleFactory_.assert_called_once_with(style_elm_, styles)
         assert style is style_
 
     def it_raises_when_style_name_already_used(self, add_raises_fixture):
@@ -144,6 +144,13 @@ class DescribeStyles(object):
         LatentStyles_.assert_called_once_with(styles._element.latentStyles)
         assert latent_styles is latent_styles_
 
+    def it_finds_a_style_added_by_add_style(self):
+        styles = Styles(element('w:styles/w:style{w:styleId=Foo}'))
+        assert 'Bar Baz' not in styles
+        style = styles.add_style('Bar Baz', WD_STYLE_TYPE.PARAGRAPH)
+        assert styles['Bar Baz'] == style
+        assert styles.get_by_id('BarBaz', WD_STYLE_TYPE.PARAGRAPH) == style
+
     # fixture --------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -155,6 +162,7 @@ class DescribeStyles(object):
         name, name_, style_type, builtin = request.param
         styles = Styles(styles_elm_)
         _getitem_.return_value = None
+        styles_elm_.get_by_name.return_value = None
         styles_elm_.add_style_of_type.return_value = style_elm_
         StyleFactory_.return_value = style_
         return (
@@ -181,7 +189,7 @@ class DescribeStyles(object):
         styles_cxml, is_defined, style_type = request.param
         styles_elm = element(styles_cxml)
         styles = Styles(styles_elm)
-        StyleFactory_calls = [call(styles_elm[-1])] if is_defined else []
+        StyleFactory_calls = [call(styles_elm[-1], styles)] if is_defined else []
         StyleFactory_.return_value = style_
         expected_value = style_ if is_defined else None
         return (
@@ -238,7 +246,7 @@ class DescribeStyles(object):
         style_elm = styles_elm[0]
         styles = Styles(styles_elm)
         default_calls = [] if style_id == 'Foo' else [call(style_type)]
-        StyleFactory_calls = [call(style_elm)] if style_id == 'Foo' else []
+        StyleFactory_calls = [call(style_elm, styles)] if style_id == 'Foo' else []
         default_.return_value = StyleFactory_.return_value = style_
         return (
             styles, style_id, style_type, default_calls, StyleFactory_,
@@ -324,7 +332,7 @@ class DescribeStyles(object):
         styles_cxml, expected_count = request.param
         styles_elm = element(styles_cxml)
         styles = Styles(styles_elm)
-        expected_calls = [call(style_elm) for style_elm in styles_elm]
+        expected_calls = [call(style_elm, styles) for style_elm in styles_elm]
         StyleFactory_.return_value = style_
         return styles, expected_count, style_, StyleFactory_, expected_calls
 
@@ -392,3 +400,122 @@ class DescribeStyles(object):
     @pytest.fixture
     def styles_elm_(self, request):
         return instance_mock(request, CT_Styles)
+
+
+class DescribeStyleIndex(object):
+
+    def it_can_find_a_style_by_name(self):
+        styles_elm = element(
+            'w:styles/(w:style/w:name{w:val=foo},w:style/w:name{w:val=bar},'
+            'w:style/w:name{w:val=foo})'
+        )
+        style_index = StyleIndex(styles_elm)
+        assert style_index.get_by_name('bar') is styles_elm[1]
+        assert style_index.get_by_name('foo') is styles_elm[0]
+        assert style_index.get_by_name('baz') is None
+
+    def it_can_find_a_style_by_id(self):
+        styles_elm = element(
+            'w:styles/(w:style{w:styleId=Foo},w:style{w:styleId=Bar})'
+        )
+        style_index = StyleIndex(styles_elm)
+        assert style_index.get_by_id('Bar') is styles_elm[1]
+        assert style_index.get_by_id('Baz') is None
+
+    def it_does_not_search_the_xml_for_an_indexed_style(self, request):
+        styles_elm = element(
+            'w:styles/(w:style{w:styleId=Foo}/w:name{w:val=foo},'
+            'w:style{w:styleId=Bar}/w:name{w:val=bar})'
+        )
+        get_by_id_ = method_mock(request, CT_Styles, 'get_by_id')
+        get_by_name_ = method_mock(request, CT_Styles, 'get_by_name')
+        style_index = StyleIndex(styles_elm)
+        assert style_index.get_by_id('Bar') is styles_elm[1]
+        assert style_index.get_by_name('foo') is styles_elm[0]
+        assert get_by_id_.call_count == get_by_name_.call_count == 0
+
+    def it_adds_a_new_style_to_its_indexes(self):
+        styles_elm = element('w:styles/w:style{w:styleId=Foo}')
+        style_index = StyleIndex(styles_elm)
+        style_index.get_by_id('Foo')
+        style = styles_elm.add_style_of_type('Bar', 1, False)
+        style_index.add(style)
+        assert style_index._by_id['Bar'] is style
+        assert style_index._by_name['Bar'] is style
+
+    def it_ignores_a_style_that_was_deleted(self):
+        styles_elm = element(
+            'w:styles/(w:style{w:styleId=Foo}/w:name{w:val=foo},'
+            'w:style{w:styleId=Foo}/w:name{w:val=foo})'
+        )
+        style_index = StyleIndex(styles_elm)
+        first_style = style_index.get_by_name('foo')
+        first_style.delete()
+        assert style_index.get_by_name('foo') is styles_elm[0]
+        assert style_index.get_by_id('Foo') is styles_elm[0]
+
+    def it_finds_a_style_renamed_after_indexing(self):
+        styles_elm = element('w:styles/w:style/w:name{w:val=foo}')
+        style_index = StyleIndex(styles_elm)
+        style_index.get_by_name('foo')
+        styles_elm[0].name_val = 'bar'
+        assert style_index.get_by_name('foo') is None
+        assert style_index.get_by_name('bar') is styles_elm[0]
+
+    def it_caches_the_default_style_for_a_type(self, request):
+        styles_elm = element(
+            'w:styles/w:style{w:type=table,w:default=1,w:styleId=Foo}'
+        )
+        default_for_ = method_mock(
+            request, CT_Styles, 'default_for', return_value=styles_elm[0]
+        )
+        style_index = StyleIndex(styles_elm)
+        assert style_index.default_for(WD_STYLE_TYPE.TABLE) is styles_elm[0]
+        assert style_index.default_for(WD_STYLE_TYPE.TABLE) is styles_elm[0]
+        assert default_for_.call_count == 1
+
+    def it_removes_a_deleted_style_from_its_indexes(self):
+        styles_elm = element(
+            'w:styles/(w:style{w:type=table,w:default=1,w:styleId=Foo}/'
+            'w:name{w:val=foo},w:style{w:styleId=Bar}/w:name{w:val=bar})'
+        )
+        foo = styles_elm[0]
+        style_index = StyleIndex(styles_elm)
+        style_index.get_by_id('Foo')
+        style_index.default_for(WD_STYLE_TYPE.TABLE)
+        foo.delete()
+        style_index.remove(foo)
+        assert style_index._by_id == {'Bar': styles_elm[0]}
+        assert style_index._by_name == {'bar': styles_elm[0]}
+        assert style_index._defaults == {}
+
+    def it_is_told_of_a_style_deleted_through_styles(self):
+        styles_elm = element(
+            'w:styles/(w:style{w:type=paragraph,w:styleId=Foo}/'
+            'w:name{w:val=foo},w:style{w:type=paragraph,w:styleId=Bar}/'
+            'w:name{w:val=bar})'
+        )
+        styles = Styles(styles_elm)
+        styles['foo'].delete()
+        assert len(styles._index) == 2
+        assert 'foo' not in styles
+
+    def it_finds_a_default_style_added_after_there_was_none(self):
+        styles_elm = element('w:styles')
+        style_index = StyleIndex(styles_elm)
+        assert style_index.default_for(WD_STYLE_TYPE.TABLE) is None
+        style = styles_elm.add_style_of_type('Foo', WD_STYLE_TYPE.TABLE, True)
+        style.default = True
+        assert style_index.default_for(WD_STYLE_TYPE.TABLE) is style
+
+    def it_drops_a_cached_default_that_is_no_longer_default(self):
+        styles_elm = element(
+            'w:styles/(w:style{w:type=table,w:default=1,w:styleId=Foo},'
+            'w:style{w:type=table,w:styleId=Bar})'
+        )
+        foo, bar = styles_elm
+        style_index = StyleIndex(styles_elm)
+        assert style_index.default_for(WD_STYLE_TYPE.TABLE) is foo
+        foo.default = False
+        bar.default = True
+        assert style_index.default_for(WD_STYLE_TYPE.TABLE) is bar
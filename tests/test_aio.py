@@ -0,0 +1,151 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.aio module
+"""
+
+import asyncio
+
+import pytest
+
+from io import BytesIO
+
+import docx
+
+from docx.aio import open_async, save_async
+from docx.api import Document
+from docx.opc.tracing import TimingCollector
+
+
+class DescribeOpenAsync(object):
+
+    def it_opens_a_document_from_a_path(self, docx_blob, tmpdir):
+        path = str(tmpdir.join('doc.docx'))
+        with open(path, 'wb') as f:
+            f.write(docx_blob)
+        document = _run(open_async(path))
+        assert list(document.iter_text()) == ['foobar']
+
+    def it_opens_a_document_from_bytes(self, docx_blob):
+        async def open_limited():
+            return await open_async(docx_blob, semaphore=asyncio.Semaphore())
+
+        document = _run(open_limited())
+        assert list(document.iter_text()) == ['foobar']
+
+    def it_opens_a_document_from_an_async_reader(self, docx_blob):
+        document = _run(open_async(_AsyncReader(docx_blob)))
+        assert list(document.iter_text()) == ['foobar']
+
+    def it_reports_the_timing_of_each_open_to_its_tracer(self, docx_blob):
+        collectors = TimingCollector(), TimingCollector()
+
+        async def open_both():
+            return await asyncio.gather(*(
+                open_async(docx_blob, tracer=collector)
+                for collector in collectors
+            ))
+
+        _run(open_both())
+        for collector in collectors:
+            assert collector.phase_totals()['open'][0] == 1
+
+    def it_is_available_from_the_package(self):
+        assert docx.open_async is open_async
+
+
+class DescribeSaveAsync(object):
+
+    def it_saves_a_document_to_a_stream(self, document):
+        stream = BytesIO()
+        _run(document.save_async(stream))
+        assert _text_of(stream.getvalue()) == ['foobar']
+
+    def it_streams_a_document_to_an_async_writer(self, document):
+        sink = _AsyncWriter()
+
+        async def save_limited():
+            await save_async(document, sink, semaphore=asyncio.Semaphore())
+
+        _run(save_limited())
+        assert len(sink.chunks) > 1
+        assert _text_of(b''.join(sink.chunks)) == ['foobar']
+
+    def it_reports_the_timing_of_streaming_to_its_tracer(self, document):
+        collector = TimingCollector()
+        _run(save_async(document, _AsyncWriter(), tracer=collector))
+        assert collector.phase_totals()['write_part'][0] == len(
+            document.part.package.parts
+        )
+
+    def it_drains_a_stream_writer_after_each_chunk(self, document):
+        sink = _DrainingWriter()
+        _run(save_async(document, sink))
+        assert sink.drains == len(sink.chunks)
+        assert _text_of(b''.join(sink.chunks)) == ['foobar']
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def document(self):
+        document = Document()
+        document.add_paragraph('foobar')
+        return document
+
+
+# fixtures -----------------------------------------------------------
+
+@pytest.fixture
+def docx_blob():
+    document = Document()
+    document.add_paragraph('foobar')
+    stream = BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+
+# helpers ------------------------------------------------------------
+
+class _AsyncReader(object):
+
+    def __init__(self, blob):
+        self._blob = blob
+
+    async def read(self):
+        return self._blob
+
+
+class _AsyncWriter(object):
+
+    def __init__(self):
+        self.chunks = []
+
+    async def write(self, chunk):
+        self.chunks.append(chunk)
+
+
+class _DrainingWriter(object):
+
+    def __init__(self):
+        self.chunks = []
+        self.drains = 0
+
+    def write(self, chunk):
+        self.chunks.append(chunk)
+
+    async def drain(self):
+        self.drains += 1
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def _text_of(blob):
+    return list(Document(BytesIO(blob)).iter_text())
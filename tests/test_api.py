@@ -8,13 +8,17 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import os
 import pytest
+import subprocess
+import sys
 
 import docx
 
-from docx.api import Document
+from docx.api import Document, read_core_properties
 from docx.opc.constants import CONTENT_TYPE as CT
 
+from .unitutil.file import docx_path
 from .unitutil.mock import function_mock, instance_mock, class_mock
 
 
@@ -23,13 +27,13 @@ class DescribeDocument(object):
     def it_opens_a_docx_file(self, open_fixture):
         docx, Package_, document_ = open_fixture
         document = Document(docx)
-        Package_.open.assert_called_once_with(docx)
+        Package_.open.assert_called_once_with(docx, False, None)
         assert document is document_
 
     def it_opens_the_default_docx_if_none_specified(self, default_fixture):
         docx, Package_, document_ = default_fixture
         document = Document()
-        Package_.open.assert_called_once_with(docx)
+        Package_.open.assert_called_once_with(docx, False, None)
         assert document is document_
 
     def it_raises_on_not_a_Word_file(self, raise_fixture):
@@ -37,6 +41,12 @@ class DescribeDocument(object):
         with pytest.raises(ValueError):
             Document(not_a_docx)
 
+    def it_names_a_buffer_by_its_type_when_not_a_Word_file(self, Package_):
+        Package_.open.return_value.main_document_part.content_type = 'BOGUS'
+        with pytest.raises(ValueError) as e:
+            Document(b'PK\x03\x04' * 99)
+        assert "file 'bytes' is not a Word file" in str(e.value)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -75,3 +85,45 @@ class DescribeDocument(object):
     @pytest.fixture
     def Package_(self, request):
         return class_mock(request, 'docx.api.Package')
+
+
+class DescribeReadCoreProperties(object):
+
+    def it_reads_the_core_properties_of_a_package(self):
+        path = docx_path('test')
+        core_properties = read_core_properties(path)
+        expected = docx.Document(path).core_properties
+        assert core_properties.title == expected.title
+        assert core_properties.modified == expected.modified
+
+    def it_is_available_from_the_package(self):
+        assert docx.read_core_properties is read_core_properties
+
+
+class DescribePackageRoot(object):
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason='needs module __getattr__'
+    )
+    def it_imports_its_lazy_apis_only_when_used(self):
+        code = (
+            'import sys, docx\n'
+            'print(sorted(m for m in sys.modules if m in %r))\n'
+            'docx.extract_many\n'
+            'print("docx.batch" in sys.modules)\n'
+        ) % (_LAZY_MODULES,)
+        output = subprocess.check_output(
+            [sys.executable, '-c', code],
+            cwd=os.path.dirname(os.path.dirname(docx.__file__)),
+        )
+        assert output.decode().split() == ['[]', 'True']
+
+    def it_raises_on_an_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            docx.no_such_name
+
+
+_LAZY_MODULES = (
+    'asyncio', 'docx.aio', 'docx.batch', 'docx.composer', 'docx.splitter',
+    'docx.template', 'multiprocessing',
+)
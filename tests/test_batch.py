@@ -0,0 +1,111 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.batch module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from io import BytesIO
+
+from docx.api import Document
+from docx.batch import BatchResult, extract_many, render_many
+
+
+class DescribeExtractMany(object):
+
+    def it_extracts_the_text_and_properties_of_many_files(self, tmpdir):
+        paths = []
+        for idx in range(3):
+            document = Document()
+            document.add_paragraph('doc %d' % idx)
+            document.core_properties.title = 'title %d' % idx
+            path = str(tmpdir.join('doc%d.docx' % idx))
+            document.save(path)
+            paths.append(path)
+        missing_path = str(tmpdir.join('missing.docx'))
+
+        results = list(
+            extract_many(paths + [missing_path], workers=2, chunksize=2)
+        )
+
+        assert all(isinstance(r, BatchResult) for r in results)
+        assert [r.index for r in results] == [0, 1, 2, 3]
+        assert [r.item for r in results] == paths + [missing_path]
+        assert [r.ok for r in results] == [True, True, True, False]
+        assert results[1].value['text'][-1] == 'doc 1'
+        assert results[1].value['core_properties']['title'] == 'title 1'
+        assert 'PackageNotFoundError' in results[3].error
+        assert results[3].value is None
+        assert all(r.seconds >= 0 for r in results)
+
+    def it_extracts_only_the_fields_asked_for(self, tmpdir):
+        document = Document()
+        document.add_paragraph('intro')
+        table = document.add_table(2, 3)
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(0, 0).text = 'merged'
+        table.cell(1, 2).text = 'last'
+        path = str(tmpdir.join('tables.docx'))
+        document.save(path)
+
+        results = list(extract_many([path], workers=1, fields=['tables']))
+
+        assert results[0].value == {
+            'tables': [[['merged', ''], ['', '', 'last']]]
+        }
+
+    def it_extracts_a_cell_merged_down_rows_in_each_row(self, tmpdir):
+        document = Document()
+        table = document.add_table(3, 2)
+        table.cell(0, 1).merge(table.cell(1, 1))
+        table.cell(0, 1).text = 'tall'
+        table.cell(2, 1).text = 'last'
+        path = str(tmpdir.join('tables.docx'))
+        document.save(path)
+
+        results = list(extract_many([path], workers=1, fields=['tables']))
+
+        assert results[0].value == {
+            'tables': [[['', 'tall'], ['', ''], ['', 'last']]]
+        }
+
+    def it_raises_on_an_unknown_field(self):
+        with pytest.raises(ValueError):
+            extract_many([], fields=('text', 'images'))
+
+    def it_is_available_from_the_package(self):
+        import docx
+        assert docx.extract_many is extract_many
+
+
+class DescribeRenderMany(object):
+
+    def it_renders_many_documents_from_a_template(self, template_blob,
+                                                  tmpdir):
+        path = str(tmpdir.join('out.docx'))
+        jobs = [(None, {'name': 'Ann'}), (path, {'name': 'Bob'}), (None, {})]
+
+        results = list(render_many(template_blob, jobs, workers=2))
+
+        assert [r.item for r in results] == [None, path, None]
+        assert [r.ok for r in results] == [True, True, False]
+        text = list(Document(BytesIO(results[0].value)).iter_text())
+        assert text[-1] == 'Dear Ann'
+        assert results[1].value == path
+        assert list(Document(path).iter_text())[-1] == 'Dear Bob'
+        assert 'KeyError' in results[2].error
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def template_blob(self):
+        document = Document()
+        document.add_paragraph('Dear {{ name }}')
+        stream = BytesIO()
+        document.save(stream)
+        return stream.getvalue()
@@ -9,13 +9,15 @@ from __future__ import absolute_import, print_function, unicode_literals
 import pytest
 
 from docx.blkcntnr import BlockItemContainer
+from docx.enum.style import WD_STYLE_TYPE
+from docx.parts.document import DocumentPart
 from docx.shared import Inches
-from docx.table import Table
+from docx.table import _Cell, Table
 from docx.text.paragraph import Paragraph
 
 from .unitutil.cxml import element, xml
 from .unitutil.file import snippet_seq
-from .unitutil.mock import call, instance_mock, method_mock
+from .unitutil.mock import call, instance_mock, method_mock, property_mock
 
 
 class DescribeBlockItemContainer(object):
@@ -31,6 +33,16 @@ class DescribeBlockItemContainer(object):
         assert new_paragraph.style == style
         assert new_paragraph is paragraph_
 
+    def it_can_add_many_paragraphs_at_once(self, add_paragraphs_fixture):
+        blkcntnr, items, expected_xml, part_ = add_paragraphs_fixture
+        paragraphs = blkcntnr.add_paragraphs(items)
+        assert blkcntnr._element.xml == expected_xml
+        assert [p._p for p in paragraphs] == blkcntnr._element.p_lst[-3:]
+        assert all(p._parent is blkcntnr for p in paragraphs)
+        assert part_.get_style_id.call_args_list == [
+            call('Foo Style', WD_STYLE_TYPE.PARAGRAPH)
+        ]
+
     def it_can_add_a_table(self, add_table_fixture):
         blkcntnr, rows, cols, width, expected_xml = add_table_fixture
         table = blkcntnr.add_table(rows, cols, width)
@@ -51,6 +63,35 @@ class DescribeBlockItemContainer(object):
             count += 1
         assert count == expected_count
 
+    def it_can_iterate_the_text_of_its_paragraphs(self, iter_text_fixture):
+        blkcntnr, expected_value = iter_text_fixture
+        assert list(blkcntnr.iter_text()) == expected_value
+
+    def it_can_search_the_text_of_its_paragraphs(self):
+        blkcntnr = BlockItemContainer(element(
+            'w:body/(w:p/(w:r/w:t"fo",w:r/w:t"o"),w:tbl/w:tr/w:tc/w:p/w:r/w:t'
+            '"foo",w:sectPr)'
+        ), None)
+        matches = blkcntnr.search('fo+')
+        assert [m.text for m in matches] == ['foo', 'foo']
+        assert matches[0].paragraph._parent is blkcntnr
+        cell = matches[1].paragraph._parent
+        assert isinstance(cell, _Cell)
+        assert isinstance(cell._parent, Table)
+        assert cell._parent._parent is blkcntnr
+
+    def it_can_replace_text_in_its_paragraphs(self):
+        blkcntnr = BlockItemContainer(element(
+            'w:body/(w:p/(w:r/w:t"fo",w:r/w:t"o!"),w:tbl/w:tr/w:tc/w:p/w:r/'
+            'w:t"foo")'
+        ), None)
+        count = blkcntnr.replace('foo', 'bar', regex=False)
+        assert count == 2
+        assert blkcntnr._element.xml == xml(
+            'w:body/(w:p/(w:r/w:t"bar",w:r/w:t"!"),w:tbl/w:tr/w:tc/w:p/w:r/'
+            'w:t"bar")'
+        )
+
     def it_provides_access_to_the_tables_it_contains(self, tables_fixture):
         # test len(), iterable, and indexed access
         blkcntnr, expected_count = tables_fixture
@@ -87,6 +128,24 @@ class DescribeBlockItemContainer(object):
         paragraph_.style = None
         return blkcntnr, text, style, paragraph_, add_run_calls
 
+    @pytest.fixture(params=[
+        ('w:body/w:sectPr',
+         'w:body/(w:p/w:r/w:t"foo",w:p/(w:pPr/w:pStyle{w:val=FooStyle},w:r/'
+         '(w:t"bar",w:tab)),w:p/w:pPr/w:pStyle{w:val=FooStyle},w:sectPr)'),
+        ('w:tc/(w:tcPr,w:p)',
+         'w:tc/(w:tcPr,w:p,w:p/w:r/w:t"foo",w:p/(w:pPr/w:pStyle{w:val=FooSty'
+         'le},w:r/(w:t"bar",w:tab)),w:p/w:pPr/w:pStyle{w:val=FooStyle})'),
+    ])
+    def add_paragraphs_fixture(self, request, document_part_):
+        blkcntnr_cxml, expected_cxml = request.param
+        blkcntnr = BlockItemContainer(element(blkcntnr_cxml), None)
+        property_mock(
+            request, BlockItemContainer, 'part', return_value=document_part_
+        )
+        document_part_.get_style_id.return_value = 'FooStyle'
+        items = ['foo', ('bar\t', 'Foo Style'), ('', 'Foo Style')]
+        return blkcntnr, items, xml(expected_cxml), document_part_
+
     @pytest.fixture
     def _add_paragraph_fixture(self, request):
         blkcntnr_cxml, after_cxml = 'w:body', 'w:body/w:p'
@@ -101,6 +160,18 @@ class DescribeBlockItemContainer(object):
         expected_xml = snippet_seq('new-tbl')[0]
         return blkcntnr, rows, cols, width, expected_xml
 
+    @pytest.fixture(params=[
+        ('w:body', []),
+        ('w:body/(w:p/w:r/w:t"foo",w:p,w:sectPr)', ['foo', '']),
+        ('w:body/(w:p/w:r/w:t"a",w:tbl/(w:tr/(w:tc/w:p/w:r/w:t"b",w:tc/(w:p/'
+         'w:r/w:t"c",w:tbl/w:tr/w:tc/w:p/w:r/w:t"d")),w:tr/w:tc/w:p),w:p/w:r'
+         '/w:t"e")', ['a', 'b', 'c', 'd', '', 'e']),
+    ])
+    def iter_text_fixture(self, request):
+        blkcntnr_cxml, expected_value = request.param
+        blkcntnr = BlockItemContainer(element(blkcntnr_cxml), None)
+        return blkcntnr, expected_value
+
     @pytest.fixture(params=[
         ('w:body',                 0),
         ('w:body/w:p',             1),
@@ -135,6 +206,10 @@ class DescribeBlockItemContainer(object):
     def add_run_(self, request):
         return method_mock(request, Paragraph, 'add_run')
 
+    @pytest.fixture
+    def document_part_(self, request):
+        return instance_mock(request, DocumentPart)
+
     @pytest.fixture
     def paragraph_(self, request):
         return instance_mock(request, Paragraph)
@@ -0,0 +1,327 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.composer module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from io import BytesIO
+
+import docx
+
+from docx.api import Document
+from docx.composer import Composer, compose
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.opc.part import XmlPart
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from .unitutil.file import test_file
+
+
+class DescribeCompose(object):
+
+    def it_appends_the_body_of_each_document_in_order(self):
+        blobs = [_docx_blob('first'), _docx_blob('second'), _docx_blob('3rd')]
+        document = compose(blobs)
+
+        body = document.element.body
+        assert [p.text for p in document.paragraphs] == [
+            'first', 'second', '3rd'
+        ]
+        assert body[-1].tag == qn('w:sectPr')
+        assert len(body.xpath('./w:sectPr')) == 1
+
+    def it_can_compose_into_a_given_document(self):
+        into = Document()
+        into.add_paragraph('into')
+        source = Document()
+        source.add_paragraph('source')
+
+        document = compose([source, _docx_blob('blob')], into=into)
+
+        assert document is into
+        assert [p.text for p in into.paragraphs] == ['into', 'source', 'blob']
+        assert [p.text for p in source.paragraphs] == ['source']
+
+    def it_raises_on_no_documents(self):
+        with pytest.raises(ValueError):
+            compose([])
+
+    def it_is_available_from_the_package(self):
+        assert docx.compose is compose
+
+
+class DescribeComposer(object):
+
+    def it_copies_the_styles_the_target_lacks(self):
+        source = Document()
+        styles = source.styles
+        base = styles.add_style('Base Custom', WD_STYLE_TYPE.PARAGRAPH)
+        custom = styles.add_style('Custom', WD_STYLE_TYPE.PARAGRAPH)
+        custom.base_style = base
+        source.add_paragraph('custom', style='Custom')
+        source.add_paragraph('heading', style='Heading 1')
+        target = Document()
+        style_count = len(target.styles)
+
+        Composer(target).append(source)
+
+        assert len(target.styles) == style_count + 2
+        assert [p.style.name for p in target.paragraphs] == [
+            'Custom', 'Heading 1'
+        ]
+        assert target.styles['Custom'].base_style.name == 'Base Custom'
+
+    def it_matches_a_style_by_name_when_its_id_differs(self):
+        source = Document()
+        style = source.styles.add_style('Custom', WD_STYLE_TYPE.PARAGRAPH)
+        style.element.styleId = 'SourceId'
+        source.add_paragraph('custom', style='Custom')
+        target = Document()
+        target.styles.add_style('Custom', WD_STYLE_TYPE.PARAGRAPH)
+
+        Composer(target).append(source)
+
+        assert target.paragraphs[0].style.style_id == 'Custom'
+
+    def it_dedupes_numbering_definitions_and_restarts_lists(self):
+        target = Document()
+        numbering = target.part.numbering_part.element
+        abstract_count = len(numbering.findall(qn('w:abstractNum')))
+        num_count = len(numbering.num_lst)
+        composer = Composer(target)
+
+        for _ in range(2):
+            composer.append(_numbered_document())
+
+        num_ids = [
+            int(numId) for numId in
+            target.element.body.xpath('.//w:numPr/w:numId/@w:val')
+        ]
+        assert len(numbering.findall(qn('w:abstractNum'))) == abstract_count
+        assert len(numbering.num_lst) == num_count + 2
+        assert num_ids[0] == num_ids[1] != num_ids[2] == num_ids[3]
+        for num_id in set(num_ids):
+            num = numbering.num_having_numId(num_id)
+            assert num.lvlOverride_lst[0].startOverride is not None
+
+    def it_creates_a_numbering_part_when_the_target_has_none(self):
+        target = Document()
+        document_part = target.part
+        rId = [
+            rel.rId for rel in document_part.rels.values()
+            if rel.target_part is document_part.numbering_part
+        ][0]
+        document_part.rels.pop(rId)
+        del document_part._numbering_part
+
+        Composer(target).append(_numbered_document())
+
+        numbering = document_part.numbering_part.element
+        assert len(numbering.findall(qn('w:abstractNum'))) == 1
+        assert len(numbering.num_lst) == 1
+        assert numbering.num_lst[0].lvlOverride_lst == []
+
+    def it_dedupes_images_and_renumbers_drawings(self):
+        source = Document()
+        source.add_picture(test_file('python-icon.png'))
+        source.add_picture(test_file('monty-truth.png'))
+        target = Document()
+        target.add_picture(test_file('python-icon.png'))
+        assert len(target.inline_shapes) == 1
+        composer = Composer(target)
+
+        composer.append(source)
+        composer.append(_docx_blob_of(source))
+
+        assert len(target.inline_shapes) == 5
+        body = target.element.body
+        docPr_ids = body.xpath('.//wp:docPr/@id')
+        image_parts = target.part.package.image_parts
+        assert len(image_parts) == 2
+        assert len(docPr_ids) == 5
+        assert len(set(docPr_ids)) == 5
+        assert set(
+            target.part.related_parts[rId].partname
+            for rId in body.xpath('.//a:blip/@r:embed')
+        ) == set(image_part.partname for image_part in image_parts)
+
+        stream = BytesIO()
+        target.save(stream)
+        assert len(Document(stream).inline_shapes) == 5
+
+    def it_copies_the_other_parts_the_content_references(self):
+        target, source = Document(), Document()
+        for document, text in ((target, 'target header'), (source, 'hdr')):
+            _add_header(document, text)
+
+        Composer(target).append(source)
+
+        stream = BytesIO()
+        target.save(stream)
+        document_part = Document(stream).part
+        headers = [
+            document_part.related_parts[rId] for rId in
+            document_part.element.xpath('.//w:headerReference/@r:id')
+        ]
+        assert [h.partname for h in headers] == [
+            '/word/header1.xml', '/word/header2.xml'
+        ]
+        assert b'>target header<' in headers[0].blob
+        assert b'>hdr<' in headers[1].blob
+
+    def it_reads_the_parts_it_copies_before_closing_a_source(self):
+        source = Document()
+        source.add_picture(test_file('monty-truth.png'))
+        _add_header(source, 'source header')
+        target = Document()
+
+        compose([_docx_blob_of(source)], into=target)
+
+        stream = BytesIO()
+        target.save(stream)
+        document = Document(stream)
+        assert len(document.inline_shapes) == 1
+        assert len(document.part.package.image_parts) == 1
+        header_rId = document.element.xpath('.//w:headerReference/@r:id')[0]
+        header_blob = document.part.related_parts[header_rId].blob
+        assert b'>source header<' in header_blob
+
+    def it_remaps_the_content_of_a_header_read_from_a_file(self):
+        source = Document()
+        source.styles.add_style('HdrOnly', WD_STYLE_TYPE.PARAGRAPH)
+        _add_header(source, 'hdr', style='HdrOnly')
+        target = Document()
+
+        compose([_docx_blob_of(source)], into=target)
+
+        assert target.styles['HdrOnly'].type == WD_STYLE_TYPE.PARAGRAPH
+        rId = target.element.xpath('.//w:headerReference/@r:id')[0]
+        header_part = target.part.related_parts[rId]
+        assert isinstance(header_part, XmlPart)
+        assert [
+            pStyle.get(qn('w:val'))
+            for pStyle in header_part.element.iter(qn('w:pStyle'))
+        ] == [target.styles['HdrOnly'].style_id]
+
+    def it_removes_the_references_to_notes_and_comments(self):
+        source = Document()
+        source.element.body.insert(0, parse_xml(
+            '<w:p %s><w:commentRangeStart w:id="0"/><w:r><w:t>a</w:t></w:r>'
+            '<w:commentRangeEnd w:id="0"/><w:r><w:commentReference w:id="0"/>'
+            '</w:r><w:r><w:footnoteReference w:id="1"/></w:r><w:r>'
+            '<w:endnoteReference w:id="1"/></w:r></w:p>' % nsdecls('w')
+        ))
+        target = Document()
+
+        Composer(target).append(source)
+
+        p = target.element.body[0]
+        assert p.xpath('.//w:t/text()') == ['a']
+        for tag in ('commentRangeStart', 'commentRangeEnd',
+                    'commentReference', 'footnoteReference',
+                    'endnoteReference'):
+            assert p.xpath('.//w:%s' % tag) == []
+
+    def it_offsets_the_bookmark_ids_of_each_document(self):
+        target = Document()
+        composer = Composer(target)
+
+        for _ in range(2):
+            source = Document()
+            source.element.body.insert(0, parse_xml(
+                '<w:p %s><w:bookmarkStart w:id="0" w:name="b"/>'
+                '<w:bookmarkEnd w:id="0"/></w:p>' % nsdecls('w')
+            ))
+            composer.append(source)
+
+        body = target.element.body
+        assert body.xpath('.//w:bookmarkStart/@w:id') == ['1', '2']
+        assert body.xpath('.//w:bookmarkEnd/@w:id') == ['1', '2']
+
+    def it_can_copy_a_related_part_of_another_document(self):
+        source, target = Document(), Document()
+        document_part = target.part
+        document_part.drop_rel([
+            rel.rId for rel in document_part.rels.values()
+            if rel.reltype == RT.SETTINGS
+        ][0])
+        composer = Composer(target)
+
+        composer.copy_related_part(source.part, RT.SETTINGS)
+        composer.copy_related_part(source.part, RT.COMMENTS)
+
+        settings_part = document_part.part_related_by(RT.SETTINGS)
+        source_settings_part = source.part.part_related_by(RT.SETTINGS)
+        assert settings_part is not source_settings_part
+        assert settings_part.package is document_part.package
+        assert settings_part.blob == source_settings_part.blob
+        with pytest.raises(KeyError):
+            document_part.part_related_by(RT.COMMENTS)
+
+    def it_closes_the_body_with_a_section_properties_element(self):
+        source, target = Document(), Document()
+        paragraph = source.add_paragraph('last')._p
+        sectPr = parse_xml(
+            '<w:sectPr %s><w:pgSz w:w="100" w:h="200"/></w:sectPr>' %
+            nsdecls('w')
+        )
+
+        Composer(target).append_elements(source.part, [paragraph, sectPr])
+
+        body = target.element.body
+        assert body[-2] is paragraph
+        assert body[-1] is sectPr
+        assert len(body.xpath('./w:sectPr')) == 1
+        assert target.sections[-1].page_width == 100 * 635
+
+
+# helpers ------------------------------------------------------------
+
+def _add_header(document, text, style=None):
+    pPr = '' if style is None else (
+        '<w:pPr><w:pStyle w:val="%s"/></w:pPr>' %
+        document.styles[style].style_id
+    )
+    header_part = XmlPart(
+        PackURI('/word/header1.xml'), CT.WML_HEADER, parse_xml(
+            '<w:hdr %s><w:p>%s<w:r><w:t>%s</w:t></w:r></w:p></w:hdr>' %
+            (nsdecls('w'), pPr, text)
+        ), document.part.package
+    )
+    rId = document.part.relate_to(header_part, RT.HEADER)
+    document.add_section()
+    document.element.body.xpath('.//w:pPr/w:sectPr')[0].append(parse_xml(
+        '<w:headerReference %s w:type="default" r:id="%s"/>' %
+        (nsdecls('w', 'r'), rId)
+    ))
+
+
+def _docx_blob(text):
+    document = Document()
+    document.add_paragraph(text)
+    return _docx_blob_of(document)
+
+
+def _docx_blob_of(document):
+    stream = BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+
+def _numbered_document():
+    document = Document()
+    for text in ('one', 'two'):
+        document.add_paragraph(text)._p.get_or_add_pPr().append(parse_xml(
+            '<w:numPr %s><w:ilvl w:val="0"/><w:numId w:val="1"/>'
+            '</w:numPr>' % nsdecls('w')
+        ))
+    return document
@@ -59,6 +59,14 @@ class DescribeDocument(object):
         document._body.add_paragraph.assert_called_once_with(text, style)
         assert paragraph is paragraph_
 
+    def it_can_add_many_paragraphs(self, body_prop_, paragraph_):
+        document = Document(None, None)
+        body_ = body_prop_.return_value
+        body_.add_paragraphs.return_value = [paragraph_]
+        paragraphs = document.add_paragraphs(['foo'])
+        body_.add_paragraphs.assert_called_once_with(['foo'])
+        assert paragraphs == [paragraph_]
+
     def it_can_add_a_picture(self, add_picture_fixture):
         document, path, width, height, run_, picture_ = add_picture_fixture
         picture = document.add_picture(path, width, height)
@@ -86,7 +94,28 @@ class DescribeDocument(object):
     def it_can_save_the_document_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._part.save.assert_called_once_with(file_)
+        document._part.save.assert_called_once_with(file_, None, None, None)
+
+    def it_can_save_the_document_to_chunks(self, save_fixture):
+        document, _ = save_fixture
+        chunks = document.iter_save_chunks()
+        document._part.iter_save_chunks.assert_called_once_with(None, None)
+        assert chunks is document._part.iter_save_chunks.return_value
+
+    def it_closes_its_package_on_leaving_a_with_block(self, document_part_):
+        with Document(None, document_part_) as document:
+            assert document_part_.package.close.call_count == 0
+        assert isinstance(document, Document)
+        document_part_.package.close.assert_called_once_with()
+
+    def it_can_clone_itself(self, document_part_):
+        document = Document(None, document_part_)
+        package_ = document_part_.package
+        clone = document.clone()
+        package_.clone.assert_called_once_with()
+        assert clone is (
+            package_.clone.return_value.main_document_part.document
+        )
 
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         document, core_properties_ = core_props_fixture
@@ -97,11 +126,32 @@ class DescribeDocument(object):
         document, inline_shapes_ = inline_shapes_fixture
         assert document.inline_shapes is inline_shapes_
 
+    def it_can_iterate_the_text_of_its_paragraphs(self, body_prop_):
+        document = Document(None, None)
+        body_prop_.return_value.iter_text.return_value = iter(['foo'])
+        assert list(document.iter_text()) == ['foo']
+
     def it_provides_access_to_its_paragraphs(self, paragraphs_fixture):
         document, paragraphs_ = paragraphs_fixture
         paragraphs = document.paragraphs
         assert paragraphs is paragraphs_
 
+    def it_can_search_its_text(self, body_prop_):
+        document = Document(None, None)
+        body_ = body_prop_.return_value
+        body_.search.return_value = ['match']
+        matches = document.search('foo', regex=False)
+        body_.search.assert_called_once_with('foo', False)
+        assert matches == ['match']
+
+    def it_can_replace_text(self, body_prop_):
+        document = Document(None, None)
+        body_ = body_prop_.return_value
+        body_.replace.return_value = 3
+        count = document.replace('foo', 'bar')
+        body_.replace.assert_called_once_with('foo', 'bar', True)
+        assert count == 3
+
     def it_provides_access_to_its_sections(self, sections_fixture):
         document, Sections_, sections_ = sections_fixture
         sections = document.sections
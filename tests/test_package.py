@@ -7,13 +7,17 @@ Test suite for docx.package module
 from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
+import shutil
+
+from io import BytesIO
+from zipfile import ZipFile
 
 from docx.image.image import Image
 from docx.opc.packuri import PackURI
 from docx.package import ImageParts, Package
 from docx.parts.image import ImagePart
 
-from .unitutil.file import docx_path
+from .unitutil.file import docx_path, test_file
 from .unitutil.mock import class_mock, instance_mock, method_mock
 
 
@@ -26,6 +30,141 @@ class DescribePackage(object):
         for image_part in image_parts:
             assert isinstance(image_part, ImagePart)
 
+    def it_reports_the_size_of_its_caches_and_parts(self):
+        package = Package.open(docx_path('having-images'))
+        stats = package.stats()
+        assert stats.caches['image_parts'] == 3
+        assert stats.caches['image_bytes'] == sum(
+            len(image_part.blob) for image_part in package.image_parts
+        )
+        part_stats = dict((p.partname, p) for p in stats.parts)
+        document_stats = part_stats['/word/document.xml']
+        assert 0 < document_stats.compressed_size < document_stats.size
+        assert document_stats.size == ZipFile(
+            docx_path('having-images')
+        ).getinfo('word/document.xml').file_size
+        serialized_stats = dict(
+            (p.partname, p) for p in package.stats(serialize=True).parts
+        )
+        assert serialized_stats['/word/document.xml'].size == len(
+            package.main_document_part.blob
+        )
+        assert document_stats.element_count > 0
+        assert document_stats.rel_count == len(
+            package.main_document_part.rels
+        )
+
+    def it_reports_its_sizes_without_loading_its_parts(self):
+        package = Package.open(docx_path('having-images'), lazy=True)
+        try:
+            stats = package.stats()
+            assert all(
+                '_read_blob' in part.__dict__
+                for part in package.iter_parts()
+            )
+            assert all(p.size for p in stats.parts)
+            assert stats.caches['image_bytes'] == 0
+        finally:
+            package.close()
+
+    def it_can_defer_loading_its_parts_until_needed(self):
+        package = Package.open(docx_path('having-images'), lazy=True)
+        image_part, image_part_2 = list(package.image_parts)[:2]
+        assert '_read_blob' in image_part.__dict__
+
+        blob = image_part.blob
+        package.close()
+
+        assert blob.startswith(b'\x89PNG') or blob.startswith(b'\xff\xd8')
+        assert image_part.blob is blob
+        with pytest.raises(ValueError):
+            image_part_2.blob
+
+    def it_passes_the_parts_a_profile_skips_through_on_save(self):
+        images = dict(
+            (p.partname, p.blob)
+            for p in Package.open(docx_path('having-images')).image_parts
+        )
+        package = Package.open(docx_path('having-images'), load='no-media')
+        assert len(package.image_parts) == 0
+
+        stream = BytesIO()
+        package.save(stream)
+
+        assert dict(
+            (p.partname, p.blob) for p in Package.open(stream).image_parts
+        ) == images
+
+    def it_gives_a_new_image_a_partname_not_used_by_a_skipped_one(self):
+        package = Package.open(docx_path('having-images'), load='no-media')
+        skipped = set(
+            p.partname for p in package.iter_parts()
+            if p.partname.startswith('/word/media/')
+        )
+        image_part = package.image_parts._add_image_part(
+            Image.from_file(test_file('python-icon.png'))
+        )
+        package.close()
+        assert skipped and image_part.partname not in skipped
+
+    def it_loads_deferred_parts_before_saving_over_its_file(self, tmpdir):
+        path = str(tmpdir.join('having-images.docx'))
+        shutil.copy(docx_path('having-images'), path)
+        blobs = [p.blob for p in Package.open(path).image_parts]
+
+        package = Package.open(path, lazy=True)
+        package.save(path)
+
+        assert [p.blob for p in Package.open(path).image_parts] == blobs
+
+    def it_can_clone_itself(self):
+        package = Package.open(docx_path('having-images'))
+        clone = package.clone()
+        document_part = package.main_document_part
+        clone_document_part = clone.main_document_part
+
+        assert type(clone) is Package
+        assert clone_document_part is not document_part
+        assert clone_document_part.package is clone
+        assert sorted(p.partname for p in clone.iter_parts()) == sorted(
+            p.partname for p in package.iter_parts()
+        )
+        assert dict(
+            (rId, rel.target_part.partname)
+            for rId, rel in clone_document_part.rels.items()
+            if not rel.is_external
+        ) == dict(
+            (rId, rel.target_part.partname)
+            for rId, rel in document_part.rels.items()
+            if not rel.is_external
+        )
+        image_parts = dict((p.partname, p) for p in package.image_parts)
+        assert len(clone.image_parts) == 3
+        for image_part in clone.image_parts:
+            assert image_part not in package.image_parts
+            assert image_part.blob is image_parts[image_part.partname].blob
+
+    def it_clones_its_xml_independently(self):
+        package = Package.open(docx_path('having-images'))
+        body = package.main_document_part.element.body
+        clone = package.clone()
+        clone_body = clone.main_document_part.element.body
+        count = len(body)
+
+        clone_body.remove(clone_body[0])
+
+        assert len(body) == count
+        assert len(clone_body) == count - 1
+
+    def it_loads_deferred_parts_before_cloning(self):
+        package = Package.open(docx_path('having-images'), lazy=True)
+        clone = package.clone()
+        package.close()
+        assert len(clone.image_parts) == 3
+        stream = BytesIO()
+        clone.save(stream)
+        assert len(Package.open(stream).image_parts) == 3
+
 
 class DescribeImageParts(object):
 
@@ -35,6 +35,14 @@ class DescribeSections(object):
         for index in indicies:
             assert isinstance(sections[index], Section)
 
+    def it_can_access_its_last_section(self, last_fixture):
+        sections, expected_sectPr = last_fixture
+        if expected_sectPr is None:
+            with pytest.raises(IndexError):
+                sections[-1]
+        else:
+            assert sections[-1]._sectPr is expected_sectPr
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -42,6 +50,23 @@ class DescribeSections(object):
         sections = Sections(document_elm)
         return sections, [0, 1]
 
+    @pytest.fixture(params=[
+        ('w:document/w:body/(w:p/w:pPr/w:sectPr, w:sectPr)', 1),
+        ('w:document/w:body/(w:p/w:pPr/w:sectPr, w:p)', 0),
+        ('w:document/w:body/w:p', None),
+        ('w:document/w:body', None),
+        ('w:document', None),
+    ])
+    def last_fixture(self, request):
+        cxml, sectPr_idx = request.param
+        document_elm = element(cxml)
+        sections = Sections(document_elm)
+        expected_sectPr = (
+            None if sectPr_idx is None
+            else document_elm.sectPr_lst[sectPr_idx]
+        )
+        return sections, expected_sectPr
+
     @pytest.fixture
     def iter_fixture(self, document_elm):
         sections = Sections(document_elm)
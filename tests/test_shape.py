@@ -53,6 +53,42 @@ class DescribeInlineShapes(object):
             too_high = inline_shape_count
             inline_shapes[too_high]
 
+    def it_finds_shapes_removed_since_it_last_looked(
+            self, inline_shapes_fixture):
+        inline_shapes, expected_count = inline_shapes_fixture
+        body = inline_shapes._body
+        assert len(inline_shapes) == expected_count
+        r = body[0][0]
+        r.getparent().remove(r)
+        assert len(inline_shapes) == expected_count - 1
+        assert [s._inline for s in inline_shapes] == body.inline_lst
+
+    def it_finds_shapes_added_since_it_last_looked(
+            self, inline_shapes_fixture):
+        inline_shapes, expected_count = inline_shapes_fixture
+        body = inline_shapes._body
+        assert len(inline_shapes) == expected_count
+        body.append(element('w:p/w:r/w:drawing/wp:inline'))
+        assert len(inline_shapes) == expected_count + 1
+        assert len(list(inline_shapes)) == expected_count + 1
+        assert inline_shapes[expected_count]._inline is body.inline_lst[-1]
+
+    def it_finds_the_shape_at_an_index_after_one_is_inserted_before_it(
+            self, inline_shapes_fixture):
+        inline_shapes, expected_count = inline_shapes_fixture
+        body = inline_shapes._body
+        assert len(inline_shapes) == expected_count
+        first = inline_shapes[0]._inline
+        body.insert(0, element('w:p/w:r/w:drawing/wp:inline'))
+        assert inline_shapes[0]._inline is body.inline_lst[0]
+        assert inline_shapes[1]._inline is first
+
+    def it_can_resize_all_its_pictures(self, resize_fixture):
+        inline_shapes, max_width, max_height, expected = resize_fixture
+        resized = inline_shapes.resize_all(max_width, max_height)
+        assert resized == expected[0]
+        assert [(s.width, s.height) for s in inline_shapes] == expected[1]
+
     def it_knows_the_part_it_belongs_to(self, inline_shapes_with_parent_):
         inline_shapes, parent_ = inline_shapes_with_parent_
         part = inline_shapes.part
@@ -69,6 +105,27 @@ class DescribeInlineShapes(object):
         expected_count = 2
         return inline_shapes, expected_count
 
+    @pytest.fixture(params=[
+        (None, None, (0, [(400, 200), (100, 300)])),
+        (200, None, (1, [(200, 100), (100, 300)])),
+        (None, 150, (2, [(300, 150), (50, 150)])),
+        (200, 50, (2, [(100, 50), (16, 50)])),
+    ])
+    def resize_fixture(self, request):
+        max_width, max_height, expected = request.param
+        pic_inline = (
+            'w:p/w:r/w:drawing/wp:inline/(wp:extent{cx=%d,cy=%d},a:graphic/'
+            'a:graphicData/pic:pic/(pic:blipFill/a:blip,pic:spPr/a:xfrm/'
+            'a:ext{cx=%d,cy=%d}))'
+        )
+        body = element('w:body/(%s,%s)' % (
+            pic_inline % (400, 200, 400, 200),
+            pic_inline % (100, 300, 100, 300),
+        ))
+        for graphicData in body.xpath('.//a:graphicData'):
+            graphicData.set('uri', nsmap['pic'])
+        return InlineShapes(body, None), max_width, max_height, expected
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,157 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.splitter module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from io import BytesIO
+
+import docx
+
+from docx.api import Document
+from docx.enum.section import WD_SECTION
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.shared import Inches
+from docx.splitter import split
+from docx.table import Table
+
+from .unitutil.file import test_file
+
+
+class DescribeSplit(object):
+
+    def it_splits_at_each_heading_1(self):
+        chunks = list(split(_docx_stream(_chapters_document())))
+
+        assert [_texts(chunk) for chunk in chunks] == [
+            ['preface'],
+            ['Chapter 1', 'text 1', ''],
+            ['Chapter 2', 'text 2'],
+        ]
+        assert chunks[1].paragraphs[0].style.name == 'Heading 1'
+        assert len(chunks[1].tables) == 1
+
+    def it_keeps_one_chunk_when_there_is_no_heading_1_style(self):
+        document = _chapters_document()
+        styles = document.styles.element
+        styles.remove(document.styles['Heading 1'].element)
+
+        chunks = list(split(_docx_stream(document)))
+
+        assert [_texts(chunk) for chunk in chunks] == [
+            ['preface', 'Chapter 1', 'text 1', '', 'Chapter 2', 'text 2']
+        ]
+
+    def it_splits_at_each_section_break(self):
+        document = Document()
+        for idx, width in enumerate((3, 4)):
+            document.add_paragraph('section %d' % idx)
+            document.sections[-1].page_width = Inches(width)
+            document.add_section(WD_SECTION.NEW_PAGE)
+        document.add_paragraph('last section')
+        document.sections[-1].page_width = Inches(5)
+
+        chunks = list(split(_docx_stream(document), by='section'))
+
+        assert [_texts(chunk) for chunk in chunks] == [
+            ['section 0', ''], ['section 1', ''], ['last section']
+        ]
+        assert [
+            [section.page_width for section in chunk.sections]
+            for chunk in chunks
+        ] == [[Inches(3)], [Inches(4)], [Inches(5)]]
+        for chunk in chunks:
+            assert chunk.element.body.xpath('.//w:pPr/w:sectPr') == []
+
+    def it_closes_each_chunk_with_the_section_it_ends_in(self):
+        document = _chapters_document()
+        document.sections[-1].page_width = Inches(7)
+
+        chunks = list(split(_docx_stream(document)))
+
+        assert [chunk.sections[-1].page_width for chunk in chunks] == [
+            Inches(7)
+        ] * 3
+
+    def it_can_split_by_a_predicate(self):
+        starts = []
+
+        def starts_chunk(block):
+            starts.append(block)
+            return isinstance(block, Table)
+
+        chunks = list(split(_docx_stream(_chapters_document()), starts_chunk))
+
+        assert [_texts(chunk) for chunk in chunks] == [
+            ['preface', 'Chapter 1', 'text 1'], ['', 'Chapter 2', 'text 2']
+        ]
+        assert len(starts) == 6
+
+    def it_copies_only_what_each_chunk_references(self):
+        document = _chapters_document()
+        document.paragraphs[-1].add_run().add_picture(
+            test_file('monty-truth.png')
+        )
+        source_styles = len(document.styles)
+
+        chunks = list(split(_docx_stream(document)))
+
+        assert [len(chunk.part.package.image_parts) for chunk in chunks] == [
+            0, 0, 1
+        ]
+        assert chunks[0].styles['Custom'].type == WD_STYLE_TYPE.PARAGRAPH
+        with pytest.raises(KeyError):
+            chunks[1].styles['Custom']
+        assert max(len(chunk.styles) for chunk in chunks) < source_styles
+        for chunk in chunks:
+            for reltype in (RT.SETTINGS, RT.THEME, RT.FONT_TABLE):
+                chunk.part.part_related_by(reltype)
+            assert chunk.core_properties.title == 'Chapters'
+
+    def it_produces_chunks_that_outlive_the_source(self):
+        chunks = list(split(_docx_stream(_chapters_document())))
+
+        for chunk in chunks:
+            stream = _docx_stream(chunk)
+            assert _texts(Document(stream)) == _texts(chunk)
+
+    def it_raises_on_an_unknown_split(self):
+        with pytest.raises(ValueError):
+            split(_docx_stream(Document()), by='chapter')
+
+    def it_is_available_from_the_package(self):
+        assert docx.split is split
+
+
+# helpers ------------------------------------------------------------
+
+def _chapters_document():
+    document = Document()
+    document.core_properties.title = 'Chapters'
+    document.styles.add_style('Custom', WD_STYLE_TYPE.PARAGRAPH)
+    document.add_paragraph('preface', style='Custom')
+    for idx in (1, 2):
+        document.add_heading('Chapter %d' % idx, level=1)
+        document.add_paragraph('text %d' % idx)
+        if idx == 1:
+            document.add_table(1, 1)
+            document.add_paragraph()
+    return document
+
+
+def _docx_stream(document):
+    stream = BytesIO()
+    document.save(stream)
+    stream.seek(0)
+    return stream
+
+
+def _texts(document):
+    return [p.text for p in document.paragraphs]
@@ -0,0 +1,127 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.template module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from io import BytesIO
+from zipfile import ZIP_STORED, ZipFile
+
+from docx.api import Document
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.opc.part import XmlPart
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.template import Template
+
+
+class DescribeTemplate(object):
+
+    def it_knows_its_placeholders(self, template):
+        assert template.placeholders == ['name', 'amount', 'date', 'name']
+
+    def it_renders_a_docx_package(self, template):
+        blob = template.render(
+            {'name': 'Ann & Bob', 'amount': '1\t2\n3', 'date': 42}
+        )
+
+        document = Document(BytesIO(blob))
+        assert [p.text for p in document.paragraphs] == [
+            'Dear Ann & Bob,', 'Total:\t1\t2\n3 due 42', 'Yours, Ann & Bob'
+        ]
+        runs = document.paragraphs[0].runs
+        assert [r.text for r in runs] == ['Dear Ann & Bob', ',']
+        assert [r.bold for r in runs] == [None, True]
+
+    def it_reuses_the_parts_without_placeholders(self, template):
+        context = {'name': 'x', 'amount': 'y', 'date': 'z'}
+        first, second = (
+            ZipFile(BytesIO(template.render(context))) for _ in range(2)
+        )
+        assert first.namelist() == second.namelist()
+        assert (
+            first.read('word/styles.xml') == second.read('word/styles.xml')
+        )
+        assert b'{{' not in first.read('word/document.xml')
+
+    def it_renders_the_placeholders_of_a_header(self):
+        document = Document()
+        document.add_paragraph('Dear {{name}}')
+        header_part = XmlPart(
+            PackURI('/word/header1.xml'), CT.WML_HEADER, parse_xml(
+                '<w:hdr %s><w:p><w:r><w:t>Ref {{ref}}</w:t></w:r></w:p>'
+                '</w:hdr>' % nsdecls('w')
+            ), document.part.package
+        )
+        document.part.relate_to(header_part, RT.HEADER)
+        stream = BytesIO()
+        document.save(stream)
+        stream.seek(0)
+        template = Template(stream)
+
+        blob = template.render({'name': 'Ann', 'ref': 'A&1'})
+
+        assert template.placeholders == ['name', 'ref']
+        header_xml = ZipFile(BytesIO(blob)).read('word/header1.xml')
+        assert b'>Ref A&amp;1<' in header_xml
+
+    def it_raises_on_a_missing_value(self, template):
+        with pytest.raises(KeyError):
+            template.render({'name': 'x'})
+
+    def it_raises_on_a_value_xml_does_not_allow(self, template):
+        with pytest.raises(ValueError):
+            template.render({'name': 'x\x01', 'amount': 'y', 'date': 'z'})
+
+    def it_renders_the_placeholders_of_a_hyperlink(self):
+        document = Document()
+        paragraph = document.add_paragraph('See ')
+        paragraph._p.append(parse_xml(
+            '<w:hyperlink %s><w:r><w:t>{{ li</w:t></w:r><w:r><w:t>nk }}'
+            '</w:t></w:r></w:hyperlink>' % nsdecls('w')
+        ))
+        stream = BytesIO()
+        document.save(stream)
+        stream.seek(0)
+        template = Template(stream)
+
+        blob = template.render({'link': 'here'})
+
+        assert template.placeholders == ['link']
+        document_xml = ZipFile(BytesIO(blob)).read('word/document.xml')
+        assert b'>here<' in document_xml
+        assert b'{{' not in document_xml
+
+    def it_stores_its_members_at_compress_level_0(self):
+        document = Document()
+        document.add_paragraph('Dear {{name}}')
+        stream = BytesIO()
+        document.save(stream)
+        stream.seek(0)
+        template = Template(stream, compress_level=0)
+
+        blob = template.render({'name': 'Ann'})
+
+        infos = ZipFile(BytesIO(blob)).infolist()
+        assert set(info.compress_type for info in infos) == {ZIP_STORED}
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def template(self):
+        document = Document()
+        paragraph = document.add_paragraph('Dear {{ na')
+        paragraph.add_run('me }},').bold = True
+        document.add_paragraph('Total:\t{{amount}} due {{date}}')
+        document.add_paragraph('Yours, {{name}}')
+        stream = BytesIO()
+        document.save(stream)
+        stream.seek(0)
+        return Template(stream)
@@ -63,6 +63,14 @@ class DescribeParagraph(object):
         paragraph.alignment = value
         assert paragraph._p.xml == expected_xml
 
+    def it_provides_access_to_its_effective_format(
+            self, part_prop_, document_part_):
+        paragraph = Paragraph(element('w:p'), None)
+        resolver_ = document_part_.format_resolver
+        effective_format = paragraph.effective_format
+        resolver_.paragraph_format.assert_called_once_with(paragraph._p)
+        assert effective_format is resolver_.paragraph_format.return_value
+
     def it_provides_access_to_its_paragraph_format(self, parfmt_fixture):
         paragraph, ParagraphFormat_, paragraph_format_ = parfmt_fixture
         paragraph_format = paragraph.paragraph_format
@@ -235,6 +243,9 @@ class DescribeParagraph(object):
         ('w:p/w:r/(w:t"foo", w:tab, w:t"bar")', 'foo\tbar'),
         ('w:p/w:r/(w:t"foo", w:br,  w:t"bar")', 'foo\nbar'),
         ('w:p/w:r/(w:t"foo", w:cr,  w:t"bar")', 'foo\nbar'),
+        ('w:p/(w:pPr/w:tabs/w:tab,w:r/w:t"foo",w:r/(w:rPr,w:tab,w:t"bar"))',
+         'foo\tbar'),
+        ('w:p/(w:r/w:t"foo",w:hyperlink/w:r/w:t"bar",w:r/w:br)', 'foo\n'),
     ])
     def text_get_fixture(self, request):
         p_cxml, expected_text_value = request.param
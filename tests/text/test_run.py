@@ -63,6 +63,14 @@ class DescribeRun(object):
         with pytest.raises(ValueError):
             run.underline = underline
 
+    def it_provides_access_to_its_effective_font(
+            self, part_prop_, document_part_):
+        run = Run(element('w:r'), None)
+        resolver_ = document_part_.format_resolver
+        effective_font = run.effective_font
+        resolver_.font.assert_called_once_with(run._r)
+        assert effective_font is resolver_.font.return_value
+
     def it_provides_access_to_its_font(self, font_fixture):
         run, Font_, font_ = font_fixture
         font = run.font
@@ -266,6 +274,9 @@ class DescribeRun(object):
         ('abc\tdef', 'w:r/(w:t"abc", w:tab, w:t"def")'),
         ('abc\ndef', 'w:r/(w:t"abc", w:br,  w:t"def")'),
         ('abc\rdef', 'w:r/(w:t"abc", w:br,  w:t"def")'),
+        ('\t abc\r\n\n', 'w:r/(w:tab, w:t{xml:space=preserve}" abc", w:br,'
+                         ' w:br, w:br)'),
+        ('', 'w:r'),
     ])
     def text_set_fixture(self, request):
         new_text, expected_cxml = request.param
@@ -0,0 +1,114 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.text.search module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import re
+
+import pytest
+
+from docx.text.search import iter_matches, replace, TextMatch
+
+from ..unitutil.cxml import element, xml
+
+
+class DescribeIterMatches(object):
+
+    def it_finds_text_spanning_runs(self):
+        p = element(
+            'w:p/(w:r/w:t"Invoice Nu",w:r/(w:rPr/w:b,w:t"mb"),w:r/w:t"er: 42")'
+        )
+        parent = object()
+
+        matches = list(iter_matches([(p, parent)], 'Invoice Number'))
+
+        assert len(matches) == 1
+        match = matches[0]
+        assert isinstance(match, TextMatch)
+        assert (match.start, match.end) == (0, 14)
+        assert match.text == 'Invoice Number'
+        assert match.paragraph._p is p
+        assert match.paragraph._parent is parent
+        assert [(run._r, start, end) for run, start, end in match.spans] == [
+            (p.r_lst[0], 0, 10), (p.r_lst[1], 0, 2), (p.r_lst[2], 0, 2),
+        ]
+        assert all(run._parent is match.paragraph for run, _, _ in match.spans)
+
+    @pytest.fixture(params=[
+        ('a.c',           True,  ['abc', 'a.c']),
+        ('a.c',           False, ['a.c']),
+        (re.compile('B'), True,  []),
+        (re.compile('b', re.I), True, ['b']),
+        (re.compile('a.c'), False, ['abc', 'a.c']),
+    ])
+    def pattern_fixture(self, request):
+        return request.param
+
+    def it_matches_regex_or_literal_patterns(self, pattern_fixture):
+        pattern, regex, expected_texts = pattern_fixture
+        p = element('w:p/(w:r/w:t"ab",w:r/w:t"c a.c")')
+        matches = iter_matches([(p, None)], pattern, regex)
+        assert [m.text for m in matches] == expected_texts
+
+    def it_skips_empty_matches(self):
+        p = element('w:p/(w:r/w:t"fo",w:r/w:t"xxo")')
+        matches = list(iter_matches([(p, None)], 'x*'))
+        assert [m.text for m in matches] == ['xx']
+        assert all(m.spans for m in matches)
+
+
+class DescribeReplace(object):
+
+    def it_replaces_text_within_a_run(self):
+        p = element('w:p/(w:r/w:t"foo bar foo",w:r/w:t" baz")')
+        count = replace([(p, None)], 'foo', 'qux')
+        assert count == 2
+        assert p.xml == xml('w:p/(w:r/w:t"qux bar qux",w:r/w:t" baz")')
+
+    def it_keeps_the_formatting_of_the_first_run(self):
+        p = element(
+            'w:p/(w:r/(w:rPr/w:i,w:t"Dear Mr. "),w:r/(w:rPr/w:b,w:t"Sm"),'
+            'w:r/w:t"ith, hello",w:r/w:t"!")'
+        )
+        count = replace([(p, None)], 'Mr. Smith', 'Ms. Jones', regex=False)
+        assert count == 1
+        assert p.xml == xml(
+            'w:p/(w:r/(w:rPr/w:i,w:t"Dear Ms. Jones"),w:r/w:t", hello",'
+            'w:r/w:t"!")'
+        )
+
+    def it_applies_every_replacement_in_a_paragraph_in_one_pass(self):
+        p = element('w:p/(w:r/w:t"x1 x",w:r/w:t"2 x3")')
+        count = replace([(p, None)], r'x(\d)', r'[\1]')
+        assert count == 3
+        assert p.xml == xml(
+            'w:p/(w:r/w:t"[1] [2]",w:r/w:t{xml:space=preserve}" [3]")'
+        )
+
+    def it_accepts_a_function_as_the_replacement(self):
+        p = element('w:p/w:r/w:t"a b"')
+        replace([(p, None)], r'\w', lambda match: match.group().upper())
+        assert p.xml == xml('w:p/w:r/w:t"A B"')
+
+    def it_keeps_the_non_text_content_of_the_runs_it_changes(self):
+        p = element(
+            'w:p/(w:r/(w:t"Dear ",w:drawing,w:t"Mr. "),'
+            'w:r/(w:fldChar,w:t"Smith"),w:r/w:t"!")'
+        )
+        count = replace([(p, None)], 'Mr. Smith', 'Ms. Jones', regex=False)
+        assert count == 1
+        assert p.xml == xml(
+            'w:p/(w:r/(w:t"Dear ",w:drawing,'
+            'w:t"Ms. Jones"),w:r/w:fldChar,w:r/w:t"!")'
+        )
+
+    def it_leaves_paragraphs_without_a_match_unchanged(self):
+        p = element('w:p/(w:r/w:t"foo",w:r/w:t"bar")')
+        p_xml = p.xml
+        assert replace([(p, None)], 'x*', 'y') == 0
+        assert p.xml == p_xml